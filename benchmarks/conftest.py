@@ -0,0 +1,117 @@
+"""Fixtures for the Sunshine Scooter benchmarks."""
+from __future__ import annotations
+
+from collections.abc import Coroutine
+import copy
+from pathlib import Path
+import sys
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry  # noqa: E402
+
+from custom_components.sunshine.api import SunshineAPI  # noqa: E402
+from custom_components.sunshine.const import DOMAIN  # noqa: E402
+from custom_components.sunshine.coordinator import SunshineDataUpdateCoordinator  # noqa: E402
+
+FLEET_SIZES = (1, 50, 1000)
+
+STATES = ("parked", "stand-by", "locked", "ready-to-drive", "hibernating")
+
+
+def make_scooter(index: int) -> dict[str, Any]:
+    """Return a synthetic scooter record shaped like a /scooters entry."""
+    return {
+        "id": f"scooter-{index:05d}",
+        "vin": f"WUNU{index:013d}",
+        "name": f"Scooter {index}",
+        "color": ("black", "white", "red", "blue")[index % 4],
+        "model": {"full_name": "unu Scooter Pro", "model_name": "pro"},
+        "radio_gaga_version": "1.4.2",
+        "state": STATES[index % len(STATES)],
+        "online": index % 7 != 0,
+        "speed": (index * 3) % 45,
+        "odometer": 1_000_000 + index * 137,
+        "kickstand": "down",
+        "seatbox": "closed",
+        "blinkers": "off",
+        "alarm_state": "armed",
+        "alarm_state_humanized": "Armed",
+        "alarm_triggered": False,
+        "last_seen_at": "2026-10-18T08:30:00+00:00",
+        "location": {"lat": 52.5 + index * 1e-4, "lng": 13.4 + index * 1e-4},
+        "location_accuracy": 8,
+        "batteries": {
+            "battery0": {"level": 80, "voltage": 52.1, "soh": 97, "cycle_count": 120, "state": "idle"},
+            "battery1": {"level": 65, "voltage": 51.4, "soh": 95, "cycle_count": 98, "state": "idle"},
+            "aux": {"level": 90, "voltage": 12.6},
+            "cbb": {"level": 88, "soh": 99, "cycle_count": 40},
+        },
+        "telemetry": {
+            "engine": {"temperature": 31, "motor_rpm": 0, "speed": 0},
+            "connectivity": {"signal_quality": 72},
+        },
+    }
+
+
+def make_payload(count: int) -> list[dict[str, Any]]:
+    """Return a synthetic /scooters payload."""
+    return [make_scooter(index) for index in range(count)]
+
+
+class PayloadAPI(SunshineAPI):
+    """API client answering polls from prepared payloads instead of the network.
+
+    Two equal but distinct copies alternate, like consecutive polls of a
+    fleet with nothing changed, so every poll compares full payloads.
+    """
+
+    def __init__(self, payload: list[dict[str, Any]]) -> None:
+        """Initialize the client."""
+        super().__init__("token", "https://sunshine.invalid", None)
+        self._payloads = [payload, copy.deepcopy(payload)]
+        self._polls = 0
+
+    async def get_scooters(self, fields: Any = None) -> list[dict[str, Any]]:
+        """Return the next prepared payload."""
+        self._polls += 1
+        return self._payloads[self._polls % 2]
+
+
+def run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine that never suspends to completion, inside the current task."""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError("Coroutine suspended, it cannot be benchmarked synchronously")
+
+
+@pytest.fixture(params=FLEET_SIZES, ids=lambda size: f"{size}_scooters")
+def fleet_size(request: pytest.FixtureRequest) -> int:
+    """Return the number of scooters in the synthetic fleet."""
+    return request.param
+
+
+@pytest.fixture
+def payload(fleet_size: int) -> list[dict[str, Any]]:
+    """Return a synthetic /scooters payload."""
+    return make_payload(fleet_size)
+
+
+@pytest.fixture
+async def coordinator(hass, payload: list[dict[str, Any]]) -> SunshineDataUpdateCoordinator:
+    """Return a coordinator holding the synthetic fleet."""
+    entry = MockConfigEntry(domain=DOMAIN, data={"token": "token"})
+    entry.add_to_hass(hass)
+    coordinator = SunshineDataUpdateCoordinator(hass, entry, PayloadAPI(payload))
+    # A copy of its own, so every poll compares against equal but distinct records
+    coordinator.data = copy.deepcopy(run_sync(coordinator._async_update_data()))
+    return coordinator
@@ -0,0 +1,101 @@
+"""Benchmarks of the Sunshine Scooter coordinator and entity hot paths."""
+from __future__ import annotations
+
+import json
+import tracemalloc
+from typing import Any
+
+import pytest
+
+from custom_components.sunshine.api import json_loads
+from custom_components.sunshine.coordinator import SunshineDataUpdateCoordinator
+from custom_components.sunshine.device_tracker import SunshineDeviceTracker
+from custom_components.sunshine.entity import SunshineEntity
+from custom_components.sunshine.sensor import SENSOR_TYPES
+
+from conftest import run_sync
+
+# The coordinator leaves its throttled snapshot write scheduled
+pytestmark = pytest.mark.parametrize("expected_lingering_timers", [True])
+
+
+async def test_update_data(benchmark, coordinator: SunshineDataUpdateCoordinator) -> None:
+    """Build the coordinator data from a polled payload."""
+    result = benchmark(lambda: run_sync(coordinator._async_update_data()))
+    assert len(result) == len(coordinator.data)
+
+
+async def test_sensor_values(benchmark, coordinator: SunshineDataUpdateCoordinator) -> None:
+    """Evaluate every sensor value function of every scooter once."""
+    scooters = list(coordinator.data.values())
+    value_fns = [description.value_fn for description in SENSOR_TYPES if description.value_fn]
+
+    def evaluate() -> int:
+        count = 0
+        for scooter in scooters:
+            for value_fn in value_fns:
+                value_fn(scooter)
+                count += 1
+        return count
+
+    assert benchmark(evaluate) == len(scooters) * len(value_fns)
+
+
+async def test_device_tracker_properties(
+    benchmark, coordinator: SunshineDataUpdateCoordinator
+) -> None:
+    """Evaluate the state properties of every device tracker."""
+    trackers = [
+        SunshineDeviceTracker(coordinator.api, coordinator, scooter_id)
+        for scooter_id in coordinator.data
+    ]
+
+    def evaluate() -> None:
+        for tracker in trackers:
+            tracker.latitude
+            tracker.longitude
+            tracker.battery_level
+            tracker.location_accuracy
+            tracker.entity_picture
+
+    benchmark(evaluate)
+
+
+async def test_device_info(benchmark, coordinator: SunshineDataUpdateCoordinator) -> None:
+    """Build the device info of every scooter."""
+    entities = [SunshineEntity(coordinator, scooter_id) for scooter_id in coordinator.data]
+    benchmark(lambda: [entity.device_info for entity in entities])
+
+
+@pytest.mark.parametrize("decoder", ["json", "fast"])
+async def test_decode(benchmark, payload: list[dict[str, Any]], decoder: str) -> None:
+    """Decode a /scooters body with the standard library and with the fast path."""
+    body = json.dumps(payload).encode()
+    loads = json.loads if decoder == "json" else json_loads
+    benchmark.extra_info["payload_bytes"] = len(body)
+    assert len(benchmark(loads, body)) == len(payload)
+
+
+async def test_payload_memory(
+    benchmark, coordinator: SunshineDataUpdateCoordinator, payload: list[dict[str, Any]]
+) -> None:
+    """Decode a payload and build the coordinator data, recording peak memory."""
+    body = json.dumps(payload)
+    api = coordinator.api
+
+    async def get_scooters(fields: Any = None) -> list[dict[str, Any]]:
+        return json.loads(body)
+
+    api.get_scooters = get_scooters
+
+    tracemalloc.start()
+    try:
+        run_sync(coordinator._async_update_data())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    benchmark.extra_info["payload_bytes"] = len(body)
+    benchmark.extra_info["peak_bytes"] = peak
+    benchmark.extra_info["peak_bytes_per_scooter"] = peak // len(payload)
+    benchmark(lambda: run_sync(coordinator._async_update_data()))
@@ -1,28 +1,46 @@
 """The Sunshine Scooter integration."""
 from __future__ import annotations
 
+from functools import partial
 import logging
 from typing import Any
 
-import voluptuous as vol
-
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_ENTITY_ID, Platform
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers import config_validation as cv
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_change, async_track_time_interval
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
 from .api import SunshineAPI
+from .backfill import StatisticsBackfill
 from .const import (
-    ATTR_ADDRESS,
-    ATTR_DURATION,
-    ATTR_LATITUDE,
-    ATTR_LONGITUDE,
+    CONF_DEDICATED_SESSION,
     DEFAULT_BASE_URL,
+    DEFAULT_DEDICATED_SESSION,
     DOMAIN,
 )
-from .coordinator import SunshineDataUpdateCoordinator
+from .coordinator import SNAPSHOT_STORAGE_KEY, SNAPSHOT_VERSION, SunshineDataUpdateCoordinator
+from .geofence import (
+    STORAGE_KEY as GEOFENCE_STORAGE_KEY,
+    STORAGE_VERSION as GEOFENCE_STORAGE_VERSION,
+    GeofenceManager,
+)
+from .projection import async_track_fields
+from .ratelimit import async_acquire_scheduler, async_release_scheduler
+from .services import async_setup_services, async_unload_services
+from .session import async_acquire_session, async_release_session
+from .trip_stats import PERIOD_MONTH, PERIOD_WEEK, TripStatistics, period_start
+from .trips import (
+    LEGACY_TRIP_DB_FILE,
+    TRIP_DB_FILE,
+    TRIP_SYNC_INTERVAL,
+    TripStore,
+    TripSyncer,
+    adopt_legacy_db,
+    remove_db,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,100 +58,105 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Sunshine from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
-    session = async_get_clientsession(hass)
+    base_url = entry.data.get("base_url", DEFAULT_BASE_URL).rstrip("/")
+    dedicated = None
+    if entry.options.get(CONF_DEDICATED_SESSION, DEFAULT_DEDICATED_SESSION):
+        dedicated = async_acquire_session(hass, base_url)
+        session = dedicated.session
+
+        async def _async_release_session() -> None:
+            """Close the dedicated session once no entry uses it."""
+            await async_release_session(hass, base_url)
+
+        entry.async_on_unload(_async_release_session)
+    else:
+        session = async_get_clientsession(hass)
+    # Shared with every other config entry talking to the same backend
+    scheduler = async_acquire_scheduler(hass, base_url)
+    entry.async_on_unload(partial(async_release_scheduler, hass, base_url))
     api = SunshineAPI(
         entry.data["token"],
-        entry.data.get("base_url", DEFAULT_BASE_URL),
-        session
+        base_url,
+        session,
+        scheduler,
+        # Command workers are cancelled with the entry's other background tasks
+        partial(entry.async_create_background_task, hass),
     )
 
-    try:
-        await api.test_authentication()
-    except Exception as err:
-        raise ConfigEntryAuthFailed from err
-
     coordinator = SunshineDataUpdateCoordinator(hass, entry, api)
-    await coordinator.async_config_entry_first_refresh()
+    if restored := await coordinator.async_load_snapshot():
+        # Entities come up from the last known fleet, the cloud is asked later
+        _LOGGER.debug("Starting from the stored fleet snapshot")
+    else:
+        # Authentication failures surface as ConfigEntryAuthFailed from here
+        await coordinator.async_config_entry_first_refresh()
+    # Later polls only ask for the fields enabled entities read
+    entry.async_on_unload(async_track_fields(hass, coordinator))
+
+    trip_db = hass.config.path(TRIP_DB_FILE.format(entry_id=entry.entry_id))
+    if len(hass.config_entries.async_entries(DOMAIN)) == 1:
+        # A single entry keeps the trips it synced into the shared database
+        await hass.async_add_executor_job(
+            adopt_legacy_db, hass.config.path(LEGACY_TRIP_DB_FILE), trip_db
+        )
+    trip_store = TripStore(trip_db)
+    trip_syncer = TripSyncer(hass, api, trip_store)
+    trip_stats = TripStatistics()
+    backfill = StatisticsBackfill(hass, trip_store)
+    geofences = GeofenceManager(hass, coordinator)
+    await geofences.async_load()
 
     hass.data[DOMAIN][entry.entry_id] = {
         "api": api,
         "coordinator": coordinator,
+        "trip_syncer": trip_syncer,
+        "trip_stats": trip_stats,
+        "backfill": backfill,
+        "geofences": geofences,
+        "session": dedicated,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Register services
-    async def handle_trigger_alarm(call: ServiceCall) -> None:
-        """Handle trigger alarm service call."""
-        entity_id = call.data[ATTR_ENTITY_ID][0]
-        duration = call.data[ATTR_DURATION]
-        scooter_id = entity_id.split(".")[-1].replace("_lock", "")
-        await api.trigger_alarm(scooter_id, duration)
-        await coordinator.async_request_refresh()
-        coordinator.async_request_delayed_refresh()
-
-    async def handle_get_state(call: ServiceCall) -> None:
-        """Handle get state / request telemetry service call."""
-        entity_id = call.data[ATTR_ENTITY_ID][0]
-        scooter_id = entity_id.split(".")[-1].replace("_lock", "")
-        await api.get_state(scooter_id)
-        await coordinator.async_request_refresh()
-        coordinator.async_request_delayed_refresh()
-
-    async def handle_set_destination(call: ServiceCall) -> None:
-        """Handle set destination service call."""
-        entity_id = call.data[ATTR_ENTITY_ID][0]
-        scooter_id = entity_id.split(".")[-1].replace("_lock", "")
-        lat = call.data[ATTR_LATITUDE]
-        lng = call.data[ATTR_LONGITUDE]
-        address = call.data.get(ATTR_ADDRESS, "")
-        await api.set_destination(scooter_id, lat, lng, address)
-
-    async def handle_clear_destination(call: ServiceCall) -> None:
-        """Handle clear destination service call."""
-        entity_id = call.data[ATTR_ENTITY_ID][0]
-        scooter_id = entity_id.split(".")[-1].replace("_lock", "")
-        await api.clear_destination(scooter_id)
-
-    hass.services.async_register(
-        DOMAIN,
-        "trigger_alarm",
-        handle_trigger_alarm,
-        schema=vol.Schema({
-            vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
-            vol.Required(ATTR_DURATION): cv.string,
-        }),
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        "get_state",
-        handle_get_state,
-        schema=vol.Schema({
-            vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
-        }),
+    if restored:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+        )
+    coordinator.async_start_stream()
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(geofences.async_start())
+
+    async def _async_sync_trips(_now=None) -> None:
+        """Sync new trips of all scooters into the local store."""
+        await trip_syncer.async_sync(list(coordinator.data or {}))
+
+    async def _async_start_trips() -> None:
+        """Seed the running trip statistics from the store, then sync."""
+        now = dt_util.now()
+        since = min(period_start(PERIOD_WEEK, now), period_start(PERIOD_MONTH, now))
+        for scooter_id in coordinator.data or {}:
+            trips = await hass.async_add_executor_job(trip_store.trips_since, scooter_id, since)
+            trip_stats.async_add_trips(scooter_id, trips)
+        entry.async_on_unload(trip_syncer.async_add_listener(trip_stats.async_add_trips))
+        await _async_sync_trips()
+
+    async def _async_close_trip_store() -> None:
+        """Close the trip database."""
+        await hass.async_add_executor_job(trip_store.close)
+
+    entry.async_on_unload(async_track_time_interval(hass, _async_sync_trips, TRIP_SYNC_INTERVAL))
+    entry.async_on_unload(_async_close_trip_store)
+    @callback
+    def _async_roll_over_trip_stats(_now) -> None:
+        """Let trip statistics sensors start a new period."""
+        trip_stats.async_notify()
+
+    entry.async_on_unload(
+        async_track_time_change(hass, _async_roll_over_trip_stats, hour=0, minute=0, second=0)
     )
+    entry.async_create_background_task(hass, _async_start_trips(), f"{DOMAIN} trip sync")
 
-    hass.services.async_register(
-        DOMAIN,
-        "set_destination",
-        handle_set_destination,
-        schema=vol.Schema({
-            vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
-            vol.Required(ATTR_LATITUDE): cv.latitude,
-            vol.Required(ATTR_LONGITUDE): cv.longitude,
-            vol.Optional(ATTR_ADDRESS, default=""): cv.string,
-        }),
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        "clear_destination",
-        handle_clear_destination,
-        schema=vol.Schema({
-            vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
-        }),
-    )
+    async_setup_services(hass)
 
     return True
 
@@ -144,13 +167,23 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.data[DOMAIN].pop(entry.entry_id)
 
         if not hass.data[DOMAIN]:
-            for service in ["trigger_alarm", "get_state", "set_destination", "clear_destination"]:
-                hass.services.async_remove(DOMAIN, service)
+            async_unload_services(hass)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the data stored for a config entry."""
+    for version, key in (
+        (SNAPSHOT_VERSION, SNAPSHOT_STORAGE_KEY),
+        (GEOFENCE_STORAGE_VERSION, GEOFENCE_STORAGE_KEY),
+    ):
+        await Store(hass, version, key.format(entry_id=entry.entry_id)).async_remove()
+    await hass.async_add_executor_job(
+        remove_db, hass.config.path(TRIP_DB_FILE.format(entry_id=entry.entry_id))
+    )
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    await hass.config_entries.async_reload(entry.entry_id)
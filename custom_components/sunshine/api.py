@@ -2,28 +2,107 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator, Coroutine, Iterable
+import json
 import logging
+import time
 from typing import Any
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli  # noqa: F401
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+    except ImportError:
+        HAS_BROTLI = False
+    else:
+        HAS_BROTLI = True
+else:
+    HAS_BROTLI = True
+
+from .commands import CommandQueue, TaskFactory
 from .const import DEFAULT_BASE_URL
+from .metrics import EndpointStats, SunshineMetrics
+from .ratelimit import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    RequestScheduler,
+)
+from .resilience import (
+    COMMAND_POLICY,
+    READ_POLICY,
+    CircuitBreaker,
+    SunshineCircuitOpenError,
+    parse_retry_after,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# The server sends keepalive comments well within this window
+STREAM_READ_TIMEOUT = 90
+
+# Statuses that indicate an overloaded or failing backend
+TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# aiohttp only inflates brotli when a brotli module is installed
+ACCEPT_ENCODING = "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"
+
+# Bodies from this size on are decoded in the executor, e.g. large fleets
+DECODE_EXECUTOR_THRESHOLD = 512 * 1024
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _create_task(coro: Coroutine[Any, Any, None], name: str) -> asyncio.Task:
+    """Start a task on the running loop."""
+    return asyncio.get_running_loop().create_task(coro, name=name)
+
+
+class SunshineStreamUnavailable(Exception):
+    """Raised when the server does not offer a telemetry stream."""
+
 
 class SunshineAPI:
     """Sunshine API client."""
 
-    def __init__(self, token: str, base_url: str, session: aiohttp.ClientSession) -> None:
-        """Initialize the API client."""
+    def __init__(
+        self,
+        token: str,
+        base_url: str,
+        session: aiohttp.ClientSession,
+        scheduler: RequestScheduler | None = None,
+        create_task: TaskFactory | None = None,
+    ) -> None:
+        """Initialize the API client.
+
+        Clients sharing a backend should share its scheduler, otherwise the
+        client rate limits its own requests only. Command workers are
+        started with create_task, or as plain tasks without one.
+        """
         self.token = token
         self.base_url = base_url.rstrip('/')
         self._session = session
         self._headers = {
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
         }
+        # Conditional request state per endpoint
+        self._validators: dict[str, dict[str, str]] = {}
+        self._cache: dict[str, Any] = {}
+        self._commands = CommandQueue(create_task or _create_task)
+        self.breaker = CircuitBreaker()
+        self._scheduler = scheduler if scheduler is not None else RequestScheduler()
+        self.retries = 0
+        self.metrics = SunshineMetrics()
 
     async def test_authentication(self) -> bool:
         """Test if the authentication is valid."""
@@ -34,95 +113,281 @@ class SunshineAPI:
             _LOGGER.error("Authentication test failed: %s", err)
             raise
 
-    async def _request(self, method: str, endpoint: str, **kwargs) -> dict[str, Any] | None:
-        """Make a request to the API."""
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        conditional: bool = False,
+        priority: int | None = None,
+        **kwargs,
+    ) -> dict[str, Any] | None:
+        """Make a request to the API, retrying transient failures.
+
+        Requests wait for the backend's shared rate limit; reads default to
+        the poll lane and everything else to the command lane.
+
+        GETs are retried on any transient error. Other methods are only
+        retried if the server certainly did not act on them: the connection
+        was never established, or it answered 429/503. A Retry-After header
+        is honored, and the circuit breaker fails requests fast while the
+        backend is down; its probe request is never retried.
+        """
+        policy = READ_POLICY if method == "GET" else COMMAND_POLICY
+        if priority is None:
+            priority = PRIORITY_POLL if method == "GET" else PRIORITY_COMMAND
+        stats = self.metrics.endpoint(endpoint)
+        attempt = 0
+        while True:
+            if not self.breaker.allow():
+                raise SunshineCircuitOpenError(self.breaker.retry_in)
+            await self._scheduler.acquire(priority)
+            # A failed probe reopens the breaker, retrying it would only hit the open breaker
+            probe = self.breaker.probing
+
+            retry_after: float | None = None
+            started = time.monotonic()
+            try:
+                result = await self._request_once(method, endpoint, conditional, **kwargs)
+            except aiohttp.ClientResponseError as err:
+                stats.latency.record(time.monotonic() - started)
+                stats.errors += 1
+                if err.status not in TRANSIENT_STATUSES:
+                    # The backend is healthy, the request itself was refused
+                    self.breaker.record_success()
+                    raise
+                if err.headers:
+                    retry_after = parse_retry_after(err.headers.get("Retry-After"))
+                retryable = err.status in policy.retry_statuses
+                error: Exception = err
+            except aiohttp.ClientConnectorError as err:
+                stats.errors += 1
+                retryable = True
+                error = err
+            except (aiohttp.ClientError, TimeoutError) as err:
+                stats.errors += 1
+                retryable = policy.retry_ambiguous_errors
+                error = err
+            else:
+                stats.latency.record(time.monotonic() - started)
+                self.breaker.record_success()
+                return result
+
+            attempt += 1
+            if (
+                not retryable
+                or probe
+                or attempt >= policy.attempts
+                or (retry_after is not None and retry_after > policy.max_delay)
+            ):
+                self.breaker.record_failure(retry_after)
+                raise error
+
+            delay = retry_after if retry_after is not None else policy.backoff(attempt)
+            _LOGGER.debug("Retrying %s %s in %.1fs after: %s", method, endpoint, delay, error)
+            self.retries += 1
+            stats.retries += 1
+            await asyncio.sleep(delay)
+
+    async def _request_once(
+        self, method: str, endpoint: str, conditional: bool = False, **kwargs
+    ) -> dict[str, Any] | None:
+        """Send a single request.
+
+        With conditional set, the response validators are remembered and sent
+        on the next request; a 304 reply returns the previously parsed object.
+        The body is read and decoded separately so both are measured.
+        """
         url = f"{self.base_url}/api/v1{endpoint}"
 
-        async with self._session.request(method, url, headers=self._headers, **kwargs) as response:
+        headers = self._headers
+        if conditional and endpoint in self._validators:
+            headers = {**headers, **self._validators[endpoint]}
+
+        async with self._session.request(method, url, headers=headers, **kwargs) as response:
+            stats = self.metrics.endpoint(endpoint)
+            if response.status == 304 and endpoint in self._cache:
+                stats.not_modified += 1
+                return self._cache[endpoint]
             response.raise_for_status()
             if response.status == 204:
                 return None
-            return await response.json()
+            body = await response.read()
+            stats.record_payload(len(body), response.content_length)
+            result = await self._async_decode(body, stats) if body.strip() else None
+
+            if conditional:
+                validators = {}
+                if etag := response.headers.get("ETag"):
+                    validators["If-None-Match"] = etag
+                if last_modified := response.headers.get("Last-Modified"):
+                    validators["If-Modified-Since"] = last_modified
+                if validators:
+                    self._validators[endpoint] = validators
+                    self._cache[endpoint] = result
+                else:
+                    self._validators.pop(endpoint, None)
+                    self._cache.pop(endpoint, None)
+
+            return result
+
+    async def _async_decode(self, body: bytes, stats: EndpointStats) -> Any:
+        """Decode a JSON body, off the event loop if it is large."""
+        started = time.monotonic()
+        if len(body) < DECODE_EXECUTOR_THRESHOLD:
+            result = json_loads(body)
+            stats.loop_block.record(time.monotonic() - started)
+        else:
+            result = await asyncio.get_running_loop().run_in_executor(None, json_loads, body)
+            stats.executor_decodes += 1
+        stats.decode.record(time.monotonic() - started)
+        return result
+
+    async def _command(
+        self,
+        scooter_id: str,
+        command: str,
+        endpoint: str,
+        body: dict[str, Any] | None = None,
+        method: str = "POST",
+    ) -> dict[str, Any] | None:
+        """Send a command to a scooter through its command queue."""
+        kwargs = {"json": body} if body is not None else {}
+
+        async def _async_send() -> dict[str, Any] | None:
+            """Send the command, timing its round trip retries included."""
+            started = time.monotonic()
+            try:
+                return await self._request(method, endpoint, **kwargs)
+            finally:
+                self.metrics.command(command).record(time.monotonic() - started)
+
+        return await self._commands.submit(scooter_id, command, body, _async_send)
+
+    async def stream_scooters(self) -> AsyncIterator[dict[str, Any]]:
+        """Yield scooter updates pushed over the server-sent event stream.
+
+        Each update carries the scooter "id" plus the fields that changed.
+        Raises SunshineStreamUnavailable if the server has no stream.
+        """
+        url = f"{self.base_url}/api/v1/scooters/stream"
+        headers = {**self._headers, "Accept": "text/event-stream"}
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=STREAM_READ_TIMEOUT)
+
+        await self._scheduler.acquire(PRIORITY_POLL)
+        async with self._session.get(url, headers=headers, timeout=timeout) as response:
+            if response.status in (404, 405, 501):
+                raise SunshineStreamUnavailable(f"HTTP {response.status}")
+            response.raise_for_status()
+            if response.content_type != "text/event-stream":
+                raise SunshineStreamUnavailable(f"Unexpected content type {response.content_type}")
+
+            data_lines: list[str] = []
+            async for raw_line in response.content:
+                line = raw_line.decode("utf-8").rstrip("\r\n")
+                if line:
+                    # Comments (keepalives) start with a colon, other fields are ignored
+                    if line.startswith("data:"):
+                        data_lines.append(line[5:].lstrip(" "))
+                    continue
+                if not data_lines:
+                    continue
+                payload = "\n".join(data_lines)
+                data_lines = []
+                try:
+                    update = json_loads(payload)
+                except ValueError:
+                    _LOGGER.debug("Ignoring malformed stream event: %s", payload)
+                    continue
+                if isinstance(update, dict) and "id" in update:
+                    yield update
 
     # Scooter list & details
 
-    async def get_scooters(self) -> list[dict[str, Any]]:
-        """Get list of all scooters."""
-        return await self._request("GET", "/scooters")
+    async def get_scooters(self, fields: Iterable[str] | None = None) -> list[dict[str, Any]]:
+        """Get list of all scooters, limited to the given dotted field paths if any."""
+        endpoint = "/scooters"
+        if fields:
+            endpoint += f"?fields={','.join(sorted(fields))}"
+        return await self._request("GET", endpoint, conditional=True)
 
-    async def get_scooter(self, scooter_id: str) -> dict[str, Any]:
+    async def get_scooter(self, scooter_id: str, priority: int | None = None) -> dict[str, Any]:
         """Get details of a specific scooter."""
-        return await self._request("GET", f"/scooters/{scooter_id}")
+        return await self._request(
+            "GET", f"/scooters/{scooter_id}", conditional=True, priority=priority
+        )
 
     # Control commands
 
     async def unlock(self, scooter_id: str) -> dict[str, Any]:
         """Unlock a scooter."""
-        return await self._request("POST", f"/scooters/{scooter_id}/unlock")
+        return await self._command(scooter_id, "unlock", f"/scooters/{scooter_id}/unlock")
 
     async def lock(self, scooter_id: str) -> dict[str, Any]:
         """Lock a scooter."""
-        return await self._request("POST", f"/scooters/{scooter_id}/lock")
+        return await self._command(scooter_id, "lock", f"/scooters/{scooter_id}/lock")
 
     async def honk(self, scooter_id: str) -> dict[str, Any]:
         """Activate horn/honk sound."""
-        return await self._request("POST", f"/scooters/{scooter_id}/honk")
+        return await self._command(scooter_id, "honk", f"/scooters/{scooter_id}/honk")
 
     async def trigger_alarm(self, scooter_id: str, duration: str = "5s") -> dict[str, Any]:
         """Trigger alarm for specified duration."""
-        return await self._request(
-            "POST",
+        return await self._command(
+            scooter_id,
+            "trigger_alarm",
             f"/scooters/{scooter_id}/alarm",
-            json={"duration": duration}
+            {"duration": duration},
         )
 
     async def alarm_arm(self, scooter_id: str) -> dict[str, Any]:
         """Arm the alarm system."""
-        return await self._request("POST", f"/scooters/{scooter_id}/alarm_arm")
+        return await self._command(scooter_id, "alarm_arm", f"/scooters/{scooter_id}/alarm_arm")
 
     async def alarm_disarm(self, scooter_id: str) -> dict[str, Any]:
         """Disarm the alarm system."""
-        return await self._request("POST", f"/scooters/{scooter_id}/alarm_disarm")
+        return await self._command(scooter_id, "alarm_disarm", f"/scooters/{scooter_id}/alarm_disarm")
 
     async def alarm_stop(self, scooter_id: str) -> dict[str, Any]:
         """Stop an active alarm."""
-        return await self._request("POST", f"/scooters/{scooter_id}/alarm_stop")
+        return await self._command(scooter_id, "alarm_stop", f"/scooters/{scooter_id}/alarm_stop")
 
     async def play_sound(self, scooter_id: str, sound: str) -> dict[str, Any]:
         """Play different sound types."""
-        return await self._request(
-            "POST",
+        return await self._command(
+            scooter_id,
+            "play_sound",
             f"/scooters/{scooter_id}/play_sound",
-            json={"sound": sound}
+            {"sound": sound},
         )
 
     async def blinkers(self, scooter_id: str, state: str) -> dict[str, Any]:
         """Control turn signal blinkers."""
-        return await self._request(
-            "POST",
+        return await self._command(
+            scooter_id,
+            "blinkers",
             f"/scooters/{scooter_id}/blinkers",
-            json={"state": state}
+            {"state": state},
         )
 
     async def locate(self, scooter_id: str) -> dict[str, Any]:
         """Trigger location/find feature."""
-        return await self._request("POST", f"/scooters/{scooter_id}/locate")
+        return await self._command(scooter_id, "locate", f"/scooters/{scooter_id}/locate")
 
     async def ping(self, scooter_id: str) -> dict[str, Any]:
         """Ping scooter for connectivity check."""
-        return await self._request("POST", f"/scooters/{scooter_id}/ping")
+        return await self._command(scooter_id, "ping", f"/scooters/{scooter_id}/ping")
 
     async def get_state(self, scooter_id: str) -> dict[str, Any]:
         """Request fresh telemetry/state from scooter."""
-        return await self._request("POST", f"/scooters/{scooter_id}/get_state")
+        return await self._command(scooter_id, "get_state", f"/scooters/{scooter_id}/get_state")
 
     async def open_seatbox(self, scooter_id: str) -> dict[str, Any]:
         """Open the seat box/storage compartment."""
-        return await self._request("POST", f"/scooters/{scooter_id}/open_seatbox")
+        return await self._command(scooter_id, "open_seatbox", f"/scooters/{scooter_id}/open_seatbox")
 
     async def hibernate(self, scooter_id: str) -> dict[str, Any]:
         """Put scooter into hibernation mode."""
-        return await self._request("POST", f"/scooters/{scooter_id}/hibernate")
+        return await self._command(scooter_id, "hibernate", f"/scooters/{scooter_id}/hibernate")
 
     # Trips
 
@@ -136,11 +401,13 @@ class SunshineAPI:
             params.append(f"offset={offset}")
         if params:
             path += "?" + "&".join(params)
-        return await self._request("GET", path)
+        return await self._request("GET", path, priority=PRIORITY_BACKGROUND)
 
     async def get_trip(self, scooter_id: str, trip_id: int) -> dict[str, Any]:
         """Get details of a specific trip."""
-        return await self._request("GET", f"/scooters/{scooter_id}/trips/{trip_id}")
+        return await self._request(
+            "GET", f"/scooters/{scooter_id}/trips/{trip_id}", priority=PRIORITY_BACKGROUND
+        )
 
     # Navigation / Destination
 
@@ -153,8 +420,12 @@ class SunshineAPI:
         body = {"latitude": latitude, "longitude": longitude}
         if address:
             body["address"] = address
-        return await self._request("PUT", f"/scooters/{scooter_id}/destination", json=body)
+        return await self._command(
+            scooter_id, "set_destination", f"/scooters/{scooter_id}/destination", body, "PUT"
+        )
 
     async def clear_destination(self, scooter_id: str) -> None:
         """Clear the current navigation destination."""
-        await self._request("DELETE", f"/scooters/{scooter_id}/destination")
+        await self._command(
+            scooter_id, "clear_destination", f"/scooters/{scooter_id}/destination", method="DELETE"
+        )
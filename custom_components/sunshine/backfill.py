@@ -0,0 +1,120 @@
+"""Long-term statistics backfill from trip history for Sunshine Scooter integration."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DOMAIN
+from .trips import TripStore
+
+_LOGGER = logging.getLogger(__name__)
+
+# Trips are imported one time range at a time
+CHUNK = timedelta(days=30)
+
+# Statistic key, name suffix and unit
+BACKFILL_STATISTICS = (
+    ("trip_distance", "Trip Distance", "km"),
+    ("trip_energy", "Trip Energy", "Wh"),
+    ("trip_count", "Trips", None),
+)
+
+
+def statistic_id(scooter_id: str, key: str) -> str:
+    """Return the external statistic id of a scooter statistic.
+
+    Scooter ids may hold characters statistic ids do not allow, e.g. "-".
+    """
+    return f"{DOMAIN}:{slugify(scooter_id)}_{key}"
+
+
+class StatisticsBackfill:
+    """Replay stored trips into hourly long-term statistics.
+
+    Trips are read in time-range chunks with hourly aggregation done by
+    SQLite in the executor. After each chunk has been committed by the
+    recorder the progress and running sums are persisted, so an interrupted
+    backfill resumes after the last completed chunk.
+    """
+
+    def __init__(self, hass: HomeAssistant, store: TripStore) -> None:
+        """Initialize the backfill."""
+        self._hass = hass
+        self._store = store
+
+    async def async_backfill(self, scooter_id: str, scooter_name: str) -> int:
+        """Import all completed hours not imported yet, return the hours added."""
+        progress = await self._hass.async_add_executor_job(self._store.import_progress, scooter_id)
+        if progress:
+            imported_until, distance_sum, energy_sum, count_sum = progress
+            start = dt_util.parse_datetime(imported_until)
+        else:
+            distance_sum = energy_sum = 0.0
+            count_sum = 0
+            first = await self._hass.async_add_executor_job(self._store.first_trip_start, scooter_id)
+            start = dt_util.parse_datetime(first) if first else None
+        if start is None:
+            return 0
+
+        start = dt_util.as_utc(start).replace(minute=0, second=0, microsecond=0)
+        # Only completed hours, the current one may still gain trips
+        end = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        metadata = {
+            key: StatisticMetaData(
+                has_mean=False,
+                has_sum=True,
+                name=f"{scooter_name} {name}",
+                source=DOMAIN,
+                statistic_id=statistic_id(scooter_id, key),
+                unit_of_measurement=unit,
+            )
+            for key, name, unit in BACKFILL_STATISTICS
+        }
+
+        hours = 0
+        while start < end:
+            chunk_end = min(start + CHUNK, end)
+            rows = await self._hass.async_add_executor_job(
+                self._store.hourly_totals, scooter_id, start, chunk_end
+            )
+            statistics: dict[str, list[StatisticData]] = {key: [] for key in metadata}
+            for hour, distance, energy, count in rows:
+                hour_start = datetime.fromisoformat(hour).replace(tzinfo=dt_util.UTC)
+                distance_sum += distance / 1000
+                energy_sum += energy
+                count_sum += count
+                statistics["trip_distance"].append(
+                    StatisticData(start=hour_start, state=distance / 1000, sum=distance_sum)
+                )
+                statistics["trip_energy"].append(
+                    StatisticData(start=hour_start, state=energy, sum=energy_sum)
+                )
+                statistics["trip_count"].append(
+                    StatisticData(start=hour_start, state=count, sum=count_sum)
+                )
+
+            if rows:
+                for key, data in statistics.items():
+                    async_add_external_statistics(self._hass, metadata[key], data)
+                # Only record progress once the recorder has written the chunk
+                await get_instance(self._hass).async_block_till_done()
+                hours += len(rows)
+
+            await self._hass.async_add_executor_job(
+                self._store.set_import_progress,
+                scooter_id,
+                chunk_end.isoformat(),
+                distance_sum,
+                energy_sum,
+                count_sum,
+            )
+            start = chunk_end
+
+        _LOGGER.debug("Imported %d hours of trip statistics for scooter %s", hours, scooter_id)
+        return hours
@@ -16,7 +16,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .coordinator import SunshineDataUpdateCoordinator
-from .entity import SunshineEntity
+from .entity import SunshineEntity, async_add_scooter_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,6 +26,8 @@ class SunshineBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describes a Sunshine binary sensor entity."""
 
     is_on_fn: Callable[[dict], bool | None] | None = None
+    # Payload paths read by is_on_fn, None meaning the whole scooter
+    paths: tuple[str, ...] | None = None
 
 
 BINARY_SENSOR_TYPES: list[SunshineBinarySensorEntityDescription] = [
@@ -34,6 +36,7 @@ BINARY_SENSOR_TYPES: list[SunshineBinarySensorEntityDescription] = [
         name="Online",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
         is_on_fn=lambda d: d.get("online"),
+        paths=("online",),
     ),
     SunshineBinarySensorEntityDescription(
         key="alarm_triggered",
@@ -41,6 +44,7 @@ BINARY_SENSOR_TYPES: list[SunshineBinarySensorEntityDescription] = [
         device_class=BinarySensorDeviceClass.SAFETY,
         icon="mdi:alarm-light",
         is_on_fn=lambda d: d.get("alarm_triggered"),
+        paths=("alarm_triggered",),
     ),
 ]
 
@@ -54,15 +58,14 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][config_entry.entry_id]
     coordinator = data["coordinator"]
 
-    entities: list[SunshineBinarySensor] = []
+    def _scooter_entities(scooter_id: str) -> list[SunshineBinarySensor]:
+        """Return the binary sensors of one scooter."""
+        return [
+            SunshineBinarySensor(coordinator, scooter_id, description)
+            for description in BINARY_SENSOR_TYPES
+        ]
 
-    for scooter_id in coordinator.data:
-        for description in BINARY_SENSOR_TYPES:
-            entities.append(
-                SunshineBinarySensor(coordinator, scooter_id, description)
-            )
-
-    async_add_entities(entities)
+    async_add_scooter_entities(config_entry, coordinator, async_add_entities, _scooter_entities)
 
 
 class SunshineBinarySensor(SunshineEntity, BinarySensorEntity):
@@ -80,6 +83,8 @@ class SunshineBinarySensor(SunshineEntity, BinarySensorEntity):
         super().__init__(coordinator, scooter_id)
         self.entity_description = description
         self._attr_unique_id = f"{scooter_id}_{description.key}"
+        self._watched_paths = description.paths
+        self._required_paths = description.paths
 
     @property
     def is_on(self) -> bool | None:
@@ -3,16 +3,17 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .commands import SunshineCommandSuperseded
 from .const import DOMAIN
 from .coordinator import SunshineDataUpdateCoordinator
-from .entity import SunshineEntity
+from .entity import SunshineEntity, async_add_scooter_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,7 +22,8 @@ _LOGGER = logging.getLogger(__name__)
 class SunshineButtonEntityDescription(ButtonEntityDescription):
     """Describes Sunshine button entity."""
 
-    press_fn: Callable[[Any, str], Any] | None = None
+    command: str
+    command_args: tuple[Any, ...] = ()
 
 
 BUTTON_TYPES: list[SunshineButtonEntityDescription] = [
@@ -29,61 +31,62 @@ BUTTON_TYPES: list[SunshineButtonEntityDescription] = [
         key="honk",
         name="Honk",
         icon="mdi:bullhorn",
-        press_fn=lambda api, sid: api.honk(sid),
+        command="honk",
     ),
     SunshineButtonEntityDescription(
         key="locate",
         name="Locate",
         icon="mdi:map-marker",
-        press_fn=lambda api, sid: api.locate(sid),
+        command="locate",
     ),
     SunshineButtonEntityDescription(
         key="ping",
         name="Ping",
         icon="mdi:access-point-network",
-        press_fn=lambda api, sid: api.ping(sid),
+        command="ping",
     ),
     SunshineButtonEntityDescription(
         key="open_seatbox",
         name="Open Seatbox",
         icon="mdi:treasure-chest",
-        press_fn=lambda api, sid: api.open_seatbox(sid),
+        command="open_seatbox",
     ),
     SunshineButtonEntityDescription(
         key="get_state",
         name="Request State",
         icon="mdi:chart-line",
-        press_fn=lambda api, sid: api.get_state(sid),
+        command="get_state",
     ),
     SunshineButtonEntityDescription(
         key="alarm_5s",
         name="Alarm (5s)",
         icon="mdi:alarm-light",
-        press_fn=lambda api, sid: api.trigger_alarm(sid, "5s"),
+        command="trigger_alarm",
+        command_args=("5s",),
     ),
     SunshineButtonEntityDescription(
         key="alarm_arm",
         name="Arm Alarm",
         icon="mdi:shield-lock",
-        press_fn=lambda api, sid: api.alarm_arm(sid),
+        command="alarm_arm",
     ),
     SunshineButtonEntityDescription(
         key="alarm_disarm",
         name="Disarm Alarm",
         icon="mdi:shield-off",
-        press_fn=lambda api, sid: api.alarm_disarm(sid),
+        command="alarm_disarm",
     ),
     SunshineButtonEntityDescription(
         key="alarm_stop",
         name="Stop Alarm",
         icon="mdi:alarm-off",
-        press_fn=lambda api, sid: api.alarm_stop(sid),
+        command="alarm_stop",
     ),
     SunshineButtonEntityDescription(
         key="hibernate",
         name="Hibernate",
         icon="mdi:sleep",
-        press_fn=lambda api, sid: api.hibernate(sid),
+        command="hibernate",
     ),
 ]
 
@@ -98,15 +101,14 @@ async def async_setup_entry(
     api = data["api"]
     coordinator = data["coordinator"]
 
-    entities: list[SunshineButton] = []
+    def _scooter_entities(scooter_id: str) -> list[SunshineButton]:
+        """Return the buttons of one scooter."""
+        return [
+            SunshineButton(api, coordinator, scooter_id, description)
+            for description in BUTTON_TYPES
+        ]
 
-    for scooter_id in coordinator.data:
-        for description in BUTTON_TYPES:
-            entities.append(
-                SunshineButton(api, coordinator, scooter_id, description)
-            )
-
-    async_add_entities(entities)
+    async_add_scooter_entities(config_entry, coordinator, async_add_entities, _scooter_entities)
 
 
 class SunshineButton(SunshineEntity, ButtonEntity):
@@ -114,6 +116,9 @@ class SunshineButton(SunshineEntity, ButtonEntity):
 
     entity_description: SunshineButtonEntityDescription
 
+    # Buttons have no telemetry-backed state, only availability matters
+    _watched_paths = ()
+
     def __init__(
         self,
         api,
@@ -130,10 +135,13 @@ class SunshineButton(SunshineEntity, ButtonEntity):
     async def async_press(self) -> None:
         """Handle the button press."""
         try:
-            if self.entity_description.press_fn:
-                await self.entity_description.press_fn(self.api, self.scooter_id)
-                await self.coordinator.async_request_refresh()
-                self.coordinator.async_request_delayed_refresh()
+            await self.coordinator.async_send_command(
+                self.scooter_id,
+                self.entity_description.command,
+                *self.entity_description.command_args,
+            )
+        except SunshineCommandSuperseded:
+            _LOGGER.debug("Command for scooter %s superseded by a later one", self.scooter_id)
         except Exception as err:
             _LOGGER.error(
                 "Failed to press button %s for scooter %s: %s",
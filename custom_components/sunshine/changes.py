@@ -0,0 +1,94 @@
+"""Change detection between scooter payloads for Sunshine Scooter integration."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+_MISSING = object()
+
+# Nested dicts of the kept keys, None marking a subtree kept whole
+FieldTree = dict[str, "FieldTree | None"]
+
+
+def diff_paths(old: dict[str, Any], new: dict[str, Any], prefix: str = "") -> set[str]:
+    """Return the dotted paths of all leaves that differ between two payloads."""
+    changed: set[str] = set()
+    for key in old.keys() | new.keys():
+        before = old.get(key, _MISSING)
+        after = new.get(key, _MISSING)
+        if before is after or before == after:
+            continue
+        path = f"{prefix}{key}"
+        if isinstance(before, dict) and isinstance(after, dict):
+            changed |= diff_paths(before, after, f"{path}.")
+        else:
+            changed.add(path)
+    return changed
+
+
+def path_value(data: dict[str, Any], path: str) -> Any:
+    """Return the value at a dotted path, None if any part of it is missing."""
+    value: Any = data
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def paths_overlap(changed: Iterable[str], watched: Iterable[str]) -> bool:
+    """Return True if any changed path touches any watched path.
+
+    A path touches another if they are equal or one is nested in the other,
+    e.g. a replaced "batteries" object touches "batteries.battery0.level".
+    """
+    for watched_path in watched:
+        for changed_path in changed:
+            if (
+                changed_path == watched_path
+                or changed_path.startswith(f"{watched_path}.")
+                or watched_path.startswith(f"{changed_path}.")
+            ):
+                return True
+    return False
+
+
+def field_tree(fields: Iterable[str]) -> FieldTree:
+    """Return the dotted field paths as a tree."""
+    tree: FieldTree = {}
+    for path in sorted(fields, key=lambda path: path.count(".")):
+        node: FieldTree | None = tree
+        *parents, leaf = path.split(".")
+        for key in parents:
+            if key in node and node[key] is None:
+                # A parent is kept whole already
+                node = None
+                break
+            node = node.setdefault(key, {})
+        if node is not None:
+            node[leaf] = None
+    return tree
+
+
+def project(data: dict[str, Any], tree: FieldTree) -> dict[str, Any]:
+    """Return a copy of a payload holding only the fields in the tree."""
+    projected: dict[str, Any] = {}
+    for key, subtree in tree.items():
+        if key not in data:
+            continue
+        value = data[key]
+        if subtree is not None and isinstance(value, dict):
+            value = project(value, subtree)
+        projected[key] = value
+    return projected
+
+
+def is_projected(data: dict[str, Any], tree: FieldTree) -> bool:
+    """Return True if a payload holds no fields outside the tree."""
+    for key, value in data.items():
+        if key not in tree:
+            return False
+        if (subtree := tree[key]) is not None and isinstance(value, dict):
+            if not is_projected(value, subtree):
+                return False
+    return True
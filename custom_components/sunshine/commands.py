@@ -0,0 +1,135 @@
+"""Per-scooter command queue for Sunshine Scooter integration."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Commands in the same slot replace each other while still queued
+COMMAND_SLOTS = {
+    "lock": "lock",
+    "unlock": "lock",
+    "alarm_arm": "alarm_arm",
+    "alarm_disarm": "alarm_arm",
+    "blinkers": "blinkers",
+    "set_destination": "destination",
+    "clear_destination": "destination",
+}
+
+
+# Starts a worker task from its coroutine and a task name
+TaskFactory = Callable[[Coroutine[Any, Any, None], str], asyncio.Task]
+
+
+class SunshineCommandSuperseded(Exception):
+    """Raised for a queued command that a later command replaced."""
+
+
+@dataclass
+class _QueuedCommand:
+    """A command waiting for or being sent to a scooter."""
+
+    key: tuple[Any, ...]
+    slot: str | None
+    call: Callable[[], Awaitable[Any]]
+    future: asyncio.Future
+
+
+class CommandQueue:
+    """Serialize commands per scooter.
+
+    Commands for one scooter are sent one at a time in submission order,
+    while different scooters are served in parallel. Submitting a command
+    identical to one that is queued or in flight shares its result, and a
+    command replaces any queued command of the same slot (lock vs unlock,
+    blinker states, ...).
+
+    Workers are started with create_task, which should tie them to the
+    config entry so they are cancelled when it unloads.
+    """
+
+    def __init__(self, create_task: TaskFactory) -> None:
+        """Initialize the queue."""
+        self._create_task = create_task
+        self._queues: dict[str, deque[_QueuedCommand]] = {}
+        self._in_flight: dict[str, _QueuedCommand] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+
+    def submit(
+        self,
+        scooter_id: str,
+        command: str,
+        params: dict[str, Any] | None,
+        call: Callable[[], Awaitable[Any]],
+    ) -> Awaitable[Any]:
+        """Queue a command and return an awaitable of its response.
+
+        The response may be shared with other callers, so cancelling one
+        caller leaves the command and the others alone.
+        """
+        key = (command, tuple(sorted((params or {}).items())))
+        queue = self._queues.setdefault(scooter_id, deque())
+        slot = COMMAND_SLOTS.get(command)
+
+        for queued in queue:
+            if queued.key == key:
+                _LOGGER.debug("Coalescing %s for scooter %s with queued command", command, scooter_id)
+                return asyncio.shield(queued.future)
+        if (
+            (in_flight := self._in_flight.get(scooter_id))
+            and in_flight.key == key
+            # A queued command of the slot would undo the in-flight one
+            and not (slot and any(queued.slot == slot for queued in queue))
+        ):
+            _LOGGER.debug("Coalescing %s for scooter %s with in-flight command", command, scooter_id)
+            return asyncio.shield(in_flight.future)
+
+        if slot:
+            for queued in [queued for queued in queue if queued.slot == slot]:
+                _LOGGER.debug("%s supersedes queued %s for scooter %s", command, queued.key[0], scooter_id)
+                queue.remove(queued)
+                if not queued.future.done():
+                    queued.future.set_exception(
+                        SunshineCommandSuperseded(f"{queued.key[0]} superseded by {command}")
+                    )
+
+        loop = asyncio.get_running_loop()
+        item = _QueuedCommand(key, slot, call, loop.create_future())
+        queue.append(item)
+        if scooter_id not in self._workers:
+            self._workers[scooter_id] = self._create_task(
+                self._async_run(scooter_id), f"sunshine commands {scooter_id}"
+            )
+        return asyncio.shield(item.future)
+
+    async def _async_run(self, scooter_id: str) -> None:
+        """Send queued commands for a scooter until its queue is empty."""
+        queue = self._queues[scooter_id]
+        try:
+            while queue:
+                item = queue.popleft()
+                self._in_flight[scooter_id] = item
+                try:
+                    result = await item.call()
+                except asyncio.CancelledError:
+                    item.future.cancel()
+                    raise
+                except Exception as err:
+                    if not item.future.done():
+                        item.future.set_exception(err)
+                else:
+                    if not item.future.done():
+                        item.future.set_result(result)
+                finally:
+                    del self._in_flight[scooter_id]
+        finally:
+            del self._workers[scooter_id]
+            # Only left over if the worker was cancelled
+            while queue:
+                queue.popleft().future.cancel()
+            del self._queues[scooter_id]
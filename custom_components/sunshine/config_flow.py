@@ -2,18 +2,26 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_TOKEN
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import SunshineAPI
-from .const import CONF_BASE_URL, DEFAULT_BASE_URL, DOMAIN
+from .const import (
+    CONF_BASE_URL,
+    CONF_DEDICATED_SESSION,
+    DEFAULT_BASE_URL,
+    DEFAULT_DEDICATED_SESSION,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,11 +30,23 @@ STEP_USER_DATA_SCHEMA = vol.Schema({
     vol.Optional(CONF_BASE_URL, default=DEFAULT_BASE_URL): cv.string,
 })
 
+STEP_REAUTH_DATA_SCHEMA = vol.Schema({
+    vol.Required(CONF_TOKEN): cv.string,
+})
+
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Sunshine Scooter."""
     
     VERSION = 1
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return OptionsFlow()
     
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -35,18 +55,10 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
         
         if user_input is not None:
-            session = async_get_clientsession(self.hass)
-            api = SunshineAPI(
+            if await self._async_authenticate(
                 user_input[CONF_TOKEN],
                 user_input.get(CONF_BASE_URL, DEFAULT_BASE_URL),
-                session
-            )
-            
-            try:
-                await api.test_authentication()
-            except Exception:
-                errors["base"] = "invalid_auth"
-            else:
+            ):
                 await self.async_set_unique_id(user_input[CONF_TOKEN][:8])
                 self._abort_if_unique_id_configured()
                 
@@ -54,9 +66,72 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     title="Sunshine Scooter",
                     data=user_input,
                 )
+            errors["base"] = "invalid_auth"
         
         return self.async_show_form(
             step_id="user",
             data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
-        )
\ No newline at end of file
+        )
+
+    async def async_step_reauth(
+        self, entry_data: Mapping[str, Any]
+    ) -> FlowResult:
+        """Handle the backend rejecting the stored token."""
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Ask for a new token and reload the entry with it."""
+        errors: dict[str, str] = {}
+        entry = self._get_reauth_entry()
+
+        if user_input is not None:
+            if await self._async_authenticate(
+                user_input[CONF_TOKEN],
+                entry.data.get(CONF_BASE_URL, DEFAULT_BASE_URL),
+            ):
+                return self.async_update_reload_and_abort(
+                    entry,
+                    data_updates={CONF_TOKEN: user_input[CONF_TOKEN]},
+                )
+            errors["base"] = "invalid_auth"
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=STEP_REAUTH_DATA_SCHEMA,
+            errors=errors,
+        )
+
+    async def _async_authenticate(self, token: str, base_url: str) -> bool:
+        """Return whether the backend accepts the token."""
+        api = SunshineAPI(token, base_url, async_get_clientsession(self.hass))
+        try:
+            await api.test_authentication()
+        except Exception:
+            return False
+        return True
+
+
+class OptionsFlow(config_entries.OptionsFlow):
+    """Handle Sunshine Scooter options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Optional(
+                    CONF_DEDICATED_SESSION,
+                    default=self.config_entry.options.get(
+                        CONF_DEDICATED_SESSION, DEFAULT_DEDICATED_SESSION
+                    ),
+                ): bool,
+            }),
+        )
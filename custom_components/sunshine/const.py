@@ -5,6 +5,11 @@ DOMAIN = "sunshine"
 
 CONF_BASE_URL = "base_url"
 DEFAULT_BASE_URL = "https://sunshine.rescoot.org"
+CONF_DEDICATED_SESSION = "dedicated_session"
+DEFAULT_DEDICATED_SESSION = False
+
+# Scooter states the lock switch reads as unlocked, any other as locked
+UNLOCKED_STATES = ("parked", "ready-to-drive")
 
 ATTR_SCOOTER_ID = "scooter_id"
 ATTR_VIN = "vin"
@@ -14,6 +19,13 @@ ATTR_STATE = "state"
 ATTR_LATITUDE = "latitude"
 ATTR_LONGITUDE = "longitude"
 ATTR_ADDRESS = "address"
+ATTR_TRIP_ID = "trip_id"
+ATTR_TOLERANCE = "tolerance"
+ATTR_FENCE_ID = "fence_id"
+ATTR_RADIUS = "radius"
+ATTR_POINTS = "points"
+ATTR_MAX_CONCURRENCY = "max_concurrency"
+ATTR_RESTORED = "restored"
 
 SERVICE_TRIGGER_ALARM = "trigger_alarm"
 SERVICE_PLAY_SOUND = "play_sound"
@@ -22,11 +34,21 @@ SERVICE_OPEN_SEATBOX = "open_seatbox"
 SERVICE_GET_STATE = "get_state"
 SERVICE_SET_DESTINATION = "set_destination"
 SERVICE_CLEAR_DESTINATION = "clear_destination"
+SERVICE_GET_TRIP_TRACK = "get_trip_track"
+SERVICE_ADD_GEOFENCE = "add_geofence"
+SERVICE_REMOVE_GEOFENCE = "remove_geofence"
+SERVICE_IMPORT_TRIP_STATISTICS = "import_trip_statistics"
+
+# Scooters a bulk command service talks to at the same time
+DEFAULT_MAX_CONCURRENCY = 10
 
 SOUND_ALARM = "alarm"
 SOUND_CHIRP = "chirp"
 SOUND_FIND_ME = "find_me"
 
+# Scooters below this battery0 level count as low in the fleet sensors
+FLEET_LOW_BATTERY_THRESHOLD = 20
+
 BLINKER_LEFT = "left"
 BLINKER_RIGHT = "right"
 BLINKER_BOTH = "both"
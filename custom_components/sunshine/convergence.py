@@ -0,0 +1,112 @@
+"""Single-scooter convergence polling for Sunshine Scooter integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+# The backend needs a moment to see a command's effect
+FIRST_PROBE_DELAY = 0.5
+PROBE_BACKOFF = 2.0
+MAX_PROBE_DELAY = 5.0
+# Give up on the expected state well before the optimistic one expires
+CONVERGENCE_TIMEOUT = 20.0
+# Scooters followed at once, a bulk command beyond this is cheaper as fleet refreshes
+MAX_TRACKED = 5
+
+
+def probe_delays(timeout: float = CONVERGENCE_TIMEOUT) -> Iterator[float]:
+    """Yield growing delays between probes until the timeout is used up."""
+    delay = FIRST_PROBE_DELAY
+    elapsed = 0.0
+    while elapsed + delay <= timeout:
+        yield delay
+        elapsed += delay
+        delay = min(delay * PROBE_BACKOFF, MAX_PROBE_DELAY)
+
+
+class ConvergencePoller:
+    """Follow commands through by polling only the scooters they went to.
+
+    After a command the scooter is fetched on its own at growing intervals
+    until its data shows the expected state or the timeout passes, and the
+    last fetched data is handed on together with whether it converged. If a
+    fetch fails, the fallback gets the scooter so a fleet refresh can pick
+    it up instead.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        fetch: Callable[[str], Awaitable[Any]],
+        apply: Callable[[str, dict[str, Any], bool], None],
+        fallback: Callable[[str], None],
+    ) -> None:
+        """Initialize the poller."""
+        self._hass = hass
+        self._fetch = fetch
+        self._apply = apply
+        self._fallback = fallback
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    @callback
+    def async_track(
+        self, scooter_id: str, converged: Callable[[dict[str, Any]], bool]
+    ) -> bool:
+        """Poll a scooter until converged, replacing any earlier tracking of it.
+
+        Returns False without polling if too many scooters are followed already.
+        """
+        if (task := self._tasks.pop(scooter_id, None)) is not None:
+            task.cancel()
+        elif len(self._tasks) >= MAX_TRACKED:
+            return False
+        self._tasks[scooter_id] = self._hass.async_create_background_task(
+            self._async_poll(scooter_id, converged), f"sunshine converge {scooter_id}"
+        )
+        return True
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop all polling."""
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+
+    async def _async_poll(
+        self, scooter_id: str, converged: Callable[[dict[str, Any]], bool]
+    ) -> None:
+        """Fetch a scooter until converged or timed out, then apply its data."""
+        scooter: dict[str, Any] | None = None
+        probes = 0
+        done = False
+        try:
+            for delay in probe_delays():
+                await asyncio.sleep(delay)
+                try:
+                    result = await self._fetch(scooter_id)
+                except Exception as err:
+                    _LOGGER.debug("Fetching scooter %s failed: %s", scooter_id, err)
+                    self._fallback(scooter_id)
+                    return
+                if not isinstance(result, dict):
+                    _LOGGER.debug("Unexpected data for scooter %s: %s", scooter_id, result)
+                    self._fallback(scooter_id)
+                    return
+                scooter = result
+                probes += 1
+                if done := converged(scooter):
+                    _LOGGER.debug("Scooter %s converged after %d probes", scooter_id, probes)
+                    break
+            else:
+                _LOGGER.debug("Scooter %s did not converge after %d probes", scooter_id, probes)
+        finally:
+            if self._tasks.get(scooter_id) is asyncio.current_task():
+                del self._tasks[scooter_id]
+        if scooter is not None:
+            self._apply(scooter_id, scooter, done)
@@ -1,24 +1,69 @@
 """Data update coordinator for Sunshine Scooter integration."""
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from functools import partial
 import logging
+import random
+import time
 from typing import Any
 
+import aiohttp
 from async_timeout import timeout
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
-from homeassistant.helpers.event import async_call_later
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .api import SunshineAPI
-from .const import DOMAIN
+from .api import SunshineAPI, SunshineStreamUnavailable
+from .changes import FieldTree, diff_paths, field_tree, is_projected, paths_overlap, project
+from .const import DOMAIN, FLEET_LOW_BATTERY_THRESHOLD
+from .convergence import ConvergencePoller
+from .fleet import FleetStats, compute_fleet_stats
+from .optimistic import apply_patch, expected_patch, patch_confirmed
+from .polling import (
+    COMMAND_BOOST,
+    INTERVAL_ACTIVE,
+    INTERVAL_STREAMING,
+    fleet_poll_interval,
+    jittered,
+)
+from .ratelimit import PRIORITY_BACKGROUND
+from .refresh import RefreshCoalescer
+from .resilience import SunshineCircuitOpenError
 
 _LOGGER = logging.getLogger(__name__)
 
 UPDATE_INTERVAL = timedelta(seconds=30)
 
+# How long an optimistic state is shown without telemetry confirming it
+OPTIMISTIC_TIMEOUT = 30.0
+
+STREAM_BACKOFF_MIN = 1.0
+STREAM_BACKOFF_MAX = 300.0
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_STORAGE_KEY = f"{DOMAIN}.{{entry_id}}.snapshot"
+# At most one snapshot write is scheduled per this many seconds
+SNAPSHOT_SAVE_DELAY = 60.0
+
+
+def _merge_update(current: dict[str, Any], update: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of current with a partial update merged in."""
+    merged = dict(current)
+    for key, value in update.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge_update(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
 
 class SunshineDataUpdateCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
     """Class to manage fetching Sunshine data from the API."""
@@ -36,22 +81,376 @@ class SunshineDataUpdateCoordinator(DataUpdateCoordinator[dict[str, dict[str, An
             name=DOMAIN,
             config_entry=config_entry,
             update_interval=UPDATE_INTERVAL,
+            # Listeners are only called when the data actually changed
+            always_update=False,
         )
         self.api = api
-        self._delayed_refresh_unsub: CALLBACK_TYPE | None = None
+        self.metrics = api.metrics
+        self._last_scooters_list: list[dict[str, Any]] | None = None
+        self._refresh_coalescer = RefreshCoalescer(hass, self.async_refresh)
+        self._convergence = ConvergencePoller(
+            hass,
+            # Behind fleet polls, which a burst of probes must not hold up
+            partial(api.get_scooter, priority=PRIORITY_BACKGROUND),
+            self._async_merge_scooter,
+            self._async_convergence_failed,
+        )
+        self._boost_until: datetime | None = None
+        # Optimistic patch and its expiry (monotonic) per scooter
+        self._optimistic: dict[str, tuple[dict[str, Any], float]] = {}
+        self.streaming = False
+        # Changed paths per scooter since the previous data, None meaning everything
+        self.changed: dict[str, frozenset[str] | None] | None = None
+        self._fleet_stats = FleetStats()
+        self._fleet_stats_data: dict[str, dict[str, Any]] | None = None
+        self._snapshot: Store[dict[str, Any]] = Store(
+            hass, SNAPSHOT_VERSION, SNAPSHOT_STORAGE_KEY.format(entry_id=config_entry.entry_id)
+        )
+        self._snapshot_scheduled = -SNAPSHOT_SAVE_DELAY
+        # True while the data is the stored snapshot and not live yet
+        self.restored = False
+        # Scooter ids entities exist for, None until a platform listens
+        self._known_scooters: set[str] | None = None
+        self._scooter_listeners: list[Callable[[list[str]], None]] = []
+        self._poll_listeners: list[Callable[[], None]] = []
+        # Fields polled, None meaning all of them
+        self.fields: frozenset[str] | None = None
+        self._field_tree: FieldTree | None = None
+        # Whether the server honors the fields query, None until known
+        self._fields_supported: bool | None = None
+
+    @property
+    def fleet_stats(self) -> FleetStats:
+        """Return fleet aggregates, computed once per data update."""
+        if self.data is not self._fleet_stats_data:
+            self._fleet_stats_data = self.data
+            self._fleet_stats = compute_fleet_stats(self.data or {}, FLEET_LOW_BATTERY_THRESHOLD)
+        return self._fleet_stats
+
+    async def async_load_snapshot(self) -> bool:
+        """Start out with the fleet as last seen, return False if there is none."""
+        if not (stored := await self._snapshot.async_load()) or not stored.get("scooters"):
+            return False
+        self.data = stored["scooters"]
+        self.restored = True
+        _LOGGER.debug("Restored %d scooters from snapshot", len(self.data))
+        return True
+
+    @callback
+    def _async_save_snapshot(self) -> None:
+        """Persist the current data for the next startup, throttled."""
+        now = time.monotonic()
+        if now - self._snapshot_scheduled < SNAPSHOT_SAVE_DELAY:
+            # The pending write picks up this data as well
+            return
+        self._snapshot_scheduled = now
+        self._snapshot.async_delay_save(lambda: {"scooters": self.data}, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _async_clear_restored(self) -> None:
+        """Mark the data live, rewriting every entity once."""
+        if not self.restored:
+            return
+        self.restored = False
+        self.changed = None
+        # Live data equal to the snapshot would not notify listeners by itself
+        self.hass.loop.call_soon(self.async_update_listeners)
 
     @callback
-    def async_request_delayed_refresh(self, delay: float = 10.0) -> None:
-        """Schedule a data refresh after a delay to catch state changes."""
-        if self._delayed_refresh_unsub:
-            self._delayed_refresh_unsub()
+    def async_add_scooter_listener(
+        self, new_scooters_callback: Callable[[list[str]], None]
+    ) -> Callable[[], None]:
+        """Listen for scooters that appear after setup."""
+        if self._known_scooters is None:
+            self._known_scooters = set(self.data or {})
+        self._scooter_listeners.append(new_scooters_callback)
 
         @callback
-        def _async_refresh(_now) -> None:
-            self._delayed_refresh_unsub = None
+        def remove_listener() -> None:
+            self._scooter_listeners.remove(new_scooters_callback)
+
+        return remove_listener
+
+    @callback
+    def async_add_poll_listener(self, poll_callback: Callable[[], None]) -> Callable[[], None]:
+        """Listen for every finished poll, including ones that changed nothing or failed."""
+        self._poll_listeners.append(poll_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._poll_listeners.remove(poll_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_notify_polled(self) -> None:
+        """Call the poll listeners."""
+        for poll_callback in list(self._poll_listeners):
+            poll_callback()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Add new and retire removed scooters, then update all listeners."""
+        self._async_update_scooters()
+        started = time.monotonic()
+        super().async_update_listeners()
+        self.metrics.poll.dispatch.record(time.monotonic() - started)
+        self.metrics.poll.listeners_last = len(self._listeners)
+
+    @callback
+    def _async_update_scooters(self) -> None:
+        """Diff the scooter ids against the ones entities exist for."""
+        known = self._known_scooters
+        # An empty list is more likely a glitch than every scooter leaving
+        if known is None or not self.data or self.data.keys() == known:
+            return
+        added = sorted(self.data.keys() - known)
+        removed = known - self.data.keys()
+        self._known_scooters = set(self.data)
+
+        if added:
+            _LOGGER.debug("Discovered scooters %s", added)
+            for new_scooters_callback in list(self._scooter_listeners):
+                new_scooters_callback(added)
+
+        device_registry = dr.async_get(self.hass)
+        for scooter_id in removed:
+            _LOGGER.debug("Scooter %s left the account, removing its device", scooter_id)
+            if device := device_registry.async_get_device(identifiers={(DOMAIN, scooter_id)}):
+                # Removes the device and its entities once no other entry uses it
+                device_registry.async_update_device(
+                    device.id, remove_config_entry_id=self.config_entry.entry_id
+                )
+
+    @callback
+    def async_start_stream(self) -> None:
+        """Start receiving pushed telemetry in the background."""
+        self.config_entry.async_create_background_task(
+            self.hass, self._async_stream_loop(), f"{DOMAIN} telemetry stream"
+        )
+
+    async def _async_stream_loop(self) -> None:
+        """Keep the telemetry stream connected, reconnecting with backoff."""
+        backoff = STREAM_BACKOFF_MIN
+        while True:
+            try:
+                async for update in self.api.stream_scooters():
+                    if not self.streaming:
+                        _LOGGER.debug("Telemetry stream connected")
+                        self.streaming = True
+                        backoff = STREAM_BACKOFF_MIN
+                    self._async_handle_stream_update(update)
+            except SunshineStreamUnavailable as err:
+                _LOGGER.debug("Telemetry stream not available (%s), using polling only", err)
+                self.streaming = False
+                return
+            except asyncio.CancelledError:
+                self.streaming = False
+                raise
+            except Exception as err:
+                _LOGGER.debug("Telemetry stream disconnected: %s", err)
+
+            if self.streaming:
+                self.streaming = False
+                # Catch whatever was missed while disconnected
+                await self.async_request_refresh()
+
+            delay = backoff * random.uniform(0.5, 1.5)
+            _LOGGER.debug("Reconnecting telemetry stream in %.1fs", delay)
+            await asyncio.sleep(delay)
+            backoff = min(backoff * 2, STREAM_BACKOFF_MAX)
+
+    @callback
+    def async_set_fields(self, fields: frozenset[str] | None) -> None:
+        """Limit the polled fields to the ones entities read."""
+        if fields == self.fields:
+            return
+        _LOGGER.debug("Polling fields %s", sorted(fields) if fields is not None else "all")
+        self.fields = fields
+        self._field_tree = field_tree(fields) if fields is not None else None
+        # A cached reply was projected to the previous fields
+        self._last_scooters_list = None
+
+    @callback
+    def _async_handle_stream_update(self, update: dict[str, Any]) -> None:
+        """Merge a pushed scooter update into the coordinator data."""
+        scooter_id = update["id"]
+        data = self.data or {}
+        if scooter_id not in data:
+            # Unknown scooter, let a regular poll pick up the full record
             self.hass.async_create_task(self.async_request_refresh())
+            return
+
+        if self._field_tree is not None:
+            update = project(update, self._field_tree)
+        merged = {
+            **data,
+            scooter_id: self._async_reconcile_optimistic(
+                scooter_id, _merge_update(data[scooter_id], update)
+            ),
+        }
+        self._async_track_changes(merged)
+        self.async_set_updated_data(merged)
+        self._async_save_snapshot()
+
+    @callback
+    def _async_track_changes(self, new_data: dict[str, dict[str, Any]]) -> None:
+        """Record which scooters and fields differ from the current data."""
+        if self.data is None:
+            self.changed = None
+            return
+
+        changed: dict[str, frozenset[str] | None] = {}
+        for scooter_id in self.data.keys() | new_data.keys():
+            old = self.data.get(scooter_id)
+            new = new_data.get(scooter_id)
+            if old is new or old == new:
+                continue
+            if old is None or new is None:
+                changed[scooter_id] = None
+            else:
+                changed[scooter_id] = frozenset(diff_paths(old, new))
+        self.changed = changed
 
-        self._delayed_refresh_unsub = async_call_later(self.hass, delay, _async_refresh)
+    def scooter_changed(self, scooter_id: str, paths: tuple[str, ...] | None = None) -> bool:
+        """Return True if the last update touched the given paths of a scooter.
+
+        With paths None any change to the scooter counts.
+        """
+        if self.changed is None:
+            return True
+        if scooter_id not in self.changed:
+            return False
+        changed = self.changed[scooter_id]
+        if changed is None or paths is None:
+            return True
+        return paths_overlap(changed, paths)
+
+    async def async_send_command(self, scooter_id: str, command: str, *args: Any) -> Any:
+        """Send a command and show its expected outcome right away."""
+        response = await getattr(self.api, command)(scooter_id, *args)
+        patch = expected_patch(command, args, response)
+        if patch:
+            self._async_apply_optimistic(scooter_id, patch)
+            # Confirm the outcome on this scooter alone instead of refreshing the fleet
+            if self._convergence.async_track(
+                scooter_id, lambda scooter: patch_confirmed(scooter, patch)
+            ):
+                self._async_boost()
+                return response
+            # Part of a bulk command, one fleet refresh serves all its scooters
+            self.async_command_sent(scooter_id, immediate=False)
+        else:
+            self.async_command_sent(scooter_id)
+        return response
+
+    @callback
+    def async_command_sent(self, scooter_id: str, immediate: bool = True) -> None:
+        """Refresh soon and again a little later to catch a command's effect."""
+        self._async_boost()
+        self._refresh_coalescer.async_request(scooter_id, immediate=immediate)
+
+    @callback
+    def _async_boost(self) -> None:
+        """Poll fast for a while to follow a command through."""
+        self._boost_until = dt_util.utcnow() + COMMAND_BOOST
+        self.update_interval = INTERVAL_ACTIVE
+        if self._listeners:
+            # The next poll may be minutes away at the previous interval
+            self._schedule_refresh()
+
+    @callback
+    def _async_merge_scooter(
+        self, scooter_id: str, scooter: dict[str, Any], converged: bool
+    ) -> None:
+        """Merge freshly fetched data of one scooter, notifying only its entities.
+
+        If the expected state never showed up, the optimistic one is dropped
+        so the real data rolls it back.
+        """
+        if not converged:
+            _LOGGER.debug("Expected state of scooter %s not confirmed, rolling back", scooter_id)
+            self._optimistic.pop(scooter_id, None)
+        if not self.data or scooter_id not in self.data:
+            return
+        if self._field_tree is not None:
+            scooter = project(scooter, self._field_tree)
+        new_data = {
+            **self.data,
+            scooter_id: self._async_reconcile_optimistic(
+                scooter_id, _merge_update(self.data[scooter_id], scooter)
+            ),
+        }
+        self._async_track_changes(new_data)
+        # The fleet poll keeps its schedule, other scooters were not fetched
+        self.data = new_data
+        # Its next interval follows the scooter's new state once the boost ends
+        self._async_adjust_update_interval(new_data)
+        self.async_update_listeners()
+        self._async_save_snapshot()
+
+    @callback
+    def _async_convergence_failed(self, scooter_id: str) -> None:
+        """Fall back to a fleet refresh when a scooter cannot be fetched alone."""
+        self.async_command_sent(scooter_id, immediate=False)
+
+    @callback
+    def _async_apply_optimistic(self, scooter_id: str, patch: dict[str, Any]) -> None:
+        """Apply an expected state to one scooter until telemetry confirms it."""
+        if (pending := self._optimistic.get(scooter_id)) and pending[1] > time.monotonic():
+            patch = {**pending[0], **patch}
+        self._optimistic[scooter_id] = (patch, time.monotonic() + OPTIMISTIC_TIMEOUT)
+
+        if not self.data or scooter_id not in self.data:
+            return
+        new_data = {**self.data, scooter_id: apply_patch(self.data[scooter_id], patch)}
+        self._async_track_changes(new_data)
+        # Only listeners of this scooter's changed fields will write state
+        self.data = new_data
+        self.async_update_listeners()
+
+    @callback
+    def _async_reconcile_optimistic(self, scooter_id: str, scooter: dict[str, Any]) -> dict[str, Any]:
+        """Reconcile real scooter data with a pending optimistic patch.
+
+        The patch is dropped once telemetry confirms it or it expires, in which
+        case the real data rolls it back; until then it stays applied.
+        """
+        if (pending := self._optimistic.get(scooter_id)) is None:
+            return scooter
+        patch, expires = pending
+        if patch_confirmed(scooter, patch):
+            del self._optimistic[scooter_id]
+            return scooter
+        if expires <= time.monotonic():
+            _LOGGER.debug("Expected state %s of scooter %s not confirmed, rolling back", patch, scooter_id)
+            del self._optimistic[scooter_id]
+            return scooter
+        return apply_patch(scooter, patch)
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending refreshes on shutdown."""
+        self._refresh_coalescer.async_cancel()
+        self._convergence.async_cancel()
+        await super().async_shutdown()
+
+    @callback
+    def _async_adjust_update_interval(self, scooters: dict[str, dict[str, Any]]) -> None:
+        """Pick the next poll interval from the current fleet state."""
+        interval = fleet_poll_interval(scooters, dt_util.utcnow(), self._boost_until)
+        if self.streaming:
+            # Pushed telemetry keeps us current, polling is only a backstop
+            interval = max(interval, INTERVAL_STREAMING)
+        # Jitter keeps entries polling the same backend from lining up
+        self.update_interval = jittered(interval)
+
+    @callback
+    def _async_back_off(self) -> None:
+        """Stretch the poll interval while the API circuit breaker is open."""
+        retry_in = timedelta(seconds=self.api.breaker.retry_in)
+        if retry_in > self.update_interval:
+            _LOGGER.debug("Backing off polling for %s", retry_in)
+            self.update_interval = retry_in
 
     async def _async_update_data(self) -> dict[str, dict[str, Any]]:
         """Update data via API."""
@@ -59,13 +458,50 @@ class SunshineDataUpdateCoordinator(DataUpdateCoordinator[dict[str, dict[str, An
         try:
             async with timeout(30):
                 # Single bulk request returns full telemetry for all scooters
-                scooters_list = await self.api.get_scooters()
+                started = time.monotonic()
+                decode = self.metrics.endpoint("/scooters").decode
+                decoded_before = decode.total
+                fields = self.fields if self._fields_supported is not False else None
+                scooters_list = await self.api.get_scooters(fields)
+                fetched = time.monotonic()
+                decode_time = (decode.total - decoded_before) / 1000
+                self.metrics.poll.fetch.record(fetched - started - decode_time)
+                self.metrics.poll.decode.record(decode_time)
+                # Any successful fetch satisfies pending command refreshes
+                self._refresh_coalescer.async_refreshed(started)
+                if (
+                    scooters_list is self._last_scooters_list
+                    and self.data is not None
+                    and not self._optimistic
+                ):
+                    # Not modified, keep the current data so listeners are skipped
+                    _LOGGER.debug("Scooter data not modified")
+                    self._async_adjust_update_interval(self.data)
+                    self.changed = {}
+                    self._async_clear_restored()
+                    self.metrics.poll.process.record(time.monotonic() - fetched)
+                    return self.data
+                self._last_scooters_list = scooters_list
                 if not scooters_list:
                     _LOGGER.debug("No scooters returned from API")
+                    self._async_track_changes({})
+                    self._async_clear_restored()
+                    self._async_save_snapshot()
                     return {}
 
+                if (tree := self._field_tree) is not None:
+                    if fields is not None and self._fields_supported is None:
+                        self._fields_supported = is_projected(scooters_list[0], tree)
+                        _LOGGER.debug(
+                            "Server %s field projection",
+                            "supports" if self._fields_supported else "ignores",
+                        )
+                    if not self._fields_supported:
+                        # Drop what no enabled entity reads before it is diffed and kept
+                        scooters_list = [project(scooter, tree) for scooter in scooters_list]
+
                 result = {
-                    scooter["id"]: scooter
+                    scooter["id"]: self._async_reconcile_optimistic(scooter["id"], scooter)
                     for scooter in scooters_list
                     if "id" in scooter
                 }
@@ -74,8 +510,27 @@ class SunshineDataUpdateCoordinator(DataUpdateCoordinator[dict[str, dict[str, An
                         "Scooter %s: state=%s, last_seen=%s",
                         sid, data.get("state"), data.get("last_seen_at"),
                     )
+                self._async_adjust_update_interval(result)
+                self._async_track_changes(result)
+                self._async_clear_restored()
+                if self.changed != {}:
+                    self._async_save_snapshot()
+                self.metrics.poll.process.record(time.monotonic() - fetched)
                 return result
+        except aiohttp.ClientResponseError as err:
+            if err.status in (401, 403):
+                raise ConfigEntryAuthFailed(f"Authentication failed: {err.message}") from err
+            self._async_back_off()
+            raise UpdateFailed(f"Failed to fetch scooter data: {err}") from err
+        except SunshineCircuitOpenError as err:
+            self._async_back_off()
+            raise UpdateFailed(str(err)) from err
         except TimeoutError as err:
-            raise UpdateFailed(f"Timeout fetching scooter data") from err
+            self._async_back_off()
+            raise UpdateFailed("Timeout fetching scooter data") from err
         except Exception as err:
-            raise UpdateFailed(f"Failed to fetch scooter data: {err}") from err
\ No newline at end of file
+            self._async_back_off()
+            raise UpdateFailed(f"Failed to fetch scooter data: {err}") from err
+        finally:
+            # After the coordinator has dispatched the result, if it does
+            self.hass.loop.call_soon(self._async_notify_polled)
\ No newline at end of file
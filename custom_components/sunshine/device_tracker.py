@@ -11,7 +11,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, SCOOTER_COLOR_IMAGE_INDEX
 from .coordinator import SunshineDataUpdateCoordinator
-from .entity import SunshineEntity
+from .entity import SunshineEntity, async_add_scooter_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,17 +26,18 @@ async def async_setup_entry(
     api = data["api"]
     coordinator = data["coordinator"]
     
-    entities: list[SunshineDeviceTracker] = []
-    
-    for scooter_id in coordinator.data:
-        entities.append(SunshineDeviceTracker(api, coordinator, scooter_id))
-    
-    async_add_entities(entities)
+    def _scooter_entities(scooter_id: str) -> list[SunshineDeviceTracker]:
+        """Return the device tracker of one scooter."""
+        return [SunshineDeviceTracker(api, coordinator, scooter_id)]
+
+    async_add_scooter_entities(config_entry, coordinator, async_add_entities, _scooter_entities)
 
 
 class SunshineDeviceTracker(SunshineEntity, TrackerEntity):
     """Representation of a Sunshine Scooter device tracker."""
-    
+
+    _watched_paths = ("location", "location_accuracy", "batteries.battery0.level", "color")
+
     def __init__(
         self,
         api,
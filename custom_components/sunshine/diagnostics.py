@@ -0,0 +1,59 @@
+"""Diagnostics support for Sunshine Scooter integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_TOKEN
+from homeassistant.core import HomeAssistant
+
+from .const import ATTR_ADDRESS, ATTR_LATITUDE, ATTR_LONGITUDE, ATTR_VIN, DOMAIN
+
+TO_REDACT = {
+    CONF_TOKEN,
+    ATTR_VIN,
+    ATTR_ADDRESS,
+    ATTR_LATITUDE,
+    ATTR_LONGITUDE,
+    "lat",
+    "lng",
+    "location",
+    "destination",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data = hass.data[DOMAIN][entry.entry_id]
+    api = data["api"]
+    coordinator = data["coordinator"]
+    session = data["session"]
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+            "streaming": coordinator.streaming,
+            "restored": coordinator.restored,
+            "scooters": len(coordinator.data or {}),
+        },
+        "api": {
+            "retries": api.retries,
+            "circuit_breaker": api.breaker.state,
+            "circuit_retry_in": api.breaker.retry_in,
+        },
+        "metrics": api.metrics.as_dict(),
+        "connection_pool": session.stats.as_dict() if session is not None else None,
+        "scooters": async_redact_data(coordinator.data or {}, TO_REDACT),
+    }
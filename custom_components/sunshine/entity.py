@@ -1,23 +1,112 @@
 """Base entity for Sunshine Scooter integration."""
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
 from typing import Any
 
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .changes import path_value
+from .const import ATTR_RESTORED, DOMAIN
 from .coordinator import SunshineDataUpdateCoordinator
 
 
+@callback
+def async_add_scooter_entities(
+    config_entry: ConfigEntry,
+    coordinator: SunshineDataUpdateCoordinator,
+    async_add_entities: AddEntitiesCallback,
+    entities_fn: Callable[[str], Iterable[SunshineEntity]],
+) -> None:
+    """Add a platform's entities for every scooter, now and whenever one appears.
+
+    Entities whose data is not in a scooter's payload are held back and
+    added once an update brings it, e.g. when a second battery is inserted.
+    """
+    pending: dict[str, list[SunshineEntity]] = {}
+
+    @callback
+    def _async_probe(scooter_id: str, candidates: list[SunshineEntity]) -> list[SunshineEntity]:
+        """Return the candidates with data, keeping the others pending."""
+        scooter = (coordinator.data or {}).get(scooter_id, {})
+        ready: list[SunshineEntity] = []
+        waiting: list[SunshineEntity] = []
+        for entity in candidates:
+            (ready if entity.has_data(scooter) else waiting).append(entity)
+        if waiting:
+            pending[scooter_id] = waiting
+        else:
+            pending.pop(scooter_id, None)
+        return ready
+
+    @callback
+    def _async_add_scooters(scooter_ids: list[str]) -> None:
+        ready = [
+            entity
+            for scooter_id in scooter_ids
+            for entity in _async_probe(scooter_id, list(entities_fn(scooter_id)))
+        ]
+        if ready:
+            async_add_entities(ready)
+
+    @callback
+    def _async_add_pending() -> None:
+        ready: list[SunshineEntity] = []
+        for scooter_id in list(pending):
+            if scooter_id not in (coordinator.data or {}):
+                del pending[scooter_id]
+            elif coordinator.scooter_changed(scooter_id):
+                ready.extend(_async_probe(scooter_id, pending[scooter_id]))
+        if ready:
+            async_add_entities(ready)
+
+    _async_add_scooters(list(coordinator.data or {}))
+    config_entry.async_on_unload(coordinator.async_add_scooter_listener(_async_add_scooters))
+    config_entry.async_on_unload(coordinator.async_add_listener(_async_add_pending))
+
+
 class SunshineEntity(CoordinatorEntity[SunshineDataUpdateCoordinator]):
     """Base class for Sunshine entities."""
 
     _attr_has_entity_name = True
 
+    # Payload paths the entity state depends on, None meaning the whole scooter
+    _watched_paths: tuple[str, ...] | None = None
+    # Payload paths of which one must hold data to create the entity, None meaning always
+    _required_paths: tuple[str, ...] | None = None
+
     def __init__(self, coordinator: SunshineDataUpdateCoordinator, scooter_id: str) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
         self.scooter_id = scooter_id
+        self._last_available: bool | None = None
+
+    def has_data(self, scooter: dict[str, Any]) -> bool:
+        """Return True if the scooter's payload has data for this entity."""
+        if self._required_paths is None:
+            return True
+        return any(path_value(scooter, path) is not None for path in self._required_paths)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if availability or a watched field changed."""
+        available = self.available
+        if available == self._last_available and not self.coordinator.scooter_changed(
+            self.scooter_id, self._watched_paths
+        ):
+            return
+        self._last_available = available
+        super()._handle_coordinator_update()
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Mark the state as restored until live data arrives."""
+        if self.coordinator.restored:
+            return {ATTR_RESTORED: True}
+        return None
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -45,3 +134,57 @@ class SunshineEntity(CoordinatorEntity[SunshineDataUpdateCoordinator]):
             info["sw_version"] = sw_version
 
         return info
+
+
+class SunshineFleetEntity(CoordinatorEntity[SunshineDataUpdateCoordinator]):
+    """Base class for entities aggregating all scooters of a config entry."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: SunshineDataUpdateCoordinator) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._last_available: bool | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if availability or any scooter changed."""
+        available = self.available
+        if available == self._last_available and self.coordinator.changed == {}:
+            return
+        self._last_available = available
+        super()._handle_coordinator_update()
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Mark the state as restored until live data arrives."""
+        if self.coordinator.restored:
+            return {ATTR_RESTORED: True}
+        return None
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return device information."""
+        return {
+            "identifiers": {(DOMAIN, f"{self.coordinator.config_entry.entry_id}_fleet")},
+            "name": "Sunshine Fleet",
+            "model": "Fleet",
+            "manufacturer": "Sunshine",
+        }
+
+
+class SunshinePollEntity(SunshineFleetEntity):
+    """Base class for fleet entities whose state moves with every poll.
+
+    Coordinator listeners are skipped for polls that changed nothing, so
+    state is written from the coordinator's poll listener instead.
+    """
+
+    async def async_added_to_hass(self) -> None:
+        """Write state after every poll."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_poll_listener(self.async_write_ha_state))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Leave writing state to the poll listener."""
@@ -0,0 +1,64 @@
+"""Fleet-wide aggregates for Sunshine Scooter integration."""
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True)
+class FleetStats:
+    """Aggregated values over all scooters of a config entry."""
+
+    total: int = 0
+    online: int = 0
+    battery_mean: float | None = None
+    battery_min: float | None = None
+    odometer_km: float | None = None
+    low_battery: int = 0
+    states: dict[str, int] = field(default_factory=dict)
+
+
+def _as_float(value: Any) -> float | None:
+    """Convert an API value to float, ignoring garbage."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def compute_fleet_stats(scooters: dict[str, dict[str, Any]], low_battery_threshold: float) -> FleetStats:
+    """Compute fleet aggregates in one pass over the scooter data.
+
+    Values are collected into flat columns first so the reductions run over
+    contiguous arrays instead of nested dicts.
+    """
+    levels = array("d")
+    odometers = array("d")
+    states: Counter[str] = Counter()
+    online = 0
+
+    for scooter in scooters.values():
+        if scooter.get("online"):
+            online += 1
+        if state := scooter.get("state"):
+            states[state] += 1
+        if (odometer := _as_float(scooter.get("odometer"))) is not None:
+            odometers.append(odometer)
+        batteries = scooter.get("batteries") or {}
+        battery0 = batteries.get("battery0") or {}
+        if (level := _as_float(battery0.get("level"))) is not None:
+            levels.append(level)
+
+    return FleetStats(
+        total=len(scooters),
+        online=online,
+        battery_mean=round(sum(levels) / len(levels), 1) if levels else None,
+        battery_min=min(levels) if levels else None,
+        odometer_km=round(sum(odometers) / 1000, 1) if odometers else None,
+        low_battery=sum(1 for level in levels if level < low_battery_threshold),
+        states=dict(states),
+    )
@@ -0,0 +1,325 @@
+"""Geofence engine for Sunshine Scooter integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import math
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .coordinator import SunshineDataUpdateCoordinator
+
+EVENT_GEOFENCE = f"{DOMAIN}_geofence"
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.{{entry_id}}.geofences"
+
+# Grid cell size in degrees, roughly 1 km north-south
+CELL_SIZE = 0.01
+# Fences spanning more cells than this are checked on every lookup instead
+MAX_FENCE_CELLS = 256
+
+METERS_PER_DEGREE = math.pi / 180 * 6371000.0
+
+FENCE_CIRCLE = "circle"
+FENCE_POLYGON = "polygon"
+
+
+@dataclass(frozen=True)
+class Fence:
+    """A circle or polygon geofence."""
+
+    fence_id: str
+    name: str
+    kind: str
+    latitude: float = 0.0
+    longitude: float = 0.0
+    radius: float = 0.0
+    points: tuple[tuple[float, float], ...] = ()
+    bbox: tuple[float, float, float, float] = field(init=False, compare=False)
+    area: float = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the bounding box and area."""
+        if self.kind == FENCE_CIRCLE:
+            dlat = self.radius / METERS_PER_DEGREE
+            dlng = dlat / max(math.cos(math.radians(self.latitude)), 1e-6)
+            bbox = (self.latitude - dlat, self.longitude - dlng, self.latitude + dlat, self.longitude + dlng)
+            area = math.pi * self.radius**2
+        else:
+            lats = [lat for lat, _ in self.points]
+            lngs = [lng for _, lng in self.points]
+            bbox = (min(lats), min(lngs), max(lats), max(lngs))
+            scale = math.cos(math.radians(sum(lats) / len(lats)))
+            area = abs(sum(
+                lng1 * lat2 - lng2 * lat1
+                for (lat1, lng1), (lat2, lng2) in zip(self.points, self.points[1:] + self.points[:1])
+            )) / 2 * scale * METERS_PER_DEGREE**2
+        object.__setattr__(self, "bbox", bbox)
+        object.__setattr__(self, "area", area)
+
+    def contains(self, lat: float, lng: float) -> bool:
+        """Return True if a position lies inside the fence."""
+        min_lat, min_lng, max_lat, max_lng = self.bbox
+        if not (min_lat <= lat <= max_lat and min_lng <= lng <= max_lng):
+            return False
+        if self.kind == FENCE_CIRCLE:
+            dy = (lat - self.latitude) * METERS_PER_DEGREE
+            dx = (lng - self.longitude) * METERS_PER_DEGREE * math.cos(math.radians(self.latitude))
+            return dx * dx + dy * dy <= self.radius * self.radius
+        # Ray casting
+        inside = False
+        points = self.points
+        j = len(points) - 1
+        for i, (lat_i, lng_i) in enumerate(points):
+            lat_j, lng_j = points[j]
+            if (lat_i > lat) != (lat_j > lat) and lng < (lng_j - lng_i) * (lat - lat_i) / (lat_j - lat_i) + lng_i:
+                inside = not inside
+            j = i
+        return inside
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stored form of the fence."""
+        if self.kind == FENCE_CIRCLE:
+            return {
+                "id": self.fence_id,
+                "name": self.name,
+                "latitude": self.latitude,
+                "longitude": self.longitude,
+                "radius": self.radius,
+            }
+        return {"id": self.fence_id, "name": self.name, "points": [list(point) for point in self.points]}
+
+
+def fence_from_dict(data: dict[str, Any]) -> Fence:
+    """Create a fence from its stored or service form."""
+    if points := data.get("points"):
+        if len(points) < 3:
+            raise ValueError("A polygon fence needs at least 3 points")
+        return Fence(
+            data["id"],
+            data["name"],
+            FENCE_POLYGON,
+            points=tuple((float(lat), float(lng)) for lat, lng in points),
+        )
+    if data.get("radius") is None or data.get("latitude") is None or data.get("longitude") is None:
+        raise ValueError("A fence needs either points or latitude, longitude and radius")
+    return Fence(
+        data["id"],
+        data["name"],
+        FENCE_CIRCLE,
+        latitude=float(data["latitude"]),
+        longitude=float(data["longitude"]),
+        radius=float(data["radius"]),
+    )
+
+
+def _cell(lat: float, lng: float) -> tuple[int, int]:
+    """Return the grid cell of a position."""
+    return math.floor(lat / CELL_SIZE), math.floor(lng / CELL_SIZE)
+
+
+class GeofenceEngine:
+    """Fences in a uniform grid index with per-scooter membership.
+
+    Each fence is registered in every grid cell its bounding box overlaps,
+    so a lookup only tests the few fences near a position. Membership is
+    kept per scooter and an update returns just the fences entered and
+    exited since the previous position.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the engine."""
+        self.fences: dict[str, Fence] = {}
+        self._grid: dict[tuple[int, int], set[str]] = {}
+        self._large: set[str] = set()
+        self._inside: dict[str, frozenset[str]] = {}
+        self._positions: dict[str, tuple[float, float]] = {}
+
+    def _cells(self, fence: Fence) -> list[tuple[int, int]]:
+        """Return the grid cells a fence overlaps."""
+        min_lat, min_lng, max_lat, max_lng = fence.bbox
+        (lat0, lng0), (lat1, lng1) = _cell(min_lat, min_lng), _cell(max_lat, max_lng)
+        if (lat1 - lat0 + 1) * (lng1 - lng0 + 1) > MAX_FENCE_CELLS:
+            return []
+        return [(lat, lng) for lat in range(lat0, lat1 + 1) for lng in range(lng0, lng1 + 1)]
+
+    def add(self, fence: Fence) -> None:
+        """Add or replace a fence."""
+        self.remove(fence.fence_id)
+        self.fences[fence.fence_id] = fence
+        if cells := self._cells(fence):
+            for cell in cells:
+                self._grid.setdefault(cell, set()).add(fence.fence_id)
+        else:
+            self._large.add(fence.fence_id)
+
+    def remove(self, fence_id: str) -> bool:
+        """Remove a fence, return False if it did not exist."""
+        if (fence := self.fences.pop(fence_id, None)) is None:
+            return False
+        self._large.discard(fence_id)
+        for cell in self._cells(fence):
+            if (ids := self._grid.get(cell)) is not None:
+                ids.discard(fence_id)
+                if not ids:
+                    del self._grid[cell]
+        return True
+
+    def lookup(self, lat: float, lng: float) -> frozenset[str]:
+        """Return the ids of all fences containing a position."""
+        candidates = self._grid.get(_cell(lat, lng), set())
+        return frozenset(
+            fence_id
+            for fence_id in (*candidates, *self._large)
+            if self.fences[fence_id].contains(lat, lng)
+        )
+
+    def inside(self, scooter_id: str) -> frozenset[str]:
+        """Return the fences a scooter is currently in."""
+        return self._inside.get(scooter_id, frozenset())
+
+    def update(self, scooter_id: str, lat: float, lng: float) -> tuple[set[str], set[str]]:
+        """Move a scooter, return the fences entered and exited."""
+        self._positions[scooter_id] = (lat, lng)
+        previous = self.inside(scooter_id)
+        current = self.lookup(lat, lng)
+        if current == previous:
+            return set(), set()
+        self._inside[scooter_id] = current
+        return set(current - previous), set(previous - current)
+
+    def reevaluate(self) -> dict[str, tuple[set[str], set[str]]]:
+        """Recheck every known position after the fences changed."""
+        return {
+            scooter_id: self.update(scooter_id, lat, lng)
+            for scooter_id, (lat, lng) in list(self._positions.items())
+        }
+
+
+def scooter_position(scooter: dict[str, Any]) -> tuple[float, float] | None:
+    """Return the position of a scooter, if it has a valid one."""
+    location = scooter.get("location") or {}
+    try:
+        return float(location["lat"]), float(location["lng"])
+    except (KeyError, ValueError, TypeError):
+        return None
+
+
+class GeofenceManager:
+    """Feed scooter positions into the engine and fire geofence events.
+
+    Fences are persisted per config entry. Positions are evaluated after
+    every coordinator update, but only for scooters whose location changed.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator: SunshineDataUpdateCoordinator) -> None:
+        """Initialize the manager."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self.engine = GeofenceEngine()
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STORAGE_VERSION,
+            STORAGE_KEY.format(entry_id=coordinator.config_entry.entry_id),
+        )
+        self._listeners: dict[str, list[CALLBACK_TYPE]] = {}
+
+    async def async_load(self) -> None:
+        """Load the stored fences."""
+        if stored := await self._store.async_load():
+            for data in stored.get("fences", []):
+                self.engine.add(fence_from_dict(data))
+
+    @callback
+    def async_start(self) -> Callable[[], None]:
+        """Evaluate the current positions and follow coordinator updates."""
+        # Membership at startup is not a transition, so no events are fired
+        for scooter_id, scooter in (self._coordinator.data or {}).items():
+            if (position := scooter_position(scooter)) is not None:
+                self.engine.update(scooter_id, *position)
+        for listeners in self._listeners.values():
+            for update_callback in list(listeners):
+                update_callback()
+        return self._coordinator.async_add_listener(self._async_coordinator_updated)
+
+    @callback
+    def _async_save(self) -> None:
+        """Persist the fences."""
+        self._store.async_delay_save(
+            lambda: {"fences": [fence.as_dict() for fence in self.engine.fences.values()]}, 1.0
+        )
+
+    @callback
+    def async_add_fence(self, fence: Fence) -> None:
+        """Add or replace a fence and recheck all scooters against it."""
+        self.engine.add(fence)
+        self._async_save()
+        self._async_fire(self.engine.reevaluate(), {})
+
+    @callback
+    def async_remove_fence(self, fence_id: str) -> bool:
+        """Remove a fence; scooters inside it exit."""
+        fence = self.engine.fences.get(fence_id)
+        if fence is None or not self.engine.remove(fence_id):
+            return False
+        self._async_save()
+        self._async_fire(self.engine.reevaluate(), {fence_id: fence})
+        return True
+
+    @callback
+    def current_fences(self, scooter_id: str) -> list[Fence]:
+        """Return the fences a scooter is in, most specific first."""
+        return sorted(
+            (self.engine.fences[fence_id] for fence_id in self.engine.inside(scooter_id)),
+            key=lambda fence: fence.area,
+        )
+
+    @callback
+    def async_add_listener(self, scooter_id: str, update_callback: CALLBACK_TYPE) -> Callable[[], None]:
+        """Listen for fence changes of a scooter."""
+        listeners = self._listeners.setdefault(scooter_id, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_coordinator_updated(self) -> None:
+        """Evaluate scooters whose location changed."""
+        transitions: dict[str, tuple[set[str], set[str]]] = {}
+        for scooter_id, scooter in (self._coordinator.data or {}).items():
+            if not self._coordinator.scooter_changed(scooter_id, ("location",)):
+                continue
+            if (position := scooter_position(scooter)) is not None:
+                transitions[scooter_id] = self.engine.update(scooter_id, *position)
+        self._async_fire(transitions, {})
+
+    @callback
+    def _async_fire(
+        self, transitions: dict[str, tuple[set[str], set[str]]], removed: dict[str, Fence]
+    ) -> None:
+        """Fire enter and exit events and notify the scooters' listeners."""
+        for scooter_id, (entered, exited) in transitions.items():
+            if not entered and not exited:
+                continue
+            for event, fence_ids in (("exit", exited), ("enter", entered)):
+                for fence_id in sorted(fence_ids):
+                    fence = self.engine.fences.get(fence_id) or removed[fence_id]
+                    self._hass.bus.async_fire(
+                        EVENT_GEOFENCE,
+                        {
+                            "scooter_id": scooter_id,
+                            "event": event,
+                            "fence_id": fence_id,
+                            "name": fence.name,
+                        },
+                    )
+            for update_callback in list(self._listeners.get(scooter_id, ())):
+                update_callback()
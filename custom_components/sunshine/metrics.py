@@ -0,0 +1,207 @@
+"""Request and poll instrumentation for Sunshine Scooter integration."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds of the latency histogram buckets in ms, the last one is open
+LATENCY_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Path segments following these are ids, folded so endpoints aggregate
+_ID_PARENTS = frozenset({"scooters", "trips"})
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Return an endpoint with ids and query replaced, e.g. /scooters/{id}/lock."""
+    parts = endpoint.partition("?")[0].split("/")
+    for index in range(1, len(parts)):
+        if parts[index - 1] in _ID_PARENTS:
+            parts[index] = "{id}"
+    return "/".join(parts)
+
+
+class Histogram:
+    """Durations counted into fixed buckets, in ms."""
+
+    __slots__ = ("buckets", "count", "total", "max", "last")
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last: float | None = None
+
+    def record(self, seconds: float) -> None:
+        """Count a duration given in seconds."""
+        value = seconds * 1000
+        self.buckets[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.count += 1
+        self.total += value
+        self.last = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean duration."""
+        return self.total / self.count if self.count else None
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the bucket bound below which a fraction of durations fall."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.buckets):
+            seen += count
+            if seen >= rank:
+                return float(bound)
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for diagnostics."""
+        labels = [f"<={bound}" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}"]
+        return {
+            "count": self.count,
+            "mean_ms": _round(self.mean),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": _round(self.max),
+            "last_ms": _round(self.last),
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+@dataclass
+class EndpointStats:
+    """Counters of the requests to one endpoint."""
+
+    latency: Histogram = field(default_factory=Histogram)
+    decode: Histogram = field(default_factory=Histogram)
+    # Decoding done on the event loop, blocking it meanwhile
+    loop_block: Histogram = field(default_factory=Histogram)
+    executor_decodes: int = 0
+    errors: int = 0
+    retries: int = 0
+    not_modified: int = 0
+    payload_bytes_total: int = 0
+    payload_bytes_max: int = 0
+    payload_bytes_last: int | None = None
+    # As transferred, i.e. compressed, where the server sent a length
+    wire_bytes_total: int = 0
+
+    def record_payload(self, size: int, wire_size: int | None = None) -> None:
+        """Count the size of a response body, decompressed and as transferred."""
+        self.wire_bytes_total += wire_size if wire_size is not None else size
+        self.payload_bytes_total += size
+        self.payload_bytes_last = size
+        if size > self.payload_bytes_max:
+            self.payload_bytes_max = size
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for diagnostics."""
+        return {
+            "latency": self.latency.as_dict(),
+            "decode": self.decode.as_dict(),
+            "loop_block": self.loop_block.as_dict(),
+            "executor_decodes": self.executor_decodes,
+            "errors": self.errors,
+            "retries": self.retries,
+            "not_modified": self.not_modified,
+            "payload_bytes_total": self.payload_bytes_total,
+            "payload_bytes_max": self.payload_bytes_max,
+            "payload_bytes_last": self.payload_bytes_last,
+            "wire_bytes_total": self.wire_bytes_total,
+        }
+
+
+@dataclass
+class PollStats:
+    """Durations of the phases of a poll.
+
+    Fetch is the time waiting on the backend, decode parsing the JSON,
+    process building and diffing the coordinator data and dispatch the
+    entity callbacks run by a data update, pushed updates included.
+    """
+
+    fetch: Histogram = field(default_factory=Histogram)
+    decode: Histogram = field(default_factory=Histogram)
+    process: Histogram = field(default_factory=Histogram)
+    dispatch: Histogram = field(default_factory=Histogram)
+    listeners_last: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the durations for diagnostics."""
+        return {
+            "fetch": self.fetch.as_dict(),
+            "decode": self.decode.as_dict(),
+            "process": self.process.as_dict(),
+            "dispatch": self.dispatch.as_dict(),
+            "listeners_last": self.listeners_last,
+        }
+
+
+@dataclass
+class SunshineMetrics:
+    """Instrumentation of one API client and its coordinator."""
+
+    endpoints: dict[str, EndpointStats] = field(default_factory=dict)
+    commands: dict[str, Histogram] = field(default_factory=dict)
+    poll: PollStats = field(default_factory=PollStats)
+
+    def endpoint(self, endpoint: str) -> EndpointStats:
+        """Return the counters of an endpoint."""
+        template = endpoint_template(endpoint)
+        if (stats := self.endpoints.get(template)) is None:
+            stats = self.endpoints[template] = EndpointStats()
+        return stats
+
+    def command(self, command: str) -> Histogram:
+        """Return the round-trip times of a command."""
+        if (histogram := self.commands.get(command)) is None:
+            histogram = self.commands[command] = Histogram()
+        return histogram
+
+    @property
+    def retries(self) -> int:
+        """Return the retries across all endpoints."""
+        return sum(stats.retries for stats in self.endpoints.values())
+
+    @property
+    def request_latency_p95(self) -> float | None:
+        """Return the 95th percentile latency of the slowest endpoint."""
+        values = [
+            p95
+            for stats in self.endpoints.values()
+            if (p95 := stats.latency.percentile(0.95)) is not None
+        ]
+        return max(values, default=None)
+
+    @property
+    def command_rtt_mean(self) -> float | None:
+        """Return the mean round-trip time across all commands."""
+        count = sum(histogram.count for histogram in self.commands.values())
+        if not count:
+            return None
+        return sum(histogram.total for histogram in self.commands.values()) / count
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all instrumentation for diagnostics."""
+        return {
+            "endpoints": {
+                endpoint: stats.as_dict() for endpoint, stats in sorted(self.endpoints.items())
+            },
+            "commands": {
+                command: histogram.as_dict()
+                for command, histogram in sorted(self.commands.items())
+            },
+            "poll": self.poll.as_dict(),
+        }
+
+
+def _round(value: float | None) -> float | None:
+    """Round a duration for display."""
+    return round(value, 2) if value is not None else None
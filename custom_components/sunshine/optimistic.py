@@ -0,0 +1,63 @@
+"""Expected state after commands for Sunshine Scooter integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+# Fields each command is expected to change, built from the command arguments
+EXPECTED_STATE: dict[str, Callable[[tuple[Any, ...]], dict[str, Any]]] = {
+    "lock": lambda args: {"state": "locked"},
+    "unlock": lambda args: {"state": "parked"},
+    "alarm_arm": lambda args: {"alarm_state": "armed"},
+    "alarm_disarm": lambda args: {"alarm_state": "disarmed"},
+    "alarm_stop": lambda args: {"alarm_triggered": False},
+    "blinkers": lambda args: {"blinkers": args[0]},
+    "hibernate": lambda args: {"state": "hibernating"},
+}
+
+# Fields derived from a patched field that would contradict the patch
+DERIVED_FIELDS = {
+    "alarm_state": ("alarm_state_humanized",),
+}
+
+
+# Reported values confirming an expected one they differ from, by field
+CONFIRMING_VALUES: dict[str, dict[Any, tuple[Any, ...]]] = {
+    # A locked scooter may already have dropped to stand-by, an unlocked one
+    # may be ready to drive; the lock switch reads them the same
+    "state": {"locked": ("stand-by",), "parked": ("ready-to-drive",)},
+}
+
+
+def expected_patch(command: str, args: tuple[Any, ...], response: Any) -> dict[str, Any] | None:
+    """Return the fields a successful command is expected to change.
+
+    Values the server reports in the command response take precedence
+    over the assumed outcome.
+    """
+    if (patch_fn := EXPECTED_STATE.get(command)) is None:
+        return None
+    patch = patch_fn(args)
+    if isinstance(response, dict):
+        for key in patch:
+            if response.get(key) is not None:
+                patch[key] = response[key]
+    return patch
+
+
+def apply_patch(scooter: dict[str, Any], patch: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of the scooter data with a patch applied."""
+    patched = {**scooter, **patch}
+    for key in patch:
+        for derived in DERIVED_FIELDS.get(key, ()):
+            patched.pop(derived, None)
+    return patched
+
+
+def patch_confirmed(scooter: dict[str, Any], patch: dict[str, Any]) -> bool:
+    """Return True if real scooter data shows the patched values or equivalents."""
+    return all(
+        scooter.get(key) == value
+        or (key in CONFIRMING_VALUES and scooter.get(key) in CONFIRMING_VALUES[key].get(value, ()))
+        for key, value in patch.items()
+    )
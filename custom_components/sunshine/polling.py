@@ -0,0 +1,93 @@
+"""Adaptive poll interval selection for Sunshine Scooter integration."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import random
+from typing import Any
+
+# Poll cadences, from most to least urgent
+INTERVAL_ACTIVE = timedelta(seconds=5)
+INTERVAL_PARKED = timedelta(seconds=30)
+INTERVAL_IDLE = timedelta(seconds=120)
+INTERVAL_DORMANT = timedelta(minutes=10)
+
+# Backstop poll while the telemetry stream is connected
+INTERVAL_STREAMING = timedelta(minutes=5)
+
+# How long to keep polling fast after a command was sent
+COMMAND_BOOST = timedelta(seconds=60)
+
+# Spread of the poll interval so entries sharing a backend drift apart
+INTERVAL_JITTER = 0.1
+
+# A scooter that has not reported for this long is treated as dormant
+STALE_AFTER = timedelta(hours=1)
+
+ACTIVE_STATES = {"ready-to-drive", "booting", "updating"}
+PARKED_STATES = {"parked", "waiting-seatbox", "shutting-down"}
+IDLE_STATES = {"stand-by", "locked"}
+DORMANT_STATES = {"hibernating", "hibernating-imminent", "waiting-hibernation", "off"}
+
+
+def _parse_timestamp(value: Any) -> datetime | None:
+    """Parse an ISO 8601 timestamp from the API."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def scooter_poll_interval(scooter: dict[str, Any], now: datetime) -> timedelta:
+    """Return the poll interval a single scooter asks for."""
+    state = scooter.get("state")
+
+    try:
+        moving = float(scooter.get("speed") or 0) > 0
+    except (ValueError, TypeError):
+        moving = False
+
+    if moving or state in ACTIVE_STATES:
+        return INTERVAL_ACTIVE
+
+    if state in DORMANT_STATES:
+        return INTERVAL_DORMANT
+
+    if scooter.get("online") is False:
+        last_seen = _parse_timestamp(scooter.get("last_seen_at"))
+        if last_seen is None or now - last_seen > STALE_AFTER:
+            return INTERVAL_DORMANT
+        return INTERVAL_IDLE
+
+    if state in IDLE_STATES:
+        return INTERVAL_IDLE
+
+    # Parked and anything we do not recognise keep the classic cadence
+    return INTERVAL_PARKED
+
+
+def fleet_poll_interval(
+    scooters: dict[str, dict[str, Any]],
+    now: datetime,
+    boost_until: datetime | None = None,
+) -> timedelta:
+    """Return the poll interval for the whole fleet.
+
+    The fleet is fetched in one request, so the most urgent scooter wins.
+    """
+    if boost_until is not None and now < boost_until:
+        return INTERVAL_ACTIVE
+
+    if not scooters:
+        return INTERVAL_PARKED
+
+    return min(scooter_poll_interval(scooter, now) for scooter in scooters.values())
+
+
+def jittered(interval: timedelta) -> timedelta:
+    """Return the interval randomly stretched or shrunk by INTERVAL_JITTER."""
+    return interval * random.uniform(1 - INTERVAL_JITTER, 1 + INTERVAL_JITTER)
@@ -0,0 +1,127 @@
+"""Field projection of fleet polls for Sunshine Scooter integration."""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .binary_sensor import BINARY_SENSOR_TYPES
+from .coordinator import SunshineDataUpdateCoordinator
+from .sensor import SENSOR_TYPES
+
+# Fields read regardless of which sensors are enabled: device info, poll
+# cadence, fleet sensors, optimistic state, geofences and the entities
+# without a description (device tracker, switches, selects)
+CORE_FIELDS = (
+    "id",
+    "name",
+    "vin",
+    "model",
+    "radio_gaga_version",
+    "state",
+    "online",
+    "speed",
+    "last_seen_at",
+    "odometer",
+    "location",
+    "location_accuracy",
+    "color",
+    "alarm_state",
+    "alarm_triggered",
+    "blinkers",
+    "batteries.battery0.level",
+)
+
+# Platforms whose descriptions name the payload paths they read
+DESCRIBED_PLATFORMS: dict[str, Sequence[Any]] = {
+    Platform.SENSOR: SENSOR_TYPES,
+    Platform.BINARY_SENSOR: BINARY_SENSOR_TYPES,
+}
+
+@callback
+def async_needed_fields(
+    hass: HomeAssistant, coordinator: SunshineDataUpdateCoordinator
+) -> frozenset[str] | None:
+    """Return the fields enabled entities read, None if that is everything.
+
+    An entity counts as enabled unless its registry entry is disabled for
+    every scooter; entities not registered yet count as their default.
+    """
+    registry = er.async_get(hass)
+    disabled: dict[tuple[str, str], bool] = {
+        (entry.domain, entry.unique_id): entry.disabled
+        for entry in er.async_entries_for_config_entry(
+            registry, coordinator.config_entry.entry_id
+        )
+    }
+    scooter_ids = list(coordinator.data or {})
+
+    fields = set(CORE_FIELDS)
+    for platform, descriptions in DESCRIBED_PLATFORMS.items():
+        for description in descriptions:
+            enabled = any(
+                not disabled[key]
+                if (key := (platform, f"{scooter_id}_{description.key}")) in disabled
+                else description.entity_registry_enabled_default
+                for scooter_id in scooter_ids
+            )
+            if not enabled and scooter_ids:
+                continue
+            if description.paths is None:
+                return None
+            fields.update(description.paths)
+    return frozenset(fields)
+
+
+@callback
+def async_track_fields(
+    hass: HomeAssistant, coordinator: SunshineDataUpdateCoordinator
+) -> CALLBACK_TYPE:
+    """Keep the polled fields in line with the enabled entities."""
+    scheduled = False
+
+    @callback
+    def _async_update_fields() -> None:
+        nonlocal scheduled
+        scheduled = False
+        coordinator.async_set_fields(async_needed_fields(hass, coordinator))
+
+    @callback
+    def _async_schedule_update(*_: Any) -> None:
+        """Recompute once for a burst of changes, e.g. disabling many entities."""
+        nonlocal scheduled
+        if not scheduled:
+            scheduled = True
+            hass.loop.call_soon(_async_update_fields)
+
+    @callback
+    def _async_filter(event_data: er.EventEntityRegistryUpdatedData) -> bool:
+        """Pass removals and (dis)abling of this entry's entities.
+
+        New entities need no recompute, unregistered ones count as their
+        default already.
+        """
+        if event_data["action"] == "remove":
+            return True
+        if event_data["action"] != "update" or "disabled_by" not in event_data["changes"]:
+            return False
+        entry = er.async_get(hass).async_get(event_data["entity_id"])
+        return entry is not None and entry.config_entry_id == coordinator.config_entry.entry_id
+
+    _async_update_fields()
+    unsubscribers = [
+        hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, _async_schedule_update, event_filter=_async_filter
+        ),
+        coordinator.async_add_scooter_listener(_async_schedule_update),
+    ]
+
+    @callback
+    def _async_unsubscribe() -> None:
+        for unsubscribe in unsubscribers:
+            unsubscribe()
+
+    return _async_unsubscribe
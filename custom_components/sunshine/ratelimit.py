@@ -0,0 +1,102 @@
+"""Shared request rate limiting for Sunshine Scooter integration."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+
+from homeassistant.core import HomeAssistant, callback
+
+# Lower values are served first
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+PRIORITY_BACKGROUND = 2
+
+DEFAULT_RATE = 2.0
+DEFAULT_BURST = 10
+
+# Schedulers by base URL, shared by the config entries of one backend
+DATA_SCHEDULERS = "sunshine_schedulers"
+
+
+class RequestScheduler:
+    """Token bucket with priority lanes for all clients of one backend.
+
+    Requests take a token each; tokens refill at a steady rate up to the
+    burst size. While requests are waiting, free tokens always go to the
+    highest priority waiter first, so commands overtake queued polls and
+    background syncs.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST) -> None:
+        """Initialize the scheduler."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._wakeup: asyncio.TimerHandle | None = None
+        self.users = 0
+
+    async def acquire(self, priority: int) -> None:
+        """Wait until a request of the given priority may be sent."""
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        self._dispatch()
+        # A cancelled waiter stays in the heap and is skipped on dispatch
+        await future
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def _wake(self) -> None:
+        """Dispatch once the next token is due."""
+        self._wakeup = None
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Hand out available tokens by priority and wait for the next one."""
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+
+        if self._waiters and self._wakeup is None:
+            delay = (1 - self._tokens) / self._rate
+            self._wakeup = asyncio.get_running_loop().call_later(delay, self._wake)
+
+
+@callback
+def async_acquire_scheduler(hass: HomeAssistant, base_url: str) -> RequestScheduler:
+    """Return the scheduler shared by every config entry of a backend."""
+    schedulers: dict[str, RequestScheduler] = hass.data.setdefault(DATA_SCHEDULERS, {})
+    if (scheduler := schedulers.get(base_url)) is None:
+        scheduler = schedulers[base_url] = RequestScheduler()
+    scheduler.users += 1
+    return scheduler
+
+
+@callback
+def async_release_scheduler(hass: HomeAssistant, base_url: str) -> None:
+    """Release a backend's scheduler, dropping it once unused."""
+    schedulers: dict[str, RequestScheduler] = hass.data.get(DATA_SCHEDULERS, {})
+    if (scheduler := schedulers.get(base_url)) is None:
+        return
+    scheduler.users -= 1
+    if scheduler.users <= 0:
+        del schedulers[base_url]
+        if not schedulers:
+            del hass.data[DATA_SCHEDULERS]
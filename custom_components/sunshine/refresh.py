@@ -0,0 +1,97 @@
+"""Refresh coalescing for Sunshine Scooter integration."""
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+import heapq
+import logging
+import time
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+_LOGGER = logging.getLogger(__name__)
+
+# Commands sent within this window share the immediate refresh
+COALESCE_WINDOW = 0.5
+
+# Second refresh to catch state changes that take a while to be reported
+FOLLOW_UP_DELAY = 10.0
+
+# A fetch satisfies every demand due within this much time after it
+DEADLINE_TOLERANCE = 2.0
+
+
+class RefreshCoalescer:
+    """Batch refresh demands from commands into as few fetches as possible.
+
+    Every demand is a deadline for one scooter. A single fleet fetch
+    satisfies all deadlines that are due up to DEADLINE_TOLERANCE later,
+    so commands on many scooters share their refreshes.
+    """
+
+    def __init__(self, hass: HomeAssistant, refresh: Callable[[], Awaitable[None]]) -> None:
+        """Initialize the coalescer."""
+        self._hass = hass
+        self._refresh = refresh
+        # Heap of (deadline, requested at, scooter id)
+        self._deadlines: list[tuple[float, float, str]] = []
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_request(self, scooter_id: str, immediate: bool = True, follow_up: bool = True) -> None:
+        """Request a refresh soon and/or a follow-up refresh for a scooter."""
+        now = time.monotonic()
+        if immediate:
+            heapq.heappush(self._deadlines, (now + COALESCE_WINDOW, now, scooter_id))
+        if follow_up:
+            heapq.heappush(self._deadlines, (now + FOLLOW_UP_DELAY, now, scooter_id))
+        self._async_schedule()
+
+    @callback
+    def async_refreshed(self, started: float) -> None:
+        """Mark pending demands as satisfied by a fetch started at a monotonic time."""
+        self._async_drop_satisfied(started)
+        self._async_schedule()
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop all pending demands."""
+        self._deadlines.clear()
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @callback
+    def _async_drop_satisfied(self, started: float) -> None:
+        """Remove all demands a fetch started at the given time satisfies.
+
+        Demands made after the fetch started are kept, its data may predate them.
+        """
+        horizon = started + DEADLINE_TOLERANCE
+        self._deadlines = [
+            demand for demand in self._deadlines
+            if demand[0] > horizon or demand[1] > started
+        ]
+        heapq.heapify(self._deadlines)
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Arm the timer for the earliest pending deadline."""
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if not self._deadlines:
+            return
+        delay = max(self._deadlines[0][0] - time.monotonic(), 0)
+        self._unsub_timer = async_call_later(self._hass, delay, self._async_fire)
+
+    @callback
+    def _async_fire(self, _now) -> None:
+        """Fetch once for every deadline that is due."""
+        self._unsub_timer = None
+        now = time.monotonic()
+        due = {demand[2] for demand in self._deadlines if demand[0] <= now + DEADLINE_TOLERANCE}
+        _LOGGER.debug("Coalesced refresh for scooters %s", ", ".join(sorted(due)))
+        self._async_drop_satisfied(now)
+        self._async_schedule()
+        self._hass.async_create_task(self._refresh())
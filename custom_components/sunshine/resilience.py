@@ -0,0 +1,156 @@
+"""Retry policies and circuit breaker for Sunshine Scooter integration."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import logging
+import random
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+# A probe that never reported back is given up on after this long
+PROBE_TIMEOUT = 60.0
+
+
+class SunshineCircuitOpenError(Exception):
+    """Raised instead of sending a request while the backend is considered down."""
+
+    def __init__(self, retry_in: float) -> None:
+        """Initialize the error."""
+        super().__init__(f"Sunshine API unavailable, next attempt in {retry_in:.0f}s")
+        self.retry_in = retry_in
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and on what a request may be retried."""
+
+    attempts: int
+    retry_statuses: frozenset[int]
+    # Retry errors after which the server may already have acted on the request
+    retry_ambiguous_errors: bool
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+
+    def backoff(self, attempt: int) -> float:
+        """Return a full-jitter exponential delay before the given retry."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+# Reads are idempotent and retried on anything transient
+READ_POLICY = RetryPolicy(
+    attempts=3,
+    retry_statuses=frozenset({429, 500, 502, 503, 504}),
+    retry_ambiguous_errors=True,
+)
+
+# Commands are only retried when the server certainly did not act on them
+COMMAND_POLICY = RetryPolicy(
+    attempts=2,
+    retry_statuses=frozenset({429, 503}),
+    retry_ambiguous_errors=False,
+)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header into seconds from now."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class CircuitBreaker:
+    """Fail fast while the backend is down and probe it periodically.
+
+    After failure_threshold consecutive failures the breaker opens and
+    requests fail immediately. Once the reset timeout passed a single probe
+    is let through; success closes the breaker, failure reopens it with a
+    doubled timeout.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        max_reset_timeout: float = 600.0,
+    ) -> None:
+        """Initialize the breaker."""
+        self.state = BREAKER_CLOSED
+        self._failure_threshold = failure_threshold
+        self._base_reset_timeout = reset_timeout
+        self._max_reset_timeout = max_reset_timeout
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._open_until = 0.0
+        self._probe_started = 0.0
+
+    @property
+    def retry_in(self) -> float:
+        """Return seconds until requests are let through again."""
+        if self.state == BREAKER_CLOSED:
+            return 0.0
+        return max(self._open_until - time.monotonic(), 0.0)
+
+    @property
+    def probing(self) -> bool:
+        """Return True while the single probe request is under way."""
+        return self.state == BREAKER_HALF_OPEN
+
+    def allow(self) -> bool:
+        """Return True if a request may be sent now."""
+        if self.state == BREAKER_CLOSED:
+            return True
+        now = time.monotonic()
+        if (self.state == BREAKER_OPEN and now >= self._open_until) or (
+            self.state == BREAKER_HALF_OPEN and now - self._probe_started > PROBE_TIMEOUT
+        ):
+            _LOGGER.debug("Probing Sunshine API")
+            self.state = BREAKER_HALF_OPEN
+            self._probe_started = now
+            return True
+        # Open, or a probe is already under way
+        return False
+
+    def record_success(self) -> None:
+        """Record a request that reached a healthy backend."""
+        if self.state != BREAKER_CLOSED:
+            _LOGGER.info("Sunshine API reachable again")
+        self.state = BREAKER_CLOSED
+        self._failures = 0
+        self._reset_timeout = self._base_reset_timeout
+
+    def record_failure(self, retry_after: float | None = None) -> None:
+        """Record a failed request, opening the breaker if needed.
+
+        A Retry-After from the server opens the breaker for exactly that long.
+        """
+        self._failures += 1
+        if retry_after:
+            self._open(retry_after)
+        elif self.state == BREAKER_HALF_OPEN:
+            self._reset_timeout = min(self._reset_timeout * 2, self._max_reset_timeout)
+            self._open(self._reset_timeout)
+        elif self.state == BREAKER_CLOSED and self._failures >= self._failure_threshold:
+            self._open(self._reset_timeout)
+
+    def _open(self, timeout: float) -> None:
+        """Let no requests through for the given number of seconds."""
+        _LOGGER.warning("Sunshine API unavailable, pausing requests for %.0fs", timeout)
+        self.state = BREAKER_OPEN
+        self._open_until = time.monotonic() + timeout
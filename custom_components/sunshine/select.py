@@ -10,6 +10,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .commands import SunshineCommandSuperseded
 from .const import (
     BLINKER_BOTH,
     BLINKER_LEFT,
@@ -21,7 +22,7 @@ from .const import (
     SOUND_FIND_ME,
 )
 from .coordinator import SunshineDataUpdateCoordinator
-from .entity import SunshineEntity
+from .entity import SunshineEntity, async_add_scooter_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,6 +32,8 @@ class SunshineSelectEntityDescription(SelectEntityDescription):
     
     api_method: str | None = None
     api_param_key: str | None = None
+    # Payload paths the current option is read from
+    paths: tuple[str, ...] = ()
 
 
 SELECT_TYPES: list[SunshineSelectEntityDescription] = [
@@ -41,6 +44,7 @@ SELECT_TYPES: list[SunshineSelectEntityDescription] = [
         options=[BLINKER_OFF, BLINKER_LEFT, BLINKER_RIGHT, BLINKER_BOTH],
         api_method="blinkers",
         api_param_key="state",
+        paths=("blinkers",),
     ),
     SunshineSelectEntityDescription(
         key="sound",
@@ -63,15 +67,14 @@ async def async_setup_entry(
     api = data["api"]
     coordinator = data["coordinator"]
     
-    entities: list[SunshineSelect] = []
-    
-    for scooter_id in coordinator.data:
-        for description in SELECT_TYPES:
-            entities.append(
-                SunshineSelect(api, coordinator, scooter_id, description)
-            )
-    
-    async_add_entities(entities)
+    def _scooter_entities(scooter_id: str) -> list[SunshineSelect]:
+        """Return the select entities of one scooter."""
+        return [
+            SunshineSelect(api, coordinator, scooter_id, description)
+            for description in SELECT_TYPES
+        ]
+
+    async_add_scooter_entities(config_entry, coordinator, async_add_entities, _scooter_entities)
 
 
 class SunshineSelect(SunshineEntity, SelectEntity):
@@ -94,6 +97,7 @@ class SunshineSelect(SunshineEntity, SelectEntity):
         self._attr_unique_id = f"{scooter_id}_{description.key}"
         self._attr_options = description.options
         self._attr_current_option = description.options[0]
+        self._watched_paths = description.paths
     
     @property
     def current_option(self) -> str | None:
@@ -106,11 +110,13 @@ class SunshineSelect(SunshineEntity, SelectEntity):
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
         try:
-            api_method = getattr(self.api, self.entity_description.api_method)
-            await api_method(self.scooter_id, option)
+            await self.coordinator.async_send_command(
+                self.scooter_id, self.entity_description.api_method, option
+            )
             self._attr_current_option = option
-            await self.coordinator.async_request_refresh()
-            self.coordinator.async_request_delayed_refresh()
+            self.async_write_ha_state()
+        except SunshineCommandSuperseded:
+            _LOGGER.debug("Command for scooter %s superseded by a later one", self.scooter_id)
         except Exception as err:
             _LOGGER.error(
                 "Failed to set %s to %s for scooter %s: %s",
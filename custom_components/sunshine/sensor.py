@@ -13,12 +13,23 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .coordinator import SunshineDataUpdateCoordinator
-from .entity import SunshineEntity
+from .entity import (
+    SunshineEntity,
+    SunshineFleetEntity,
+    SunshinePollEntity,
+    async_add_scooter_entities,
+)
+from .fleet import FleetStats
+from .geofence import GeofenceManager
+from .metrics import Histogram, SunshineMetrics
+from .session import ConnectionStats
+from .trip_stats import PERIOD_DAY, PERIOD_MONTH, PERIOD_WEEK, PeriodTotals, TripStatistics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -63,6 +74,8 @@ class SunshineSensorEntityDescription(SensorEntityDescription):
     """Describes a Sunshine sensor entity."""
 
     value_fn: Callable[[dict], Any] | None = None
+    # Payload paths read by value_fn, None meaning the whole scooter
+    paths: tuple[str, ...] | None = None
 
 
 SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
@@ -74,6 +87,7 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         device_class=SensorDeviceClass.BATTERY,
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda d: _get_battery_field(d, "battery0", "level"),
+        paths=("batteries.battery0.level",),
     ),
     SunshineSensorEntityDescription(
         key="speed",
@@ -83,6 +97,7 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:speedometer",
         value_fn=lambda d: d.get("speed"),
+        paths=("speed",),
     ),
     SunshineSensorEntityDescription(
         key="odometer",
@@ -92,12 +107,14 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:counter",
         value_fn=_get_odometer_km,
+        paths=("odometer",),
     ),
     SunshineSensorEntityDescription(
         key="state",
         name="Status",
         icon="mdi:information-outline",
         value_fn=lambda d: d.get("state"),
+        paths=("state",),
     ),
     # --- Alarm ---
     SunshineSensorEntityDescription(
@@ -105,6 +122,7 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         name="Alarm State",
         icon="mdi:shield-alert",
         value_fn=lambda d: d.get("alarm_state_humanized") or d.get("alarm_state"),
+        paths=("alarm_state_humanized", "alarm_state"),
     ),
     # --- Vehicle state ---
     SunshineSensorEntityDescription(
@@ -112,12 +130,14 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         name="Kickstand",
         icon="mdi:scooter",
         value_fn=lambda d: d.get("kickstand"),
+        paths=("kickstand",),
     ),
     SunshineSensorEntityDescription(
         key="seatbox",
         name="Seatbox",
         icon="mdi:treasure-chest",
         value_fn=lambda d: d.get("seatbox"),
+        paths=("seatbox",),
     ),
     SunshineSensorEntityDescription(
         key="last_seen_at",
@@ -125,6 +145,7 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         device_class=SensorDeviceClass.TIMESTAMP,
         icon="mdi:clock-outline",
         value_fn=lambda d: datetime.fromisoformat(d["last_seen_at"]) if d.get("last_seen_at") else None,
+        paths=("last_seen_at",),
     ),
     # --- Battery 0 details ---
     SunshineSensorEntityDescription(
@@ -134,6 +155,7 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda d: _get_battery_field(d, "battery0", "voltage"),
+        paths=("batteries.battery0.voltage",),
     ),
     SunshineSensorEntityDescription(
         key="battery0_soh",
@@ -142,6 +164,7 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         icon="mdi:battery-heart-variant",
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda d: _get_battery_field(d, "battery0", "soh"),
+        paths=("batteries.battery0.soh",),
     ),
     SunshineSensorEntityDescription(
         key="battery0_cycle_count",
@@ -149,12 +172,14 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         icon="mdi:battery-sync",
         state_class=SensorStateClass.TOTAL_INCREASING,
         value_fn=lambda d: _get_battery_field(d, "battery0", "cycle_count"),
+        paths=("batteries.battery0.cycle_count",),
     ),
     SunshineSensorEntityDescription(
         key="battery0_state",
         name="Battery State",
         icon="mdi:battery-unknown",
         value_fn=lambda d: _get_battery_field(d, "battery0", "state"),
+        paths=("batteries.battery0.state",),
     ),
     # --- Battery 1 ---
     SunshineSensorEntityDescription(
@@ -164,6 +189,7 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         device_class=SensorDeviceClass.BATTERY,
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda d: _get_battery_field(d, "battery1", "level"),
+        paths=("batteries.battery1.level",),
     ),
     SunshineSensorEntityDescription(
         key="battery1_voltage",
@@ -172,6 +198,7 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda d: _get_battery_field(d, "battery1", "voltage"),
+        paths=("batteries.battery1.voltage",),
     ),
     SunshineSensorEntityDescription(
         key="battery1_soh",
@@ -180,6 +207,7 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         icon="mdi:battery-heart-variant",
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda d: _get_battery_field(d, "battery1", "soh"),
+        paths=("batteries.battery1.soh",),
     ),
     SunshineSensorEntityDescription(
         key="battery1_cycle_count",
@@ -187,12 +215,14 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         icon="mdi:battery-sync",
         state_class=SensorStateClass.TOTAL_INCREASING,
         value_fn=lambda d: _get_battery_field(d, "battery1", "cycle_count"),
+        paths=("batteries.battery1.cycle_count",),
     ),
     SunshineSensorEntityDescription(
         key="battery1_state",
         name="Battery 1 State",
         icon="mdi:battery-unknown",
         value_fn=lambda d: _get_battery_field(d, "battery1", "state"),
+        paths=("batteries.battery1.state",),
     ),
     # --- Aux battery ---
     SunshineSensorEntityDescription(
@@ -202,6 +232,7 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         device_class=SensorDeviceClass.BATTERY,
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda d: _get_battery_field(d, "aux", "level"),
+        paths=("batteries.aux.level",),
     ),
     SunshineSensorEntityDescription(
         key="aux_battery_voltage",
@@ -210,6 +241,7 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda d: _get_battery_field(d, "aux", "voltage"),
+        paths=("batteries.aux.voltage",),
     ),
     # --- CBB battery ---
     SunshineSensorEntityDescription(
@@ -219,6 +251,7 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         device_class=SensorDeviceClass.BATTERY,
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda d: _get_battery_field(d, "cbb", "level"),
+        paths=("batteries.cbb.level",),
     ),
     SunshineSensorEntityDescription(
         key="cbb_battery_soh",
@@ -227,6 +260,7 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         icon="mdi:battery-heart-variant",
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda d: _get_battery_field(d, "cbb", "soh"),
+        paths=("batteries.cbb.soh",),
     ),
     SunshineSensorEntityDescription(
         key="cbb_battery_cycle_count",
@@ -234,6 +268,7 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         icon="mdi:battery-sync",
         state_class=SensorStateClass.TOTAL_INCREASING,
         value_fn=lambda d: _get_battery_field(d, "cbb", "cycle_count"),
+        paths=("batteries.cbb.cycle_count",),
     ),
     # --- Engine ---
     SunshineSensorEntityDescription(
@@ -243,6 +278,7 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda d: _get_engine_field(d, "temperature"),
+        paths=("telemetry.engine.temperature",),
     ),
     SunshineSensorEntityDescription(
         key="engine_rpm",
@@ -250,6 +286,7 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         icon="mdi:engine",
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda d: _get_engine_field(d, "motor_rpm"),
+        paths=("telemetry.engine.motor_rpm",),
     ),
     # --- Connectivity ---
     SunshineSensorEntityDescription(
@@ -257,7 +294,260 @@ SENSOR_TYPES: list[SunshineSensorEntityDescription] = [
         name="Signal Quality",
         icon="mdi:signal",
         value_fn=lambda d: _get_connectivity_field(d, "signal_quality"),
+        paths=("telemetry.connectivity.signal_quality",),
+    ),
+]
+
+
+@dataclass(frozen=True, kw_only=True)
+class SunshineFleetSensorEntityDescription(SensorEntityDescription):
+    """Describes a Sunshine fleet aggregate sensor entity."""
+
+    value_fn: Callable[[FleetStats], Any]
+    attributes_fn: Callable[[FleetStats], dict[str, Any]] | None = None
+
+
+FLEET_SENSOR_TYPES: list[SunshineFleetSensorEntityDescription] = [
+    SunshineFleetSensorEntityDescription(
+        key="scooters",
+        name="Scooters",
+        icon="mdi:scooter",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda f: f.total,
+        attributes_fn=lambda f: {"states": f.states},
+    ),
+    SunshineFleetSensorEntityDescription(
+        key="online",
+        name="Scooters Online",
+        icon="mdi:access-point-network",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda f: f.online,
+    ),
+    SunshineFleetSensorEntityDescription(
+        key="battery_mean",
+        name="Average Battery Level",
+        native_unit_of_measurement="%",
+        device_class=SensorDeviceClass.BATTERY,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda f: f.battery_mean,
+    ),
+    SunshineFleetSensorEntityDescription(
+        key="battery_min",
+        name="Lowest Battery Level",
+        native_unit_of_measurement="%",
+        device_class=SensorDeviceClass.BATTERY,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda f: f.battery_min,
+    ),
+    SunshineFleetSensorEntityDescription(
+        key="low_battery",
+        name="Scooters Low on Battery",
+        icon="mdi:battery-alert",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda f: f.low_battery,
+    ),
+    SunshineFleetSensorEntityDescription(
+        key="odometer",
+        name="Total Odometer",
+        native_unit_of_measurement="km",
+        device_class=SensorDeviceClass.DISTANCE,
+        state_class=SensorStateClass.TOTAL,
+        icon="mdi:counter",
+        value_fn=lambda f: f.odometer_km,
+    ),
+]
+
+
+@dataclass(frozen=True, kw_only=True)
+class SunshineTripSensorEntityDescription(SensorEntityDescription):
+    """Describes a Sunshine rolling trip statistics sensor entity."""
+
+    period: str
+    value_fn: Callable[[PeriodTotals], Any]
+
+
+@dataclass(frozen=True, kw_only=True)
+class SunshineConnectionSensorEntityDescription(SensorEntityDescription):
+    """Describes a Sunshine connection pool diagnostic sensor entity."""
+
+    value_fn: Callable[[ConnectionStats], Any]
+
+
+CONNECTION_SENSOR_TYPES: list[SunshineConnectionSensorEntityDescription] = [
+    SunshineConnectionSensorEntityDescription(
+        key="connections_created",
+        name="Connections Opened",
+        icon="mdi:lan-connect",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda c: c.connections_created,
+    ),
+    SunshineConnectionSensorEntityDescription(
+        key="connection_reuse",
+        name="Connection Reuse",
+        native_unit_of_measurement="%",
+        icon="mdi:recycle",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda c: round(c.reuse_ratio * 100, 1) if c.reuse_ratio is not None else None,
+    ),
+    SunshineConnectionSensorEntityDescription(
+        key="connect_time",
+        name="Connection Setup Time",
+        native_unit_of_measurement="ms",
+        device_class=SensorDeviceClass.DURATION,
+        icon="mdi:timer-lock-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda c: round(c.connect_time_mean, 1) if c.connect_time_mean is not None else None,
+    ),
+]
+
+
+def _ms(value: float | None) -> float | None:
+    """Round a duration in ms for display."""
+    return round(value, 1) if value is not None else None
+
+
+@dataclass(frozen=True, kw_only=True)
+class SunshineMetricSensorEntityDescription(SensorEntityDescription):
+    """Describes a Sunshine request and poll instrumentation sensor entity."""
+
+    value_fn: Callable[[SunshineMetrics], Any]
+    # Histogram shown in the attributes, if any
+    histogram_fn: Callable[[SunshineMetrics], Histogram] | None = None
+
+
+METRIC_SENSOR_TYPES: list[SunshineMetricSensorEntityDescription] = [
+    SunshineMetricSensorEntityDescription(
+        key="poll_fetch_time",
+        name="Poll Fetch Time",
+        native_unit_of_measurement="ms",
+        device_class=SensorDeviceClass.DURATION,
+        icon="mdi:cloud-download-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda m: _ms(m.poll.fetch.last),
+        histogram_fn=lambda m: m.poll.fetch,
+    ),
+    SunshineMetricSensorEntityDescription(
+        key="poll_decode_time",
+        name="Poll Decode Time",
+        native_unit_of_measurement="ms",
+        device_class=SensorDeviceClass.DURATION,
+        icon="mdi:code-json",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda m: _ms(m.poll.decode.last),
+        histogram_fn=lambda m: m.poll.decode,
+    ),
+    SunshineMetricSensorEntityDescription(
+        key="poll_dispatch_time",
+        name="Update Dispatch Time",
+        native_unit_of_measurement="ms",
+        device_class=SensorDeviceClass.DURATION,
+        icon="mdi:call-split",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda m: _ms(m.poll.dispatch.last),
+        histogram_fn=lambda m: m.poll.dispatch,
+    ),
+    SunshineMetricSensorEntityDescription(
+        key="request_latency_p95",
+        name="Request Latency (95th Percentile)",
+        native_unit_of_measurement="ms",
+        device_class=SensorDeviceClass.DURATION,
+        icon="mdi:timer-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda m: m.request_latency_p95,
+    ),
+    SunshineMetricSensorEntityDescription(
+        key="request_retries",
+        name="Request Retries",
+        icon="mdi:restart",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda m: m.retries,
     ),
+    SunshineMetricSensorEntityDescription(
+        key="command_rtt",
+        name="Command Round Trip Time",
+        native_unit_of_measurement="ms",
+        device_class=SensorDeviceClass.DURATION,
+        icon="mdi:swap-horizontal",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda m: _ms(m.command_rtt_mean),
+    ),
+]
+
+
+def _average_speed(totals: PeriodTotals) -> float | None:
+    """Return the average speed in km/h over a period."""
+    if totals.duration <= 0:
+        return None
+    return round(totals.distance / totals.duration * 3.6, 1)
+
+
+_TRIP_PERIOD_NAMES = {
+    PERIOD_DAY: "Today",
+    PERIOD_WEEK: "This Week",
+    PERIOD_MONTH: "This Month",
+}
+
+TRIP_SENSOR_TYPES: list[SunshineTripSensorEntityDescription] = [
+    description
+    for period, period_name in _TRIP_PERIOD_NAMES.items()
+    for description in (
+        SunshineTripSensorEntityDescription(
+            key=f"trip_distance_{period}",
+            name=f"Distance {period_name}",
+            native_unit_of_measurement="km",
+            device_class=SensorDeviceClass.DISTANCE,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            icon="mdi:map-marker-distance",
+            period=period,
+            value_fn=lambda t: round(t.distance / 1000, 2),
+        ),
+        SunshineTripSensorEntityDescription(
+            key=f"trip_duration_{period}",
+            name=f"Ride Time {period_name}",
+            native_unit_of_measurement="min",
+            device_class=SensorDeviceClass.DURATION,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            icon="mdi:timer-outline",
+            period=period,
+            value_fn=lambda t: round(t.duration / 60, 1),
+        ),
+        SunshineTripSensorEntityDescription(
+            key=f"trip_count_{period}",
+            name=f"Trips {period_name}",
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            icon="mdi:map-marker-path",
+            period=period,
+            value_fn=lambda t: t.count,
+        ),
+        SunshineTripSensorEntityDescription(
+            key=f"trip_average_speed_{period}",
+            name=f"Average Speed {period_name}",
+            native_unit_of_measurement="km/h",
+            device_class=SensorDeviceClass.SPEED,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:speedometer-medium",
+            period=period,
+            value_fn=_average_speed,
+        ),
+    )
 ]
 
 
@@ -269,14 +559,36 @@ async def async_setup_entry(
     """Set up Sunshine Scooter sensors."""
     data = hass.data[DOMAIN][config_entry.entry_id]
     coordinator = data["coordinator"]
+    trip_stats = data["trip_stats"]
+    geofences = data["geofences"]
+
+    def _scooter_entities(scooter_id: str) -> list[SensorEntity]:
+        """Return the sensors of one scooter."""
+        entities: list[SensorEntity] = [
+            SunshineSensor(coordinator, scooter_id, description)
+            for description in SENSOR_TYPES
+        ]
+        entities.extend(
+            SunshineTripSensor(coordinator, trip_stats, scooter_id, description)
+            for description in TRIP_SENSOR_TYPES
+        )
+        entities.append(SunshineGeofenceSensor(coordinator, geofences, scooter_id))
+        return entities
 
-    entities: list[SunshineSensor] = []
+    async_add_scooter_entities(config_entry, coordinator, async_add_entities, _scooter_entities)
 
-    for scooter_id in coordinator.data:
-        for description in SENSOR_TYPES:
-            entities.append(
-                SunshineSensor(coordinator, scooter_id, description)
-            )
+    entities: list[SensorEntity] = [
+        SunshineFleetSensor(coordinator, description)
+        for description in FLEET_SENSOR_TYPES
+    ]
+    entities.extend(
+        SunshineMetricSensor(coordinator, description) for description in METRIC_SENSOR_TYPES
+    )
+    if (session := data["session"]) is not None:
+        entities.extend(
+            SunshineConnectionSensor(coordinator, session.stats, description)
+            for description in CONNECTION_SENSOR_TYPES
+        )
 
     async_add_entities(entities)
 
@@ -296,6 +608,8 @@ class SunshineSensor(SunshineEntity, SensorEntity):
         super().__init__(coordinator, scooter_id)
         self.entity_description = description
         self._attr_unique_id = f"{scooter_id}_{description.key}"
+        self._watched_paths = description.paths
+        self._required_paths = description.paths
 
     @property
     def native_value(self) -> Any:
@@ -305,3 +619,171 @@ class SunshineSensor(SunshineEntity, SensorEntity):
                 return self.entity_description.value_fn(scooter_data)
             return scooter_data.get(self.entity_description.key)
         return None
+
+
+class SunshineTripSensor(SunshineEntity, SensorEntity):
+    """Representation of a Sunshine rolling trip statistics sensor."""
+
+    entity_description: SunshineTripSensorEntityDescription
+
+    # Updated by the trip statistics, telemetry does not affect the state
+    _watched_paths = ()
+
+    def __init__(
+        self,
+        coordinator: SunshineDataUpdateCoordinator,
+        trip_stats: TripStatistics,
+        scooter_id: str,
+        description: SunshineTripSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, scooter_id)
+        self.entity_description = description
+        self._trip_stats = trip_stats
+        self._attr_unique_id = f"{scooter_id}_{description.key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for changed trip totals."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._trip_stats.async_add_listener(self.scooter_id, self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> Any:
+        """Return the state of the sensor."""
+        totals = self._trip_stats.totals(self.scooter_id, self.entity_description.period)
+        return self.entity_description.value_fn(totals)
+
+
+class SunshineGeofenceSensor(SunshineEntity, SensorEntity):
+    """Representation of the geofence a Sunshine Scooter is in."""
+
+    # Updated by the geofence engine when the scooter enters or exits a fence
+    _watched_paths = ()
+
+    def __init__(
+        self,
+        coordinator: SunshineDataUpdateCoordinator,
+        geofences: GeofenceManager,
+        scooter_id: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, scooter_id)
+        self._geofences = geofences
+        self._attr_unique_id = f"{scooter_id}_geofence"
+        self._attr_name = "Current Fence"
+        self._attr_icon = "mdi:map-marker-radius"
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for geofence transitions."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._geofences.async_add_listener(self.scooter_id, self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the most specific fence the scooter is in."""
+        if fences := self._geofences.current_fences(self.scooter_id):
+            return fences[0].name
+        return None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return all fences the scooter is in."""
+        fences = self._geofences.current_fences(self.scooter_id)
+        return {
+            **(super().extra_state_attributes or {}),
+            "fences": [fence.name for fence in fences],
+            "fence_ids": [fence.fence_id for fence in fences],
+        }
+
+
+class SunshineFleetSensor(SunshineFleetEntity, SensorEntity):
+    """Representation of a Sunshine fleet aggregate sensor."""
+
+    entity_description: SunshineFleetSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: SunshineDataUpdateCoordinator,
+        description: SunshineFleetSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_fleet_{description.key}"
+
+    @property
+    def native_value(self) -> Any:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self.coordinator.fleet_stats)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return additional state attributes."""
+        attributes = super().extra_state_attributes
+        if self.entity_description.attributes_fn:
+            attributes = {
+                **(attributes or {}),
+                **self.entity_description.attributes_fn(self.coordinator.fleet_stats),
+            }
+        return attributes
+
+
+class SunshineConnectionSensor(SunshinePollEntity, SensorEntity):
+    """Representation of a dedicated connection pool diagnostic sensor."""
+
+    entity_description: SunshineConnectionSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: SunshineDataUpdateCoordinator,
+        stats: ConnectionStats,
+        description: SunshineConnectionSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._stats = stats
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{description.key}"
+
+    @property
+    def native_value(self) -> Any:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self._stats)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return all connection pool counters."""
+        return self._stats.as_dict()
+
+
+class SunshineMetricSensor(SunshinePollEntity, SensorEntity):
+    """Representation of a request and poll instrumentation diagnostic sensor."""
+
+    entity_description: SunshineMetricSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: SunshineDataUpdateCoordinator,
+        description: SunshineMetricSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{description.key}"
+
+    @property
+    def native_value(self) -> Any:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self.coordinator.metrics)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the histogram behind the sensor, if any."""
+        attributes = super().extra_state_attributes or {}
+        if (histogram_fn := self.entity_description.histogram_fn) is not None:
+            attributes = {**attributes, **histogram_fn(self.coordinator.metrics).as_dict()}
+        return attributes or None
@@ -0,0 +1,338 @@
+"""Services for Sunshine Scooter integration."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_NAME
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+from homeassistant.util import slugify
+
+from .commands import SunshineCommandSuperseded
+from .const import (
+    ATTR_ADDRESS,
+    ATTR_DURATION,
+    ATTR_FENCE_ID,
+    ATTR_LATITUDE,
+    ATTR_LONGITUDE,
+    ATTR_MAX_CONCURRENCY,
+    ATTR_POINTS,
+    ATTR_RADIUS,
+    ATTR_SOUND,
+    ATTR_STATE,
+    ATTR_TOLERANCE,
+    ATTR_TRIP_ID,
+    BLINKER_BOTH,
+    BLINKER_LEFT,
+    BLINKER_OFF,
+    BLINKER_RIGHT,
+    DEFAULT_MAX_CONCURRENCY,
+    DOMAIN,
+    SERVICE_ADD_GEOFENCE,
+    SERVICE_GET_TRIP_TRACK,
+    SERVICE_IMPORT_TRIP_STATISTICS,
+    SERVICE_REMOVE_GEOFENCE,
+    SOUND_ALARM,
+    SOUND_CHIRP,
+    SOUND_FIND_ME,
+)
+from .coordinator import SunshineDataUpdateCoordinator
+from .geofence import fence_from_dict
+from .track import DEFAULT_TRACK_TOLERANCE, async_get_track
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CommandService:
+    """A scooter command exposed as a bulk service."""
+
+    command: str
+    fields: dict[Any, Any] = field(default_factory=dict)
+    # Service fields passed as positional command arguments
+    args: tuple[str, ...] = ()
+
+
+COMMAND_SERVICES: dict[str, CommandService] = {
+    "lock": CommandService("lock"),
+    "unlock": CommandService("unlock"),
+    "honk": CommandService("honk"),
+    "alarm_arm": CommandService("alarm_arm"),
+    "alarm_disarm": CommandService("alarm_disarm"),
+    "alarm_stop": CommandService("alarm_stop"),
+    "trigger_alarm": CommandService(
+        "trigger_alarm",
+        {vol.Required(ATTR_DURATION): cv.string},
+        (ATTR_DURATION,),
+    ),
+    "play_sound": CommandService(
+        "play_sound",
+        {vol.Required(ATTR_SOUND): vol.In([SOUND_ALARM, SOUND_CHIRP, SOUND_FIND_ME])},
+        (ATTR_SOUND,),
+    ),
+    "blinkers": CommandService(
+        "blinkers",
+        {vol.Required(ATTR_STATE): vol.In([BLINKER_OFF, BLINKER_LEFT, BLINKER_RIGHT, BLINKER_BOTH])},
+        (ATTR_STATE,),
+    ),
+    "locate": CommandService("locate"),
+    "ping": CommandService("ping"),
+    "get_state": CommandService("get_state"),
+    "open_seatbox": CommandService("open_seatbox"),
+    "hibernate": CommandService("hibernate"),
+    "set_destination": CommandService(
+        "set_destination",
+        {
+            vol.Required(ATTR_LATITUDE): cv.latitude,
+            vol.Required(ATTR_LONGITUDE): cv.longitude,
+            vol.Optional(ATTR_ADDRESS, default=""): cv.string,
+        },
+        (ATTR_LATITUDE, ATTR_LONGITUDE, ATTR_ADDRESS),
+    ),
+    "clear_destination": CommandService("clear_destination"),
+}
+
+OTHER_SERVICES = (
+    SERVICE_GET_TRIP_TRACK,
+    SERVICE_ADD_GEOFENCE,
+    SERVICE_REMOVE_GEOFENCE,
+    SERVICE_IMPORT_TRIP_STATISTICS,
+)
+
+
+@callback
+def async_resolve_scooters(
+    hass: HomeAssistant, call: ServiceCall
+) -> dict[str, SunshineDataUpdateCoordinator]:
+    """Map the entities, devices and areas targeted by a call to scooters.
+
+    Every target is resolved with registry lookups by id, so the cost grows
+    with the number of targets, not with the size of the registries. The
+    fleet device stands for all scooters of its config entry.
+    """
+    entries: dict[str, dict[str, Any]] = hass.data.get(DOMAIN, {})
+    selected = async_extract_referenced_entity_ids(hass, call)
+    entity_registry = er.async_get(hass)
+    device_registry = dr.async_get(hass)
+
+    device_ids = set(selected.referenced_devices)
+    for entity_id in selected.referenced | selected.indirectly_referenced:
+        entity = entity_registry.async_get(entity_id)
+        if entity is not None and entity.platform == DOMAIN and entity.device_id:
+            device_ids.add(entity.device_id)
+
+    scooters: dict[str, SunshineDataUpdateCoordinator] = {}
+    for device_id in device_ids:
+        if (device := device_registry.async_get(device_id)) is None:
+            continue
+        for entry_id in device.config_entries:
+            if (data := entries.get(entry_id)) is None:
+                continue
+            coordinator: SunshineDataUpdateCoordinator = data["coordinator"]
+            for domain, identifier in device.identifiers:
+                if domain != DOMAIN:
+                    continue
+                if identifier == f"{entry_id}_fleet":
+                    scooters.update(dict.fromkeys(coordinator.data or {}, coordinator))
+                elif identifier in (coordinator.data or {}):
+                    scooters[identifier] = coordinator
+
+    if not scooters:
+        raise HomeAssistantError("No Sunshine scooters found in the service target")
+    return scooters
+
+
+async def _async_handle_command(
+    hass: HomeAssistant, service: CommandService, call: ServiceCall
+) -> ServiceResponse:
+    """Send a command to every targeted scooter, a bounded number at a time."""
+    scooters = async_resolve_scooters(hass, call)
+    args = tuple(call.data[name] for name in service.args)
+    semaphore = asyncio.Semaphore(call.data[ATTR_MAX_CONCURRENCY])
+
+    async def _async_send(
+        scooter_id: str, coordinator: SunshineDataUpdateCoordinator
+    ) -> dict[str, Any]:
+        async with semaphore:
+            try:
+                await coordinator.async_send_command(scooter_id, service.command, *args)
+            except SunshineCommandSuperseded:
+                return {"success": False, "error": "superseded"}
+            except Exception as err:
+                _LOGGER.warning(
+                    "Command %s failed for scooter %s: %s", service.command, scooter_id, err
+                )
+                return {"success": False, "error": str(err) or type(err).__name__}
+        return {"success": True}
+
+    results = await asyncio.gather(
+        *(_async_send(scooter_id, coordinator) for scooter_id, coordinator in scooters.items())
+    )
+    return {"results": dict(zip(scooters, results))}
+
+
+async def _async_handle_get_trip_track(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Return the simplified track of a trip of one scooter."""
+    scooters = async_resolve_scooters(hass, call)
+    if len(scooters) != 1:
+        raise HomeAssistantError("Target exactly one scooter to get a trip track")
+    (scooter_id, coordinator), = scooters.items()
+    data = hass.data[DOMAIN][coordinator.config_entry.entry_id]
+    trip_id = call.data[ATTR_TRIP_ID]
+    track = await async_get_track(
+        hass,
+        data["api"],
+        data["trip_syncer"].store,
+        scooter_id,
+        trip_id,
+        call.data[ATTR_TOLERANCE],
+    )
+    return {"trip_id": trip_id, **track}
+
+
+async def _async_handle_add_geofence(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Add or replace a geofence in every config entry."""
+    try:
+        fence = fence_from_dict({
+            "id": call.data.get(ATTR_FENCE_ID) or slugify(call.data[ATTR_NAME]),
+            "name": call.data[ATTR_NAME],
+            "latitude": call.data.get(ATTR_LATITUDE),
+            "longitude": call.data.get(ATTR_LONGITUDE),
+            "radius": call.data.get(ATTR_RADIUS),
+            "points": call.data.get(ATTR_POINTS),
+        })
+    except ValueError as err:
+        raise HomeAssistantError(str(err)) from err
+    for data in hass.data[DOMAIN].values():
+        data["geofences"].async_add_fence(fence)
+
+
+async def _async_handle_remove_geofence(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Remove a geofence from every config entry."""
+    removed = [
+        data["geofences"].async_remove_fence(call.data[ATTR_FENCE_ID])
+        for data in hass.data[DOMAIN].values()
+    ]
+    if not any(removed):
+        raise HomeAssistantError(f"Unknown geofence {call.data[ATTR_FENCE_ID]}")
+
+
+async def _async_import_trip_statistics(data: dict[str, Any]) -> None:
+    """Sync trips of one config entry, then replay them into long-term statistics."""
+    coordinator: SunshineDataUpdateCoordinator = data["coordinator"]
+    await data["trip_syncer"].async_sync(list(coordinator.data or {}))
+    for scooter_id, scooter in (coordinator.data or {}).items():
+        name = scooter.get("name") or f"Scooter {scooter.get('vin', scooter_id)}"
+        try:
+            await data["backfill"].async_backfill(scooter_id, name)
+        except Exception as err:
+            _LOGGER.error("Failed to import trip statistics for scooter %s: %s", scooter_id, err)
+
+
+async def _async_handle_import_trip_statistics(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Start the trip statistics import of every config entry in the background."""
+    for data in hass.data[DOMAIN].values():
+        entry = data["coordinator"].config_entry
+        entry.async_create_background_task(
+            hass, _async_import_trip_statistics(data), f"{DOMAIN} trip statistics import"
+        )
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services once for all config entries."""
+    if hass.services.has_service(DOMAIN, SERVICE_IMPORT_TRIP_STATISTICS):
+        return
+
+    for name, service in COMMAND_SERVICES.items():
+
+        async def _async_handle(call: ServiceCall, service: CommandService = service) -> ServiceResponse:
+            return await _async_handle_command(hass, service, call)
+
+        hass.services.async_register(
+            DOMAIN,
+            name,
+            _async_handle,
+            schema=cv.make_entity_service_schema({
+                **service.fields,
+                vol.Optional(ATTR_MAX_CONCURRENCY, default=DEFAULT_MAX_CONCURRENCY): vol.All(
+                    vol.Coerce(int), vol.Range(min=1)
+                ),
+            }),
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+    async def _async_get_trip_track(call: ServiceCall) -> ServiceResponse:
+        return await _async_handle_get_trip_track(hass, call)
+
+    async def _async_add_geofence(call: ServiceCall) -> None:
+        await _async_handle_add_geofence(hass, call)
+
+    async def _async_remove_geofence(call: ServiceCall) -> None:
+        await _async_handle_remove_geofence(hass, call)
+
+    async def _async_import(call: ServiceCall) -> None:
+        await _async_handle_import_trip_statistics(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_TRIP_TRACK,
+        _async_get_trip_track,
+        schema=cv.make_entity_service_schema({
+            vol.Required(ATTR_TRIP_ID): cv.positive_int,
+            vol.Optional(ATTR_TOLERANCE, default=DEFAULT_TRACK_TOLERANCE): vol.All(
+                vol.Coerce(float), vol.Range(min=0)
+            ),
+        }),
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ADD_GEOFENCE,
+        _async_add_geofence,
+        schema=vol.Schema({
+            vol.Required(ATTR_NAME): cv.string,
+            vol.Optional(ATTR_FENCE_ID): cv.slug,
+            vol.Inclusive(ATTR_LATITUDE, "circle"): cv.latitude,
+            vol.Inclusive(ATTR_LONGITUDE, "circle"): cv.longitude,
+            vol.Inclusive(ATTR_RADIUS, "circle"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            vol.Optional(ATTR_POINTS): vol.All(
+                [vol.ExactSequence([cv.latitude, cv.longitude])], vol.Length(min=3)
+            ),
+        }),
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REMOVE_GEOFENCE,
+        _async_remove_geofence,
+        schema=vol.Schema({
+            vol.Required(ATTR_FENCE_ID): cv.string,
+        }),
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_TRIP_STATISTICS,
+        _async_import,
+        schema=vol.Schema({}),
+    )
+
+
+@callback
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the integration's services."""
+    for name in (*COMMAND_SERVICES, *OTHER_SERVICES):
+        hass.services.async_remove(DOMAIN, name)
@@ -0,0 +1,193 @@
+"""Dedicated HTTP session for Sunshine Scooter integration."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util.ssl import client_context
+
+from .polling import INTERVAL_PARKED
+
+_LOGGER = logging.getLogger(__name__)
+
+# Room for the telemetry stream, polls, commands and trip sync at once
+CONNECTION_LIMIT = 8
+# Idle connections survive the gap between polls of parked scooters
+KEEPALIVE_TIMEOUT = INTERVAL_PARKED.total_seconds() * 2
+DNS_CACHE_TTL = 300
+# Connections opened at setup so the first command skips the TLS handshake
+WARM_CONNECTIONS = 2
+WARM_UP_TIMEOUT = 10
+
+# Dedicated sessions by base URL, shared by the config entries of one backend
+DATA_SESSIONS = "sunshine_sessions"
+
+
+@dataclass
+class ConnectionStats:
+    """Counters of a session's connection pool."""
+
+    requests: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    connect_time_total: float = 0.0
+    connect_time_last: float | None = None
+    dns_lookups: int = 0
+    dns_cache_hits: int = 0
+
+    @property
+    def connect_time_mean(self) -> float | None:
+        """Return the mean time to open a connection, TLS included, in ms."""
+        if not self.connections_created:
+            return None
+        return self.connect_time_total / self.connections_created * 1000
+
+    @property
+    def reuse_ratio(self) -> float | None:
+        """Return the share of requests sent on a pooled connection."""
+        total = self.connections_created + self.connections_reused
+        if not total:
+            return None
+        return self.connections_reused / total
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for diagnostics."""
+        return {
+            "requests": self.requests,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "connect_time_mean_ms": self.connect_time_mean,
+            "connect_time_last_ms": (
+                self.connect_time_last * 1000 if self.connect_time_last is not None else None
+            ),
+            "dns_lookups": self.dns_lookups,
+            "dns_cache_hits": self.dns_cache_hits,
+        }
+
+
+def _trace_config(stats: ConnectionStats) -> aiohttp.TraceConfig:
+    """Return a trace config counting connection events into stats."""
+
+    async def on_request_start(
+        _session: aiohttp.ClientSession, context: SimpleNamespace, _params: Any
+    ) -> None:
+        stats.requests += 1
+
+    async def on_connection_create_start(
+        _session: aiohttp.ClientSession, context: SimpleNamespace, _params: Any
+    ) -> None:
+        context.connect_started = time.monotonic()
+
+    async def on_connection_create_end(
+        _session: aiohttp.ClientSession, context: SimpleNamespace, _params: Any
+    ) -> None:
+        elapsed = time.monotonic() - context.connect_started
+        stats.connections_created += 1
+        stats.connect_time_total += elapsed
+        stats.connect_time_last = elapsed
+
+    async def on_connection_reuseconn(
+        _session: aiohttp.ClientSession, context: SimpleNamespace, _params: Any
+    ) -> None:
+        stats.connections_reused += 1
+
+    async def on_dns_resolvehost_end(
+        _session: aiohttp.ClientSession, context: SimpleNamespace, _params: Any
+    ) -> None:
+        stats.dns_lookups += 1
+
+    async def on_dns_cache_hit(
+        _session: aiohttp.ClientSession, context: SimpleNamespace, _params: Any
+    ) -> None:
+        stats.dns_cache_hits += 1
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+    trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+    trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+    return trace_config
+
+
+class SunshineSession:
+    """A connection pool of its own for one Sunshine backend.
+
+    Shared by all config entries using the same base URL and closed when
+    the last of them releases it.
+    """
+
+    def __init__(self, base_url: str) -> None:
+        """Initialize the session."""
+        self.base_url = base_url
+        self.stats = ConnectionStats()
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=CONNECTION_LIMIT,
+                limit_per_host=CONNECTION_LIMIT,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                ssl=client_context(),
+            ),
+            headers={"User-Agent": SERVER_SOFTWARE},
+            trace_configs=[_trace_config(self.stats)],
+        )
+        self.users = 0
+        self.warm_up_task: asyncio.Task | None = None
+
+    async def async_warm_up(self) -> None:
+        """Open a few pooled connections ahead of the first requests."""
+
+        async def _async_connect() -> None:
+            async with self.session.head(
+                self.base_url, timeout=aiohttp.ClientTimeout(total=WARM_UP_TIMEOUT)
+            ):
+                pass
+
+        results = await asyncio.gather(
+            *(_async_connect() for _ in range(WARM_CONNECTIONS)), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.debug("Connection warm-up to %s failed: %s", self.base_url, result)
+
+
+@callback
+def async_acquire_session(hass: HomeAssistant, base_url: str) -> SunshineSession:
+    """Return the dedicated session of a backend, creating it if needed.
+
+    A new session is warmed up in the background, setup does not wait on
+    the backend for it.
+    """
+    sessions: dict[str, SunshineSession] = hass.data.setdefault(DATA_SESSIONS, {})
+    if (shared := sessions.get(base_url)) is None or shared.session.closed:
+        shared = sessions[base_url] = SunshineSession(base_url)
+        shared.warm_up_task = hass.async_create_background_task(
+            shared.async_warm_up(), f"sunshine connection warm-up {base_url}"
+        )
+    shared.users += 1
+    return shared
+
+
+async def async_release_session(hass: HomeAssistant, base_url: str) -> None:
+    """Release a dedicated session, closing it once unused."""
+    sessions: dict[str, SunshineSession] = hass.data.get(DATA_SESSIONS, {})
+    if (shared := sessions.get(base_url)) is None:
+        return
+    shared.users -= 1
+    if shared.users <= 0:
+        del sessions[base_url]
+        if not sessions:
+            del hass.data[DATA_SESSIONS]
+        if shared.warm_up_task is not None:
+            shared.warm_up_task.cancel()
+        await shared.session.close()
@@ -9,9 +9,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .commands import SunshineCommandSuperseded
+from .const import DOMAIN, UNLOCKED_STATES
 from .coordinator import SunshineDataUpdateCoordinator
-from .entity import SunshineEntity
+from .entity import SunshineEntity, async_add_scooter_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,18 +27,21 @@ async def async_setup_entry(
     api = data["api"]
     coordinator = data["coordinator"]
 
-    entities: list[SunshineEntity] = []
+    def _scooter_entities(scooter_id: str) -> list[SunshineEntity]:
+        """Return the switches of one scooter."""
+        return [
+            SunshineLockSwitch(api, coordinator, scooter_id),
+            SunshineAlarmSwitch(api, coordinator, scooter_id),
+        ]
 
-    for scooter_id in coordinator.data:
-        entities.append(SunshineLockSwitch(api, coordinator, scooter_id))
-        entities.append(SunshineAlarmSwitch(api, coordinator, scooter_id))
-
-    async_add_entities(entities)
+    async_add_scooter_entities(config_entry, coordinator, async_add_entities, _scooter_entities)
 
 
 class SunshineLockSwitch(SunshineEntity, SwitchEntity):
     """Representation of a Sunshine Scooter lock switch."""
 
+    _watched_paths = ("state",)
+
     def __init__(self, api, coordinator: SunshineDataUpdateCoordinator, scooter_id: str) -> None:
         """Initialize the switch."""
         super().__init__(coordinator, scooter_id)
@@ -52,24 +56,24 @@ class SunshineLockSwitch(SunshineEntity, SwitchEntity):
         if scooter_data := self.coordinator.data.get(self.scooter_id):
             state = scooter_data.get("state")
             if state:
-                return state not in ["parked", "ready-to-drive"]
+                return state not in UNLOCKED_STATES
         return True
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Lock the scooter."""
         try:
-            await self.api.lock(self.scooter_id)
-            await self.coordinator.async_request_refresh()
-            self.coordinator.async_request_delayed_refresh()
+            await self.coordinator.async_send_command(self.scooter_id, "lock")
+        except SunshineCommandSuperseded:
+            _LOGGER.debug("Command for scooter %s superseded by a later one", self.scooter_id)
         except Exception as err:
             _LOGGER.error("Failed to lock scooter %s: %s", self.scooter_id, err)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Unlock the scooter."""
         try:
-            await self.api.unlock(self.scooter_id)
-            await self.coordinator.async_request_refresh()
-            self.coordinator.async_request_delayed_refresh()
+            await self.coordinator.async_send_command(self.scooter_id, "unlock")
+        except SunshineCommandSuperseded:
+            _LOGGER.debug("Command for scooter %s superseded by a later one", self.scooter_id)
         except Exception as err:
             _LOGGER.error("Failed to unlock scooter %s: %s", self.scooter_id, err)
 
@@ -77,6 +81,8 @@ class SunshineLockSwitch(SunshineEntity, SwitchEntity):
 class SunshineAlarmSwitch(SunshineEntity, SwitchEntity):
     """Representation of a Sunshine Scooter alarm armed switch."""
 
+    _watched_paths = ("alarm_state",)
+
     def __init__(self, api, coordinator: SunshineDataUpdateCoordinator, scooter_id: str) -> None:
         """Initialize the switch."""
         super().__init__(coordinator, scooter_id)
@@ -97,17 +103,17 @@ class SunshineAlarmSwitch(SunshineEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Arm the alarm."""
         try:
-            await self.api.alarm_arm(self.scooter_id)
-            await self.coordinator.async_request_refresh()
-            self.coordinator.async_request_delayed_refresh()
+            await self.coordinator.async_send_command(self.scooter_id, "alarm_arm")
+        except SunshineCommandSuperseded:
+            _LOGGER.debug("Command for scooter %s superseded by a later one", self.scooter_id)
         except Exception as err:
             _LOGGER.error("Failed to arm alarm for scooter %s: %s", self.scooter_id, err)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disarm the alarm."""
         try:
-            await self.api.alarm_disarm(self.scooter_id)
-            await self.coordinator.async_request_refresh()
-            self.coordinator.async_request_delayed_refresh()
+            await self.coordinator.async_send_command(self.scooter_id, "alarm_disarm")
+        except SunshineCommandSuperseded:
+            _LOGGER.debug("Command for scooter %s superseded by a later one", self.scooter_id)
         except Exception as err:
             _LOGGER.error("Failed to disarm alarm for scooter %s: %s", self.scooter_id, err)
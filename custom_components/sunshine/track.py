@@ -0,0 +1,126 @@
+"""GPS track simplification for Sunshine Scooter integration."""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .api import SunshineAPI
+from .trips import TripStore, trip_field
+
+# Default maximum deviation of the simplified track, in meters
+DEFAULT_TRACK_TOLERANCE = 5.0
+
+EARTH_RADIUS = 6371000.0
+
+# Trip fields that may hold the GPS trace
+TRACK_FIELDS = ("track", "points", "path", "locations", "gps_points", "route")
+
+
+def extract_points(trip: dict[str, Any]) -> list[tuple[float, float]]:
+    """Return the (lat, lng) points of a trip's GPS trace."""
+    raw = trip_field(trip, *TRACK_FIELDS) or []
+    points: list[tuple[float, float]] = []
+    for point in raw:
+        try:
+            if isinstance(point, dict):
+                lat = point.get("lat", point.get("latitude"))
+                lng = point.get("lng", point.get("lon", point.get("longitude")))
+            else:
+                lat, lng = point[0], point[1]
+            points.append((float(lat), float(lng)))
+        except (ValueError, TypeError, IndexError):
+            continue
+    return points
+
+
+def track_length(points: list[tuple[float, float]]) -> float:
+    """Return the haversine length of a track in meters."""
+    length = 0.0
+    for (lat1, lng1), (lat2, lng2) in zip(points, points[1:]):
+        phi1, phi2 = math.radians(lat1), math.radians(lat2)
+        dphi = phi2 - phi1
+        dlambda = math.radians(lng2 - lng1)
+        a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+        length += 2 * EARTH_RADIUS * math.asin(math.sqrt(a))
+    return length
+
+
+def simplify(points: list[tuple[float, float]], tolerance: float) -> list[tuple[float, float]]:
+    """Simplify a track with Douglas-Peucker to a tolerance in meters.
+
+    Points are projected to a local equirectangular plane, which is accurate
+    enough over the extent of a scooter trip. Uses an explicit stack so long
+    traces cannot hit the recursion limit.
+    """
+    if len(points) < 3:
+        return list(points)
+
+    lat0 = math.radians(sum(lat for lat, _ in points) / len(points))
+    scale_x = math.cos(lat0) * math.pi / 180 * EARTH_RADIUS
+    scale_y = math.pi / 180 * EARTH_RADIUS
+    xy = [(lng * scale_x, lat * scale_y) for lat, lng in points]
+
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    tolerance_sq = tolerance * tolerance
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        ax, ay = xy[first]
+        bx, by = xy[last]
+        dx, dy = bx - ax, by - ay
+        segment_sq = dx * dx + dy * dy
+
+        max_sq = -1.0
+        index = first
+        for i in range(first + 1, last):
+            px, py = xy[i]
+            if segment_sq == 0:
+                dist_sq = (px - ax) ** 2 + (py - ay) ** 2
+            else:
+                cross = dx * (py - ay) - dy * (px - ax)
+                dist_sq = cross * cross / segment_sq
+            if dist_sq > max_sq:
+                max_sq = dist_sq
+                index = i
+
+        if max_sq > tolerance_sq:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+def process_track(trip: dict[str, Any], tolerance: float) -> dict[str, Any]:
+    """Simplify a trip's trace, keeping its original distance and duration."""
+    points = extract_points(trip)
+    distance = trip_field(trip, "distance", "distance_m")
+    return {
+        "distance": float(distance) if distance is not None else round(track_length(points), 1),
+        "duration": trip_field(trip, "duration", "duration_s"),
+        "original_points": len(points),
+        "points": [list(point) for point in simplify(points, tolerance)],
+    }
+
+
+async def async_get_track(
+    hass: HomeAssistant,
+    api: SunshineAPI,
+    store: TripStore,
+    scooter_id: str,
+    trip_id: int,
+    tolerance: float = DEFAULT_TRACK_TOLERANCE,
+) -> dict[str, Any]:
+    """Return the simplified track of a trip, from cache or freshly processed."""
+    if (cached := await hass.async_add_executor_job(
+        store.get_track, scooter_id, trip_id, tolerance
+    )) is not None:
+        return cached
+
+    trip = await api.get_trip(scooter_id, trip_id) or {}
+    track = await hass.async_add_executor_job(process_track, trip, tolerance)
+    await hass.async_add_executor_job(store.set_track, scooter_id, trip_id, tolerance, track)
+    return track
@@ -0,0 +1,120 @@
+"""Rolling trip statistics for Sunshine Scooter integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.util import dt as dt_util
+
+from .trips import trip_field
+
+PERIOD_DAY = "today"
+PERIOD_WEEK = "week"
+PERIOD_MONTH = "month"
+PERIODS = (PERIOD_DAY, PERIOD_WEEK, PERIOD_MONTH)
+
+
+def period_start(period: str, now: datetime) -> datetime:
+    """Return the local start of the period containing now."""
+    day = dt_util.start_of_local_day(now)
+    if period == PERIOD_WEEK:
+        return day - timedelta(days=day.weekday())
+    if period == PERIOD_MONTH:
+        return day.replace(day=1)
+    return day
+
+
+def parse_trip(trip: dict[str, Any]) -> tuple[datetime, float, float] | None:
+    """Return start, distance in meters and duration in seconds of a trip."""
+    started = dt_util.parse_datetime(str(trip_field(trip, "started_at", "start_time") or ""))
+    if started is None:
+        return None
+    if started.tzinfo is None:
+        started = started.replace(tzinfo=dt_util.UTC)
+    try:
+        distance = float(trip_field(trip, "distance", "distance_m") or 0)
+        duration = float(trip_field(trip, "duration", "duration_s") or 0)
+    except (ValueError, TypeError):
+        return None
+    return started, distance, duration
+
+
+@dataclass
+class PeriodTotals:
+    """Running totals of trips in one period."""
+
+    start: datetime
+    distance: float = 0.0
+    duration: float = 0.0
+    count: int = 0
+
+
+class TripStatistics:
+    """Per-scooter running trip totals for today, this week and this month.
+
+    Adding a trip updates each period in constant time; totals start over
+    when a period boundary has passed, so history is never re-scanned.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self._totals: dict[str, dict[str, PeriodTotals]] = {}
+        self._listeners: dict[str, list[CALLBACK_TYPE]] = {}
+
+    def _current(self, scooter_id: str, period: str, now: datetime) -> PeriodTotals:
+        """Return the totals of the current period, rolling over if needed."""
+        periods = self._totals.setdefault(scooter_id, {})
+        start = period_start(period, now)
+        totals = periods.get(period)
+        if totals is None or totals.start != start:
+            totals = periods[period] = PeriodTotals(start)
+        return totals
+
+    def totals(self, scooter_id: str, period: str) -> PeriodTotals:
+        """Return the totals of a scooter for the current period."""
+        return self._current(scooter_id, period, dt_util.now())
+
+    def add_trip(self, scooter_id: str, trip: dict[str, Any]) -> bool:
+        """Count a trip in every current period it falls into."""
+        if (parsed := parse_trip(trip)) is None:
+            return False
+        started, distance, duration = parsed
+        now = dt_util.now()
+        counted = False
+        for period in PERIODS:
+            totals = self._current(scooter_id, period, now)
+            if started >= totals.start:
+                totals.distance += distance
+                totals.duration += duration
+                totals.count += 1
+                counted = True
+        return counted
+
+    @callback
+    def async_add_trips(self, scooter_id: str, trips: list[dict[str, Any]]) -> None:
+        """Count newly synced trips and notify the scooter's listeners."""
+        if any([self.add_trip(scooter_id, trip) for trip in trips]):
+            self.async_notify(scooter_id)
+
+    @callback
+    def async_add_listener(self, scooter_id: str, update_callback: CALLBACK_TYPE) -> Callable[[], None]:
+        """Listen for changed totals of a scooter."""
+        listeners = self._listeners.setdefault(scooter_id, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_notify(self, scooter_id: str | None = None) -> None:
+        """Notify listeners of one scooter, or of all scooters."""
+        scooter_ids = [scooter_id] if scooter_id else list(self._listeners)
+        for sid in scooter_ids:
+            for update_callback in list(self._listeners.get(sid, ())):
+                update_callback()
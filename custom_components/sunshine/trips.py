@@ -0,0 +1,391 @@
+"""Trip history sync for Sunshine Scooter integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import contextlib
+from datetime import UTC, datetime, timedelta
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .api import SunshineAPI
+
+_LOGGER = logging.getLogger(__name__)
+
+# One database per config entry, in the config directory
+TRIP_DB_FILE = "sunshine_trips_{entry_id}.db"
+# Shared by all entries before they had their own
+LEGACY_TRIP_DB_FILE = "sunshine_trips.db"
+TRIP_SYNC_INTERVAL = timedelta(minutes=30)
+
+# The first page is small so a sync with nothing new stays cheap
+FIRST_PAGE_SIZE = 10
+PAGE_SIZE = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trips (
+    scooter_id TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    started_at TEXT,
+    ended_at TEXT,
+    distance REAL,
+    duration REAL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (scooter_id, id)
+);
+CREATE INDEX IF NOT EXISTS trips_scooter_started ON trips (scooter_id, started_at);
+CREATE TABLE IF NOT EXISTS sync_state (
+    scooter_id TEXT PRIMARY KEY,
+    last_trip_id INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS statistics_import (
+    scooter_id TEXT PRIMARY KEY,
+    imported_until TEXT NOT NULL,
+    distance_sum REAL NOT NULL,
+    energy_sum REAL NOT NULL,
+    count_sum INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS trip_tracks (
+    scooter_id TEXT NOT NULL,
+    trip_id INTEGER NOT NULL,
+    tolerance REAL NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (scooter_id, trip_id, tolerance)
+);
+"""
+
+
+# Bumped whenever stored rows need converting, see TripStore._migrate
+SCHEMA_VERSION = 1
+
+# Energy of a trip, under whichever name the API reported it
+ENERGY_SQL = "COALESCE(json_extract(data, '$.energy_wh'), json_extract(data, '$.energy'))"
+
+
+def utc_timestamp(value: Any) -> str | None:
+    """Return a timestamp as a UTC ISO string, so stored ones compare as text.
+
+    Timestamps without an offset are taken to be UTC.
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        moment = value
+    else:
+        try:
+            moment = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return str(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return moment.astimezone(UTC).isoformat(timespec="seconds")
+
+
+def adopt_legacy_db(legacy_path: str, path: str) -> None:
+    """Move the database all entries used to share to an entry's path.
+
+    Blocks and must run in the executor.
+    """
+    if os.path.exists(legacy_path) and not os.path.exists(path):
+        _LOGGER.debug("Moving %s to %s", legacy_path, path)
+        os.replace(legacy_path, path)
+
+
+def remove_db(path: str) -> None:
+    """Delete a trip database, if there is one.
+
+    Blocks and must run in the executor.
+    """
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
+
+
+def trip_field(trip: dict[str, Any], *names: str) -> Any:
+    """Return the first present field out of several possible names."""
+    for name in names:
+        if (value := trip.get(name)) is not None:
+            return value
+    return None
+
+
+class TripStore:
+    """SQLite store of synced trips, indexed by scooter and start time.
+
+    Trip times are stored as UTC ISO strings, so they sort and compare as text.
+
+    All methods block and must run in the executor.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the store."""
+        self._path = path
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the open connection, creating the schema on first use."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self._path, check_same_thread=False)
+            self._conn.executescript(SCHEMA)
+            self._migrate(self._conn)
+        return self._conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """Convert rows stored by older versions."""
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        if version >= SCHEMA_VERSION:
+            return
+        with conn:
+            if version < 1:
+                # Trip times were stored with the API's offsets, e.g. "Z"
+                rows = conn.execute("SELECT scooter_id, id, started_at, ended_at FROM trips").fetchall()
+                conn.executemany(
+                    "UPDATE trips SET started_at = ?, ended_at = ? WHERE scooter_id = ? AND id = ?",
+                    [
+                        (utc_timestamp(started_at), utc_timestamp(ended_at), scooter_id, trip_id)
+                        for scooter_id, trip_id, started_at, ended_at in rows
+                    ],
+                )
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def last_trip_id(self, scooter_id: str) -> int | None:
+        """Return the newest trip id fully synced for a scooter."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT last_trip_id FROM sync_state WHERE scooter_id = ?", (scooter_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def trips_since(self, scooter_id: str, since: datetime) -> list[dict[str, Any]]:
+        """Return trips of a scooter started at or after a point in time."""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT started_at, distance, duration FROM trips "
+                "WHERE scooter_id = ? AND started_at >= ? ORDER BY started_at",
+                (scooter_id, utc_timestamp(since)),
+            ).fetchall()
+        return [
+            {"started_at": started_at, "distance": distance, "duration": duration}
+            for started_at, distance, duration in rows
+        ]
+
+    def first_trip_start(self, scooter_id: str) -> str | None:
+        """Return the start of the oldest stored trip of a scooter."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT MIN(started_at) FROM trips WHERE scooter_id = ?", (scooter_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def hourly_totals(
+        self, scooter_id: str, start: datetime, end: datetime
+    ) -> list[tuple[str, float, float, int]]:
+        """Return distance, energy and trip count per UTC hour in [start, end).
+
+        Hours are returned as "YYYY-MM-DD HH:00:00" strings in UTC.
+        """
+        with self._lock:
+            return self._connection().execute(
+                "SELECT strftime('%Y-%m-%d %H:00:00', started_at) AS hour, "
+                f"COALESCE(SUM(distance), 0), COALESCE(SUM({ENERGY_SQL}), 0), COUNT(*) "
+                "FROM trips WHERE scooter_id = ? AND started_at >= ? AND started_at < ? "
+                "GROUP BY hour ORDER BY hour",
+                (scooter_id, utc_timestamp(start), utc_timestamp(end)),
+            ).fetchall()
+
+    def import_progress(self, scooter_id: str) -> tuple[str, float, float, int] | None:
+        """Return how far statistics were imported and the sums reached."""
+        with self._lock:
+            return self._connection().execute(
+                "SELECT imported_until, distance_sum, energy_sum, count_sum "
+                "FROM statistics_import WHERE scooter_id = ?",
+                (scooter_id,),
+            ).fetchone()
+
+    def set_import_progress(
+        self, scooter_id: str, imported_until: str, distance_sum: float, energy_sum: float, count_sum: int
+    ) -> None:
+        """Persist statistics import progress."""
+        with self._lock, self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO statistics_import "
+                "(scooter_id, imported_until, distance_sum, energy_sum, count_sum) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (scooter_id, imported_until, distance_sum, energy_sum, count_sum),
+            )
+
+    def get_track(self, scooter_id: str, trip_id: int, tolerance: float) -> dict[str, Any] | None:
+        """Return a cached simplified track."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT data FROM trip_tracks WHERE scooter_id = ? AND trip_id = ? AND tolerance = ?",
+                (scooter_id, trip_id, tolerance),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_track(self, scooter_id: str, trip_id: int, tolerance: float, track: dict[str, Any]) -> None:
+        """Cache a simplified track next to its trip."""
+        with self._lock, self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO trip_tracks (scooter_id, trip_id, tolerance, data) "
+                "VALUES (?, ?, ?, ?)",
+                (scooter_id, trip_id, tolerance, json.dumps(track, separators=(",", ":"))),
+            )
+
+    def write_trips(self, scooter_id: str, trips: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Insert or update a batch of trips in one transaction.
+
+        Trips older than the statistics imported so far, e.g. synced after
+        their hour was imported, move the import back to their hour with
+        the sums reached before it.
+
+        Returns the trips that were not stored before.
+        """
+        ids = [trip["id"] for trip in trips]
+        rows = [
+            (
+                scooter_id,
+                trip["id"],
+                utc_timestamp(trip_field(trip, "started_at", "start_time")),
+                utc_timestamp(trip_field(trip, "ended_at", "end_time")),
+                trip_field(trip, "distance", "distance_m"),
+                trip_field(trip, "duration", "duration_s"),
+                json.dumps(trip),
+            )
+            for trip in trips
+        ]
+        with self._lock, self._connection() as conn:
+            known = {
+                row[0]
+                for row in conn.execute(
+                    f"SELECT id FROM trips WHERE scooter_id = ? AND id IN ({','.join('?' * len(ids))})",
+                    (scooter_id, *ids),
+                )
+            }
+            conn.executemany(
+                "INSERT OR REPLACE INTO trips "
+                "(scooter_id, id, started_at, ended_at, distance, duration, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            if started := [row[2] for row in rows if row[2] is not None]:
+                self._rewind_import(conn, scooter_id, min(started))
+        return [trip for trip in trips if trip["id"] not in known]
+
+    @staticmethod
+    def _rewind_import(conn: sqlite3.Connection, scooter_id: str, started_at: str) -> None:
+        """Resume the statistics import at the hour of a trip if it was imported already."""
+        try:
+            hour = datetime.fromisoformat(started_at).replace(minute=0, second=0).isoformat()
+        except ValueError:
+            # Stored as reported, it never matches an hour of the import either
+            return
+        conn.execute(
+            "UPDATE statistics_import SET imported_until = :hour, "
+            "distance_sum = (SELECT COALESCE(SUM(distance), 0) / 1000 FROM trips "
+            "WHERE scooter_id = :scooter_id AND started_at < :hour), "
+            f"energy_sum = (SELECT COALESCE(SUM({ENERGY_SQL}), 0) FROM trips "
+            "WHERE scooter_id = :scooter_id AND started_at < :hour), "
+            "count_sum = (SELECT COUNT(*) FROM trips "
+            "WHERE scooter_id = :scooter_id AND started_at < :hour) "
+            "WHERE scooter_id = :scooter_id AND imported_until > :hour",
+            {"scooter_id": scooter_id, "hour": hour},
+        )
+
+    def set_last_trip_id(self, scooter_id: str, trip_id: int) -> None:
+        """Persist the high-water mark after a completed sync."""
+        with self._lock, self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_state (scooter_id, last_trip_id) VALUES (?, ?)",
+                (scooter_id, trip_id),
+            )
+
+
+class TripSyncer:
+    """Fetch trips newer than the last synced one into a TripStore.
+
+    The API lists trips newest first. Pages are written as they arrive, and
+    the high-water mark only moves once a sync reached known trips, so an
+    interrupted first sync starts over instead of leaving a gap.
+    """
+
+    def __init__(self, hass: HomeAssistant, api: SunshineAPI, store: TripStore) -> None:
+        """Initialize the syncer."""
+        self._hass = hass
+        self._api = api
+        self.store = store
+        self._lock = asyncio.Lock()
+        self._listeners: list[Callable[[str, list[dict[str, Any]]], None]] = []
+
+    @callback
+    def async_add_listener(
+        self, new_trips_callback: Callable[[str, list[dict[str, Any]]], None]
+    ) -> Callable[[], None]:
+        """Listen for trips stored for the first time."""
+        self._listeners.append(new_trips_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(new_trips_callback)
+
+        return remove_listener
+
+    async def async_sync(self, scooter_ids: list[str]) -> None:
+        """Sync trips of the given scooters one after another."""
+        if self._lock.locked():
+            _LOGGER.debug("Trip sync already running")
+            return
+        async with self._lock:
+            for scooter_id in scooter_ids:
+                try:
+                    await self._async_sync_scooter(scooter_id)
+                except Exception as err:
+                    _LOGGER.warning("Failed to sync trips of scooter %s: %s", scooter_id, err)
+
+    async def _async_sync_scooter(self, scooter_id: str) -> None:
+        """Page through new trips of one scooter."""
+        last_trip_id = await self._hass.async_add_executor_job(self.store.last_trip_id, scooter_id)
+        newest_id: int | None = None
+        offset = 0
+        limit = FIRST_PAGE_SIZE
+        synced = 0
+
+        while True:
+            page = await self._api.get_trips(scooter_id, limit=limit, offset=offset) or []
+            new_trips = [
+                trip for trip in page
+                if "id" in trip and (last_trip_id is None or trip["id"] > last_trip_id)
+            ]
+            if new_trips:
+                stored = await self._hass.async_add_executor_job(
+                    self.store.write_trips, scooter_id, new_trips
+                )
+                for new_trips_callback in self._listeners:
+                    new_trips_callback(scooter_id, stored)
+                synced += len(new_trips)
+                page_newest = max(trip["id"] for trip in new_trips)
+                newest_id = page_newest if newest_id is None else max(newest_id, page_newest)
+
+            # Done once we reached known trips or ran out of pages
+            if len(new_trips) < len(page) or len(page) < limit:
+                break
+            offset += limit
+            limit = PAGE_SIZE
+
+        if newest_id is not None:
+            await self._hass.async_add_executor_job(self.store.set_last_trip_id, scooter_id, newest_id)
+        _LOGGER.debug("Synced %d new trips of scooter %s", synced, scooter_id)
@@ -0,0 +1,163 @@
+"""Fixtures for the Sunshine Scooter tests."""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+import copy
+from pathlib import Path
+import sys
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry  # noqa: E402
+
+from custom_components.sunshine.api import SunshineAPI  # noqa: E402
+from custom_components.sunshine.const import DOMAIN  # noqa: E402
+from custom_components.sunshine.coordinator import SunshineDataUpdateCoordinator  # noqa: E402
+
+EVENT_STREAM = "text/event-stream"
+
+
+class Backend:
+    """Scripted answers to the stream and fleet endpoints.
+
+    Each stream connection takes the next script: a status to answer with,
+    or the chunks of an event stream to send before closing it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the backend."""
+        self.streams: list[int | list[str]] = []
+        self.connections = 0
+        self.content_type = EVENT_STREAM
+        self.scooters_status = 200
+        self.scooters_requests = 0
+        self.scooters_payload: list[dict[str, Any]] = []
+        self.scooters_etag: str | None = None
+        # If-None-Match of each fleet poll
+        self.scooters_if_none_match: list[str | None] = []
+
+    async def stream(self, request: web.Request) -> web.StreamResponse:
+        """Answer a stream connection from the next script."""
+        script = self.streams[self.connections] if self.connections < len(self.streams) else 404
+        self.connections += 1
+        if isinstance(script, int):
+            return web.Response(status=script)
+        response = web.StreamResponse()
+        response.content_type = self.content_type
+        await response.prepare(request)
+        for chunk in script:
+            await response.write(chunk.encode())
+        return response
+
+    async def scooters(self, request: web.Request) -> web.Response:
+        """Answer a fleet poll, with 304 if the client holds the current ETag."""
+        self.scooters_requests += 1
+        self.scooters_if_none_match.append(request.headers.get("If-None-Match"))
+        if self.scooters_status != 200:
+            return web.Response(status=self.scooters_status)
+        if self.scooters_etag is None:
+            return web.json_response(self.scooters_payload)
+        if request.headers.get("If-None-Match") == self.scooters_etag:
+            return web.Response(status=304, headers={"ETag": self.scooters_etag})
+        return web.json_response(self.scooters_payload, headers={"ETag": self.scooters_etag})
+
+
+@pytest.fixture
+def backend() -> Backend:
+    """Return the scripted backend."""
+    return Backend()
+
+
+@pytest.fixture
+async def api(backend: Backend, socket_enabled: None) -> AsyncIterator[SunshineAPI]:
+    """Return an API client talking to the scripted backend on localhost."""
+    app = web.Application()
+    app.router.add_get("/api/v1/scooters/stream", backend.stream)
+    app.router.add_get("/api/v1/scooters", backend.scooters)
+    server = TestServer(app)
+    await server.start_server()
+    session = aiohttp.ClientSession()
+    yield SunshineAPI("token", str(server.make_url("/")), session)
+    await session.close()
+    await server.close()
+
+
+def make_scooter(scooter_id: str, **fields: Any) -> dict[str, Any]:
+    """Return a scooter record shaped like a /scooters entry."""
+    return {
+        "id": scooter_id,
+        "vin": f"WUNU{scooter_id}",
+        "name": f"Scooter {scooter_id}",
+        "model": {"full_name": "unu Scooter Pro", "model_name": "pro"},
+        "state": "parked",
+        "online": True,
+        "speed": 0,
+        "odometer": 1000000,
+        "last_seen_at": "2026-10-18T08:30:00+00:00",
+        "location": {"lat": 52.5, "lng": 13.4},
+        "batteries": {"battery0": {"level": 80}},
+        **fields,
+    }
+
+
+class FleetAPI(SunshineAPI):
+    """API client answering from an in-memory fleet instead of the network.
+
+    Commands are recorded and answered with an empty response.
+    """
+
+    def __init__(self, scooters: list[dict[str, Any]]) -> None:
+        """Initialize the client."""
+        super().__init__("token", "https://sunshine.invalid", None)
+        self.scooters = {scooter["id"]: scooter for scooter in scooters}
+        self.commands: list[tuple[str, str]] = []
+        self.polls = 0
+
+    async def get_scooters(self, fields: Any = None) -> list[dict[str, Any]]:
+        """Return the fleet."""
+        self.polls += 1
+        return copy.deepcopy(list(self.scooters.values()))
+
+    async def get_scooter(self, scooter_id: str, priority: int | None = None) -> dict[str, Any]:
+        """Return one scooter."""
+        return copy.deepcopy(self.scooters[scooter_id])
+
+    async def _command(
+        self, scooter_id: str, command: str, endpoint: str, body: Any = None, method: str = "POST"
+    ) -> dict[str, Any]:
+        """Record a command."""
+        self.commands.append((scooter_id, command))
+        return {}
+
+
+@pytest.fixture
+def fleet_api() -> FleetAPI:
+    """Return an API client holding two parked scooters."""
+    return FleetAPI([make_scooter("s1"), make_scooter("s2")])
+
+
+@pytest.fixture
+def config_entry(hass) -> MockConfigEntry:
+    """Return a config entry added to hass."""
+    entry = MockConfigEntry(domain=DOMAIN, data={"token": "token"})
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+async def coordinator(
+    hass, config_entry: MockConfigEntry, fleet_api: FleetAPI
+) -> AsyncIterator[SunshineDataUpdateCoordinator]:
+    """Return a coordinator that polled the in-memory fleet once."""
+    coordinator = SunshineDataUpdateCoordinator(hass, config_entry, fleet_api)
+    await coordinator.async_refresh()
+    yield coordinator
+    await coordinator.async_shutdown()
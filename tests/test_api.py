@@ -0,0 +1,39 @@
+"""Tests of the Sunshine Scooter API client."""
+from __future__ import annotations
+
+from custom_components.sunshine.api import SunshineAPI
+
+from conftest import Backend, make_scooter
+
+
+async def test_not_modified_reuses_response(api: SunshineAPI, backend: Backend) -> None:
+    """Polls send the last ETag and a 304 returns the previous result."""
+    backend.scooters_payload = [make_scooter("s1")]
+    backend.scooters_etag = '"v1"'
+    first = await api.get_scooters()
+    assert first == backend.scooters_payload
+
+    assert await api.get_scooters() is first
+    assert backend.scooters_if_none_match == [None, '"v1"']
+    assert api.metrics.endpoint("/scooters").not_modified == 1
+
+    backend.scooters_payload = [make_scooter("s1", state="locked")]
+    backend.scooters_etag = '"v2"'
+    assert (await api.get_scooters())[0]["state"] == "locked"
+    assert await api.get_scooters() == backend.scooters_payload
+    assert backend.scooters_if_none_match[2:] == ['"v1"', '"v2"']
+
+
+async def test_validators_per_endpoint(api: SunshineAPI, backend: Backend) -> None:
+    """Field-limited polls keep validators of their own, dropped with the ETag."""
+    backend.scooters_etag = '"v1"'
+    await api.get_scooters()
+    await api.get_scooters(fields=["state"])
+    assert backend.scooters_if_none_match == [None, None]
+
+    # A response without validators forgets the stored ones
+    backend.scooters_etag = None
+    await api.get_scooters()
+    await api.get_scooters()
+    assert backend.scooters_if_none_match[2:] == ['"v1"', None]
+    assert api.metrics.endpoint("/scooters").not_modified == 0
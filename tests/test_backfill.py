@@ -0,0 +1,105 @@
+"""Tests of the Sunshine Scooter long-term statistics backfill."""
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+
+from homeassistant.components.recorder import Recorder, get_instance
+from homeassistant.components.recorder.statistics import statistics_during_period
+from homeassistant.core import HomeAssistant, valid_entity_id
+from homeassistant.util import dt as dt_util
+
+from custom_components.sunshine.backfill import StatisticsBackfill, statistic_id
+from custom_components.sunshine.trips import TripStore
+
+NOW = "2026-10-18T12:30:00+00:00"
+
+
+def trip(trip_id: int, started_at: str, distance: float, energy: float) -> dict[str, Any]:
+    """Return a trip as listed by the API."""
+    return {"id": trip_id, "started_at": started_at, "distance": distance, "energy_wh": energy}
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> TripStore:
+    """Return an empty trip store."""
+    store = TripStore(str(tmp_path / "trips.db"))
+    yield store
+    store.close()
+
+
+async def _async_hourly(hass: HomeAssistant, key: str) -> dict[str, tuple[float, float]]:
+    """Return state and sum per hour of an imported statistic of s-1."""
+    stat_id = statistic_id("s-1", key)
+    rows = await get_instance(hass).async_add_executor_job(
+        statistics_during_period,
+        hass,
+        datetime.fromisoformat("2026-10-18T00:00:00+00:00"),
+        None,
+        {stat_id},
+        "hour",
+        None,
+        {"state", "sum"},
+    )
+    return {
+        dt_util.utc_from_timestamp(row["start"]).strftime("%H:%M"): (row["state"], row["sum"])
+        for row in rows.get(stat_id, [])
+    }
+
+
+def test_statistic_id_slugified() -> None:
+    """Scooter ids are slugified into valid statistic ids."""
+    stat_id = statistic_id("Scooter-00A1.b", "trip_distance")
+    assert stat_id == "sunshine:scooter_00a1_b_trip_distance"
+    # Statistic ids follow the entity id rules with a colon instead of the dot
+    assert valid_entity_id(stat_id.replace(":", "."))
+
+
+def test_late_trip_rewinds_import(store: TripStore) -> None:
+    """A trip older than the import moves it back with the sums before its hour."""
+    store.write_trips("s-1", [trip(1, "2026-10-18T08:10:00Z", 1000, 20)])
+    store.set_import_progress("s-1", "2026-10-18T12:00:00+00:00", 1.0, 20.0, 1)
+
+    # Newer than the import, nothing to redo
+    store.write_trips("s-1", [trip(3, "2026-10-18T12:05:00Z", 700, 5)])
+    assert store.import_progress("s-1") == ("2026-10-18T12:00:00+00:00", 1.0, 20.0, 1)
+
+    store.write_trips("s-1", [trip(2, "2026-10-18T09:40:00Z", 2000, 30)])
+    assert store.import_progress("s-1") == ("2026-10-18T09:00:00+00:00", 1.0, 20.0, 1)
+
+    store.write_trips("s-1", [trip(4, "2026-10-18T08:50:00Z", 500, 10)])
+    assert store.import_progress("s-1") == ("2026-10-18T08:00:00+00:00", 0.0, 0.0, 0)
+    assert store.import_progress("s-2") is None
+
+
+async def test_backfill_imports_late_trips(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    store: TripStore,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Trips synced after their hour was imported end up in the statistics."""
+    freezer.move_to(NOW)
+    backfill = StatisticsBackfill(hass, store)
+    store.write_trips(
+        "s-1",
+        [trip(1, "2026-10-18T08:10:00Z", 1000, 20), trip(2, "2026-10-18T09:20:00Z", 2000, 30)],
+    )
+    assert await backfill.async_backfill("s-1", "Scooter") == 2
+    await async_wait_recording_done(hass)
+    assert await _async_hourly(hass, "trip_distance") == {"08:00": (1.0, 1.0), "09:00": (2.0, 3.0)}
+    assert await backfill.async_backfill("s-1", "Scooter") == 0
+
+    store.write_trips("s-1", [trip(3, "2026-10-18T08:40:00Z", 500, 10)])
+    assert await backfill.async_backfill("s-1", "Scooter") == 2
+    await async_wait_recording_done(hass)
+    assert await _async_hourly(hass, "trip_distance") == {"08:00": (1.5, 1.5), "09:00": (2.0, 3.5)}
+    assert await _async_hourly(hass, "trip_count") == {"08:00": (2, 2), "09:00": (1, 3)}
+    assert await _async_hourly(hass, "trip_energy") == {"08:00": (30, 30), "09:00": (30, 60)}
@@ -0,0 +1,86 @@
+"""Tests of the Sunshine Scooter change detection."""
+from __future__ import annotations
+
+from custom_components.sunshine.changes import (
+    diff_paths,
+    field_tree,
+    is_projected,
+    path_value,
+    paths_overlap,
+    project,
+)
+
+SCOOTER = {
+    "id": "s1",
+    "state": "parked",
+    "location": {"lat": 52.5, "lng": 13.4},
+    "batteries": {
+        "battery0": {"level": 80, "voltage": 52.1},
+        "battery1": {"level": 65, "voltage": 51.4},
+    },
+}
+
+
+def test_diff_paths_nested_leaves() -> None:
+    """Changed leaves are reported by their dotted path."""
+    new = {
+        **SCOOTER,
+        "state": "locked",
+        "batteries": {**SCOOTER["batteries"], "battery0": {"level": 79, "voltage": 52.1}},
+    }
+    assert diff_paths(SCOOTER, new) == {"state", "batteries.battery0.level"}
+
+
+def test_diff_paths_added_removed_and_replaced() -> None:
+    """Added and removed keys and values changing type are reported whole."""
+    old = {"a": 1, "b": {"c": 1}, "d": {"e": 1}}
+    new = {"b": {"c": 1}, "d": 5, "f": {"g": 1}}
+    assert diff_paths(old, new) == {"a", "d", "f"}
+    assert diff_paths(SCOOTER, SCOOTER) == set()
+
+
+def test_path_value() -> None:
+    """Dotted paths resolve into nested dicts, missing parts give None."""
+    assert path_value(SCOOTER, "batteries.battery1.level") == 65
+    assert path_value(SCOOTER, "location") == {"lat": 52.5, "lng": 13.4}
+    assert path_value(SCOOTER, "batteries.battery2.level") is None
+    assert path_value(SCOOTER, "state.level") is None
+
+
+def test_paths_overlap() -> None:
+    """Paths overlap if equal or nested in either direction, not on a shared prefix."""
+    assert paths_overlap({"state"}, ["state"])
+    assert paths_overlap({"batteries"}, ["batteries.battery0.level"])
+    assert paths_overlap({"batteries.battery0.level"}, ["batteries"])
+    assert not paths_overlap({"batteries.battery0.level"}, ["batteries.battery1"])
+    assert not paths_overlap({"state_humanized"}, ["state"])
+    assert not paths_overlap(set(), ["state"])
+
+
+def test_field_tree() -> None:
+    """A parent field keeps its subtree whole, whatever the order."""
+    assert field_tree(["batteries.battery0.level", "id", "batteries.battery0.voltage"]) == {
+        "id": None,
+        "batteries": {"battery0": {"level": None, "voltage": None}},
+    }
+    assert field_tree(["location.lat", "location"]) == {"location": None}
+    assert field_tree(["location", "location.lat"]) == {"location": None}
+
+
+def test_project() -> None:
+    """Projection keeps only the fields of the tree, missing ones are skipped."""
+    tree = field_tree(["id", "location", "batteries.battery0.level", "speed"])
+    assert project(SCOOTER, tree) == {
+        "id": "s1",
+        "location": {"lat": 52.5, "lng": 13.4},
+        "batteries": {"battery0": {"level": 80}},
+    }
+
+
+def test_is_projected() -> None:
+    """A payload is projected if it holds no field outside the tree."""
+    tree = field_tree(["id", "location", "batteries.battery0.level"])
+    assert is_projected(project(SCOOTER, tree), tree)
+    assert is_projected({"id": "s1"}, tree)
+    assert not is_projected(SCOOTER, tree)
+    assert not is_projected({"batteries": {"battery0": {"voltage": 52.1}}}, tree)
@@ -0,0 +1,183 @@
+"""Tests of the Sunshine Scooter per-scooter command queue."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine
+from functools import partial
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.sunshine.commands import CommandQueue, SunshineCommandSuperseded
+
+
+def create_task(coro: Coroutine[Any, Any, None], name: str) -> asyncio.Task:
+    """Start a worker on the running loop."""
+    return asyncio.get_running_loop().create_task(coro, name=name)
+
+
+class Backend:
+    """Record sent commands, each held until released."""
+
+    def __init__(self) -> None:
+        """Initialize the backend."""
+        self.sent: list[str] = []
+        self.release: dict[str, asyncio.Event] = {}
+
+    def call(self, command: str, result: Any = None) -> Callable[[], Awaitable[Any]]:
+        """Return a call sending a command."""
+
+        async def _call() -> Any:
+            self.sent.append(command)
+            event = self.release.setdefault(command, asyncio.Event())
+            await event.wait()
+            event.clear()
+            if isinstance(result, Exception):
+                raise result
+            return result or command
+
+        return _call
+
+    def finish(self, command: str) -> None:
+        """Let the sent command complete."""
+        self.release.setdefault(command, asyncio.Event()).set()
+
+
+async def test_serialized_per_scooter() -> None:
+    """Commands to one scooter go out one at a time, other scooters in parallel."""
+    queue = CommandQueue(create_task)
+    backend = Backend()
+    first = asyncio.ensure_future(queue.submit("s1", "honk", None, backend.call("honk")))
+    second = asyncio.ensure_future(queue.submit("s1", "locate", None, backend.call("locate")))
+    other = asyncio.ensure_future(queue.submit("s2", "lock", None, backend.call("lock")))
+    await asyncio.sleep(0)
+    assert backend.sent == ["honk", "lock"]
+
+    backend.finish("honk")
+    assert await first == "honk"
+    await asyncio.sleep(0)
+    assert backend.sent == ["honk", "lock", "locate"]
+
+    backend.finish("locate")
+    backend.finish("lock")
+    assert await second == "locate"
+    assert await other == "lock"
+
+
+async def test_identical_commands_share_a_send() -> None:
+    """An identical queued or in-flight command is sent once for all callers."""
+    queue = CommandQueue(create_task)
+    backend = Backend()
+    calls = [
+        asyncio.ensure_future(queue.submit("s1", "honk", None, backend.call("honk")))
+        for _ in range(2)
+    ]
+    calls += [
+        asyncio.ensure_future(queue.submit("s1", "trigger_alarm", {"duration": "5s"}, backend.call("alarm")))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    calls.append(asyncio.ensure_future(queue.submit("s1", "honk", None, backend.call("honk"))))
+
+    backend.finish("honk")
+    backend.finish("alarm")
+    assert await asyncio.gather(*calls) == ["honk", "honk", "alarm", "alarm", "honk"]
+    assert backend.sent == ["honk", "alarm"]
+
+
+async def test_queued_command_superseded() -> None:
+    """A queued command is replaced by a later one of the same slot."""
+    queue = CommandQueue(create_task)
+    backend = Backend()
+    honk = asyncio.ensure_future(queue.submit("s1", "honk", None, backend.call("honk")))
+    unlock = asyncio.ensure_future(queue.submit("s1", "unlock", None, backend.call("unlock")))
+    lock = asyncio.ensure_future(queue.submit("s1", "lock", None, backend.call("lock")))
+    await asyncio.sleep(0)
+
+    with pytest.raises(SunshineCommandSuperseded):
+        await unlock
+    backend.finish("honk")
+    backend.finish("lock")
+    assert await honk == "honk"
+    assert await lock == "lock"
+    assert backend.sent == ["honk", "lock"]
+
+
+async def test_in_flight_not_shared_across_queued_slot() -> None:
+    """Lock, unlock, lock ends locked instead of joining the first lock."""
+    queue = CommandQueue(create_task)
+    backend = Backend()
+    first = asyncio.ensure_future(queue.submit("s1", "lock", None, backend.call("lock")))
+    await asyncio.sleep(0)
+    unlock = asyncio.ensure_future(queue.submit("s1", "unlock", None, backend.call("unlock")))
+    second = asyncio.ensure_future(queue.submit("s1", "lock", None, backend.call("lock")))
+
+    with pytest.raises(SunshineCommandSuperseded):
+        # Joining the first lock would leave the unlock queued
+        await asyncio.wait_for(unlock, 1)
+    backend.finish("lock")
+    assert await first == "lock"
+    await asyncio.sleep(0)
+    backend.finish("lock")
+    assert await second == "lock"
+    assert backend.sent == ["lock", "lock"]
+
+
+async def test_cancelled_caller_leaves_queue_alone() -> None:
+    """Cancelling a caller neither cancels its command nor the ones queued behind it."""
+    queue = CommandQueue(create_task)
+    backend = Backend()
+    honk = asyncio.ensure_future(queue.submit("s1", "honk", None, backend.call("honk")))
+    shared = asyncio.ensure_future(queue.submit("s1", "honk", None, backend.call("honk")))
+    locate = asyncio.ensure_future(queue.submit("s1", "locate", None, backend.call("locate")))
+    await asyncio.sleep(0)
+
+    honk.cancel()
+    await asyncio.sleep(0)
+    assert honk.cancelled()
+
+    backend.finish("honk")
+    assert await shared == "honk"
+    await asyncio.sleep(0)
+    backend.finish("locate")
+    assert await locate == "locate"
+    assert backend.sent == ["honk", "locate"]
+
+
+async def test_failure_reaches_caller() -> None:
+    """A failing command raises for its callers and the queue moves on."""
+    queue = CommandQueue(create_task)
+    backend = Backend()
+    failing = asyncio.ensure_future(
+        queue.submit("s1", "honk", None, backend.call("honk", ValueError("refused")))
+    )
+    locate = asyncio.ensure_future(queue.submit("s1", "locate", None, backend.call("locate")))
+    await asyncio.sleep(0)
+
+    backend.finish("honk")
+    with pytest.raises(ValueError, match="refused"):
+        await failing
+    backend.finish("locate")
+    assert await locate == "locate"
+
+
+async def test_workers_cancelled_on_unload(
+    hass: HomeAssistant, config_entry: MockConfigEntry
+) -> None:
+    """Workers run as background tasks of the entry and stop when it unloads."""
+    queue = CommandQueue(partial(config_entry.async_create_background_task, hass))
+    backend = Backend()
+    honk = asyncio.ensure_future(queue.submit("s1", "honk", None, backend.call("honk")))
+    locate = asyncio.ensure_future(queue.submit("s1", "locate", None, backend.call("locate")))
+    await asyncio.sleep(0)
+    assert backend.sent == ["honk"]
+
+    await config_entry._async_process_on_unload(hass)
+    with pytest.raises(asyncio.CancelledError):
+        await honk
+    with pytest.raises(asyncio.CancelledError):
+        await locate
+    assert backend.sent == ["honk"]
@@ -0,0 +1,54 @@
+"""Tests of the Sunshine Scooter config flow."""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.config_entries import SOURCE_REAUTH
+from homeassistant.const import CONF_TOKEN
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.sunshine.const import DOMAIN
+
+
+async def test_reauth_updates_token(
+    recorder_mock: Recorder, enable_custom_integrations: None, hass: HomeAssistant
+) -> None:
+    """A rejected token is replaced through the reauth flow and the entry reloaded."""
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_TOKEN: "old-token"}, unique_id="old-toke")
+    entry.add_to_hass(hass)
+
+    result = await entry.start_reauth_flow(hass)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "reauth_confirm"
+
+    with patch(
+        "custom_components.sunshine.config_flow.SunshineAPI.test_authentication",
+        AsyncMock(side_effect=Exception("401")),
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {CONF_TOKEN: "bad-token"}
+        )
+    assert result["errors"] == {"base": "invalid_auth"}
+
+    with (
+        patch(
+            "custom_components.sunshine.config_flow.SunshineAPI.test_authentication",
+            AsyncMock(return_value=True),
+        ),
+        patch("custom_components.sunshine.async_setup_entry", return_value=True) as setup,
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {CONF_TOKEN: "new-token"}
+        )
+        await hass.async_block_till_done()
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "reauth_successful"
+    assert entry.data[CONF_TOKEN] == "new-token"
+    assert len(setup.mock_calls) == 1
+    assert not hass.config_entries.flow.async_progress_by_handler(
+        DOMAIN, match_context={"source": SOURCE_REAUTH}
+    )
@@ -0,0 +1,50 @@
+"""Tests of the Sunshine Scooter command convergence polling."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.sunshine.coordinator import SunshineDataUpdateCoordinator
+from custom_components.sunshine.polling import INTERVAL_ACTIVE, INTERVAL_DORMANT, INTERVAL_JITTER
+
+from conftest import FleetAPI, make_scooter
+
+# The coordinator leaves its throttled snapshot write scheduled
+pytestmark = pytest.mark.parametrize("expected_lingering_timers", [True])
+
+
+async def test_tracked_command_boosts_polling(
+    hass: HomeAssistant, coordinator: SunshineDataUpdateCoordinator, fleet_api: FleetAPI
+) -> None:
+    """A command confirmed on its scooter alone still speeds up fleet polls."""
+    unsubscribe = coordinator.async_add_listener(lambda: None)
+    for scooter_id in fleet_api.scooters:
+        fleet_api.scooters[scooter_id]["state"] = "hibernating"
+    await coordinator.async_refresh()
+    assert coordinator.update_interval >= INTERVAL_DORMANT * (1 - INTERVAL_JITTER)
+    polls = fleet_api.polls
+
+    await coordinator.async_send_command("s1", "lock")
+    assert coordinator.update_interval == INTERVAL_ACTIVE
+
+    # The poll scheduled at the dormant interval was brought forward
+    async_fire_time_changed(hass, dt_util.utcnow() + INTERVAL_ACTIVE + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert fleet_api.polls == polls + 1
+    unsubscribe()
+
+
+async def test_merge_adjusts_interval(coordinator: SunshineDataUpdateCoordinator) -> None:
+    """Merging a converged scooter picks the interval from its new state."""
+    coordinator.update_interval = INTERVAL_ACTIVE
+    coordinator.data = {**coordinator.data, "s2": make_scooter("s2", state="hibernating")}
+
+    coordinator._async_merge_scooter("s1", make_scooter("s1", state="hibernating"), True)
+
+    assert coordinator.data["s1"]["state"] == "hibernating"
+    assert abs(coordinator.update_interval - INTERVAL_DORMANT) <= INTERVAL_DORMANT * INTERVAL_JITTER
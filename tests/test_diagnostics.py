@@ -0,0 +1,42 @@
+"""Tests of the Sunshine Scooter diagnostics."""
+from __future__ import annotations
+
+import json
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.core import HomeAssistant
+
+from custom_components.sunshine.const import DOMAIN
+from custom_components.sunshine.coordinator import SunshineDataUpdateCoordinator
+from custom_components.sunshine.diagnostics import async_get_config_entry_diagnostics
+
+from conftest import FleetAPI
+
+
+async def test_diagnostics_redacted(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    coordinator: SunshineDataUpdateCoordinator,
+    fleet_api: FleetAPI,
+) -> None:
+    """The token, VINs and anything locating a scooter are redacted."""
+    fleet_api.scooters["s1"]["destination"] = {"lat": 52.4, "lng": 13.3, "address": "Home 1"}
+    await coordinator.async_refresh()
+    hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = {
+        "api": fleet_api,
+        "coordinator": coordinator,
+        "session": None,
+    }
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+    assert diagnostics["entry"]["data"] == {"token": REDACTED}
+    scooter = diagnostics["scooters"]["s1"]
+    assert scooter["vin"] == scooter["location"] == scooter["destination"] == REDACTED
+    assert scooter["state"] == "parked"
+    assert diagnostics["coordinator"]["scooters"] == 2
+
+    dumped = json.dumps(diagnostics)
+    for secret in ("WUNUs1", "52.5", "13.4", "Home 1"):
+        assert secret not in dumped
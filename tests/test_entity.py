@@ -0,0 +1,85 @@
+"""Tests of the Sunshine Scooter entity creation."""
+from __future__ import annotations
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+
+from custom_components.sunshine.const import DOMAIN
+from custom_components.sunshine.coordinator import SunshineDataUpdateCoordinator
+from custom_components.sunshine.entity import async_add_scooter_entities
+from custom_components.sunshine.sensor import SENSOR_TYPES, SunshineSensor
+
+from conftest import FleetAPI, make_scooter
+
+
+def _add_sensors(
+    config_entry: MockConfigEntry, coordinator: SunshineDataUpdateCoordinator
+) -> list[str]:
+    """Add the telemetry sensors of every scooter, returning their unique ids as added."""
+    added: list[str] = []
+
+    def _scooter_entities(scooter_id: str) -> list[SensorEntity]:
+        return [SunshineSensor(coordinator, scooter_id, description) for description in SENSOR_TYPES]
+
+    async_add_scooter_entities(
+        config_entry,
+        coordinator,
+        lambda entities: added.extend(entity.unique_id for entity in entities),
+        _scooter_entities,
+    )
+    return added
+
+
+async def test_entities_follow_reported_data(
+    config_entry: MockConfigEntry, coordinator: SunshineDataUpdateCoordinator, fleet_api: FleetAPI
+) -> None:
+    """Sensors are created for reported data only, the others once it shows up."""
+    added = _add_sensors(config_entry, coordinator)
+    assert {"s1_battery_level", "s2_battery_level", "s1_speed"} <= set(added)
+    assert not [unique_id for unique_id in added if "battery1" in unique_id]
+    assert "s1_battery0_voltage" not in added
+    count = len(added)
+
+    # A second battery is inserted into s1
+    fleet_api.scooters["s1"]["batteries"]["battery1"] = {"level": 55, "voltage": 51.2}
+    await coordinator.async_refresh()
+    assert sorted(added[count:]) == ["s1_battery1_level", "s1_battery1_voltage"]
+
+    # Nothing new, nothing added twice
+    await coordinator.async_refresh()
+    fleet_api.scooters["s2"]["speed"] = 10
+    await coordinator.async_refresh()
+    assert len(added) == count + 2
+    assert len(set(added)) == len(added)
+
+
+async def test_scooters_discovered_and_retired(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    coordinator: SunshineDataUpdateCoordinator,
+    fleet_api: FleetAPI,
+) -> None:
+    """Added scooters get entities without a reload, removed ones lose their device."""
+    device_registry = dr.async_get(hass)
+    for scooter_id in ("s1", "s2"):
+        device_registry.async_get_or_create(
+            config_entry_id=config_entry.entry_id, identifiers={(DOMAIN, scooter_id)}
+        )
+    added = _add_sensors(config_entry, coordinator)
+    count = len(added)
+
+    fleet_api.scooters["s3"] = make_scooter("s3")
+    del fleet_api.scooters["s2"]
+    await coordinator.async_refresh()
+    assert "s3_battery_level" in added[count:]
+    assert all(unique_id.startswith("s3_") for unique_id in added[count:])
+    assert device_registry.async_get_device(identifiers={(DOMAIN, "s2")}) is None
+    assert device_registry.async_get_device(identifiers={(DOMAIN, "s1")}) is not None
+
+    # A poll returning no scooters at all is not taken as all of them leaving
+    fleet_api.scooters.clear()
+    await coordinator.async_refresh()
+    assert device_registry.async_get_device(identifiers={(DOMAIN, "s1")}) is not None
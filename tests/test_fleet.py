@@ -0,0 +1,42 @@
+"""Tests of the Sunshine Scooter fleet aggregates."""
+from __future__ import annotations
+
+from custom_components.sunshine.coordinator import SunshineDataUpdateCoordinator
+from custom_components.sunshine.fleet import FleetStats, compute_fleet_stats
+
+from conftest import FleetAPI, make_scooter
+
+
+def test_compute_fleet_stats() -> None:
+    """Aggregates skip missing and malformed values instead of counting them as zero."""
+    scooters = {
+        "s1": make_scooter("s1", odometer=1000000),
+        "s2": make_scooter(
+            "s2", state="locked", online=False, odometer="2500500", batteries={"battery0": {"level": 15}}
+        ),
+        "s3": make_scooter("s3", state="locked", odometer="garbage", batteries={"battery0": {"level": "x"}}),
+        "s4": make_scooter("s4", state=None, odometer=None, batteries=None),
+    }
+    assert compute_fleet_stats(scooters, 20) == FleetStats(
+        total=4,
+        online=3,
+        battery_mean=47.5,
+        battery_min=15.0,
+        odometer_km=3500.5,
+        low_battery=1,
+        states={"parked": 1, "locked": 2},
+    )
+    assert compute_fleet_stats({}, 20) == FleetStats()
+
+
+async def test_fleet_stats_follow_data(
+    coordinator: SunshineDataUpdateCoordinator, fleet_api: FleetAPI
+) -> None:
+    """The coordinator computes aggregates once per data and again after it changed."""
+    stats = coordinator.fleet_stats
+    assert (stats.total, stats.battery_mean) == (2, 80.0)
+    assert coordinator.fleet_stats is stats
+
+    fleet_api.scooters["s2"]["batteries"]["battery0"]["level"] = 40
+    await coordinator.async_refresh()
+    assert coordinator.fleet_stats.battery_mean == 60.0
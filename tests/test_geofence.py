@@ -0,0 +1,124 @@
+"""Tests of the Sunshine Scooter geofence engine."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.sunshine.geofence import (
+    FENCE_CIRCLE,
+    FENCE_POLYGON,
+    GeofenceEngine,
+    fence_from_dict,
+    scooter_position,
+)
+
+# A square of about 1.1 by 0.7 km around Berlin Mitte
+SQUARE = {
+    "id": "mitte",
+    "name": "Mitte",
+    "points": [[52.51, 13.39], [52.51, 13.40], [52.52, 13.40], [52.52, 13.39]],
+}
+# 100 m around a point inside the square
+HOME = {"id": "home", "name": "Home", "latitude": 52.515, "longitude": 13.395, "radius": 100}
+# Spans far more grid cells than are indexed
+COUNTRY = {
+    "id": "country",
+    "name": "Country",
+    "points": [[47.0, 5.0], [47.0, 15.0], [55.0, 15.0], [55.0, 5.0]],
+}
+
+
+def test_fence_from_dict() -> None:
+    """Fences are read from their stored form and written back unchanged."""
+    square = fence_from_dict(SQUARE)
+    assert square.kind == FENCE_POLYGON
+    assert square.as_dict() == SQUARE
+    home = fence_from_dict(HOME)
+    assert home.kind == FENCE_CIRCLE
+    assert home.as_dict() == HOME
+    assert home.area < square.area
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"id": "a", "name": "A", "points": [[52.5, 13.4], [52.6, 13.4]]},
+        {"id": "a", "name": "A", "latitude": 52.5, "longitude": 13.4},
+    ],
+)
+def test_fence_from_dict_invalid(data: dict) -> None:
+    """Fences need three points or a full circle."""
+    with pytest.raises(ValueError):
+        fence_from_dict(data)
+
+
+def test_contains() -> None:
+    """Positions are tested against circles and polygons."""
+    square = fence_from_dict(SQUARE)
+    home = fence_from_dict(HOME)
+    assert square.contains(52.515, 13.395)
+    assert not square.contains(52.525, 13.395)
+    assert not square.contains(52.515, 13.401)
+    # About 70 m and 140 m north of the centre
+    assert home.contains(52.51563, 13.395)
+    assert not home.contains(52.51626, 13.395)
+
+    triangle = fence_from_dict(
+        {"id": "t", "name": "T", "points": [[52.50, 13.40], [52.50, 13.42], [52.52, 13.40]]}
+    )
+    assert triangle.contains(52.505, 13.405)
+    # Inside the bounding box, outside the hypotenuse
+    assert not triangle.contains(52.515, 13.415)
+
+
+def test_lookup_uses_index_and_large_fences() -> None:
+    """Lookups find indexed fences and fences too large for the index."""
+    engine = GeofenceEngine()
+    for data in (SQUARE, HOME, COUNTRY):
+        engine.add(fence_from_dict(data))
+    assert engine.lookup(52.515, 13.395) == {"mitte", "home", "country"}
+    assert engine.lookup(52.515, 13.399) == {"mitte", "country"}
+    assert engine.lookup(48.1, 11.6) == {"country"}
+    assert engine.lookup(40.4, -3.7) == set()
+
+
+def test_update_transitions() -> None:
+    """Updates report only the fences entered and exited."""
+    engine = GeofenceEngine()
+    engine.add(fence_from_dict(SQUARE))
+    engine.add(fence_from_dict(HOME))
+
+    assert engine.update("s1", 52.515, 13.395) == ({"mitte", "home"}, set())
+    assert engine.update("s1", 52.5151, 13.3951) == (set(), set())
+    assert engine.update("s1", 52.515, 13.399) == (set(), {"home"})
+    assert engine.inside("s1") == {"mitte"}
+    assert engine.update("s1", 52.53, 13.399) == (set(), {"mitte"})
+    assert engine.inside("s2") == set()
+
+
+def test_fence_changes_reevaluated() -> None:
+    """Adding, replacing and removing fences moves scooters in and out."""
+    engine = GeofenceEngine()
+    engine.update("s1", 52.515, 13.395)
+    engine.update("s2", 48.1, 11.6)
+
+    engine.add(fence_from_dict(HOME))
+    assert engine.reevaluate() == {"s1": ({"home"}, set()), "s2": (set(), set())}
+
+    # Shrunk to leave the scooter outside
+    engine.add(fence_from_dict({**HOME, "latitude": 52.52}))
+    assert engine.reevaluate()["s1"] == (set(), {"home"})
+
+    engine.add(fence_from_dict(COUNTRY))
+    engine.reevaluate()
+    assert engine.remove("country")
+    assert not engine.remove("country")
+    assert engine.reevaluate() == {"s1": (set(), {"country"}), "s2": (set(), {"country"})}
+    assert engine.lookup(52.52, 13.395) == {"home"}
+
+
+def test_scooter_position() -> None:
+    """Scooters without a valid location have no position."""
+    assert scooter_position({"location": {"lat": "52.5", "lng": 13.4}}) == (52.5, 13.4)
+    assert scooter_position({"location": {"lat": None, "lng": 13.4}}) is None
+    assert scooter_position({"location": None}) is None
+    assert scooter_position({}) is None
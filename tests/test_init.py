@@ -0,0 +1,30 @@
+"""Tests of the Sunshine Scooter config entry lifecycle."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.sunshine import async_remove_entry
+
+
+async def test_remove_entry_deletes_stores(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    config_entry: MockConfigEntry,
+    tmp_path: Path,
+) -> None:
+    """Removing an entry deletes its snapshot, geofences and trips, not other entries'."""
+    hass.config.config_dir = str(tmp_path)
+    for entry_id in (config_entry.entry_id, "other"):
+        for name in ("snapshot", "geofences"):
+            hass_storage[f"sunshine.{entry_id}.{name}"] = {"version": 1, "data": {}}
+        (tmp_path / f"sunshine_trips_{entry_id}.db").touch()
+
+    await async_remove_entry(hass, config_entry)
+
+    assert set(hass_storage) == {"sunshine.other.snapshot", "sunshine.other.geofences"}
+    assert [path.name for path in tmp_path.iterdir()] == ["sunshine_trips_other.db"]
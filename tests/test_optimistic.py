@@ -0,0 +1,54 @@
+"""Tests of the Sunshine Scooter optimistic command outcomes."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.sunshine.const import UNLOCKED_STATES
+from custom_components.sunshine.coordinator import SunshineDataUpdateCoordinator
+from custom_components.sunshine.optimistic import apply_patch, expected_patch, patch_confirmed
+
+from conftest import FleetAPI, make_scooter
+
+
+@pytest.mark.parametrize(
+    ("command", "reported"),
+    [
+        ("lock", "locked"),
+        ("lock", "stand-by"),
+        ("unlock", "parked"),
+        ("unlock", "ready-to-drive"),
+    ],
+)
+def test_expected_lock_state_confirmed(command: str, reported: str) -> None:
+    """Every state a lock command settles in confirms the patch and reads the same."""
+    patch = expected_patch(command, (), {})
+    before = make_scooter("s1", state="stand-by" if command == "unlock" else "parked")
+    after = make_scooter("s1", state=reported)
+
+    assert not patch_confirmed(before, patch)
+    assert patch_confirmed(after, patch)
+    assert (apply_patch(before, patch)["state"] in UNLOCKED_STATES) == (reported in UNLOCKED_STATES)
+
+
+def test_other_state_not_confirming() -> None:
+    """Only the expected state and its equivalents confirm a patch."""
+    assert not patch_confirmed(make_scooter("s1", state="parked"), {"state": "locked"})
+    assert not patch_confirmed(make_scooter("s1", state="stand-by"), {"state": "parked"})
+    assert not patch_confirmed(make_scooter("s1", state="stand-by"), {"state": "hibernating"})
+
+
+@pytest.mark.parametrize("reported", ["locked", "stand-by"])
+async def test_lock_converges_on_reported_state(
+    coordinator: SunshineDataUpdateCoordinator, fleet_api: FleetAPI, reported: str
+) -> None:
+    """The optimistic lock gives way to the reported state once it is confirmed."""
+    await coordinator.async_send_command("s1", "lock")
+    assert coordinator.data["s1"]["state"] == "locked"
+
+    fleet_api.scooters["s1"]["state"] = reported
+    await coordinator.async_refresh()
+    assert coordinator.data["s1"]["state"] == reported
+    # Confirmed, a later poll is not overridden by the patch
+    fleet_api.scooters["s1"]["state"] = "parked"
+    await coordinator.async_refresh()
+    assert coordinator.data["s1"]["state"] == "parked"
@@ -0,0 +1,78 @@
+"""Tests of the Sunshine Scooter adaptive poll intervals."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from custom_components.sunshine.polling import (
+    INTERVAL_ACTIVE,
+    INTERVAL_DORMANT,
+    INTERVAL_IDLE,
+    INTERVAL_JITTER,
+    INTERVAL_PARKED,
+    STALE_AFTER,
+    fleet_poll_interval,
+    jittered,
+    scooter_poll_interval,
+)
+
+from conftest import make_scooter
+
+NOW = datetime.fromisoformat("2026-10-18T08:30:00+00:00")
+
+
+@pytest.mark.parametrize(
+    ("fields", "interval"),
+    [
+        ({"state": "ready-to-drive"}, INTERVAL_ACTIVE),
+        ({"state": "parked", "speed": 12}, INTERVAL_ACTIVE),
+        ({"state": "parked"}, INTERVAL_PARKED),
+        ({"state": "something-new"}, INTERVAL_PARKED),
+        ({"state": "parked", "speed": "garbage"}, INTERVAL_PARKED),
+        ({"state": "stand-by"}, INTERVAL_IDLE),
+        ({"state": "locked"}, INTERVAL_IDLE),
+        ({"state": "hibernating"}, INTERVAL_DORMANT),
+        # Offline scooters wait longer the longer they have been gone
+        ({"state": "parked", "online": False}, INTERVAL_IDLE),
+        (
+            {
+                "state": "parked",
+                "online": False,
+                "last_seen_at": (NOW - STALE_AFTER - timedelta(minutes=1)).isoformat(),
+            },
+            INTERVAL_DORMANT,
+        ),
+        ({"state": "parked", "online": False, "last_seen_at": None}, INTERVAL_DORMANT),
+        ({"state": "parked", "online": False, "last_seen_at": "2026-10-18T08:00:00"}, INTERVAL_IDLE),
+    ],
+)
+def test_scooter_poll_interval(fields: dict, interval: timedelta) -> None:
+    """Each scooter asks for an interval matching its state."""
+    assert scooter_poll_interval(make_scooter("s1", **fields), NOW) == interval
+
+
+def test_fleet_poll_interval() -> None:
+    """The most urgent scooter sets the fleet's interval, a command boost overrides all."""
+    fleet = {
+        "s1": make_scooter("s1", state="hibernating"),
+        "s2": make_scooter("s2", state="stand-by"),
+    }
+    assert fleet_poll_interval(fleet, NOW) == INTERVAL_IDLE
+    fleet["s3"] = make_scooter("s3", state="ready-to-drive")
+    assert fleet_poll_interval(fleet, NOW) == INTERVAL_ACTIVE
+    assert fleet_poll_interval({}, NOW) == INTERVAL_PARKED
+
+    dormant = {"s1": make_scooter("s1", state="hibernating")}
+    assert fleet_poll_interval(dormant, NOW, NOW + timedelta(seconds=1)) == INTERVAL_ACTIVE
+    assert fleet_poll_interval(dormant, NOW, NOW) == INTERVAL_DORMANT
+
+
+def test_jittered() -> None:
+    """Jitter stays within its bounds and actually spreads intervals."""
+    intervals = {jittered(INTERVAL_PARKED) for _ in range(100)}
+    assert len(intervals) > 1
+    for interval in intervals:
+        assert INTERVAL_PARKED * (1 - INTERVAL_JITTER) <= interval <= INTERVAL_PARKED * (
+            1 + INTERVAL_JITTER
+        )
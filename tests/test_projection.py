@@ -0,0 +1,107 @@
+"""Tests of the Sunshine Scooter field projection of fleet polls."""
+from __future__ import annotations
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.sunshine.const import DOMAIN
+from custom_components.sunshine.coordinator import SunshineDataUpdateCoordinator
+from custom_components.sunshine.projection import (
+    CORE_FIELDS,
+    async_needed_fields,
+    async_track_fields,
+)
+from custom_components.sunshine.sensor import SENSOR_TYPES
+
+from conftest import FleetAPI, make_scooter
+
+RPM = "telemetry.engine.motor_rpm"
+
+
+def _disable(
+    hass: HomeAssistant, config_entry: MockConfigEntry, domain: str, unique_id: str
+) -> er.RegistryEntry:
+    """Register an entity of the entry disabled by the user."""
+    return er.async_get(hass).async_get_or_create(
+        domain,
+        DOMAIN,
+        unique_id,
+        config_entry=config_entry,
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+
+
+async def test_needed_fields(
+    hass: HomeAssistant, config_entry: MockConfigEntry, coordinator: SunshineDataUpdateCoordinator
+) -> None:
+    """Fields are dropped once their sensor is disabled for every scooter."""
+    fields = async_needed_fields(hass, coordinator)
+    assert fields >= set(CORE_FIELDS)
+    assert fields >= {path for description in SENSOR_TYPES for path in description.paths}
+
+    _disable(hass, config_entry, "sensor", "s1_engine_rpm")
+    assert RPM in async_needed_fields(hass, coordinator)
+    _disable(hass, config_entry, "sensor", "s2_engine_rpm")
+    assert RPM not in async_needed_fields(hass, coordinator)
+
+    # Core fields stay whatever reads them is disabled
+    _disable(hass, config_entry, "binary_sensor", "s1_online")
+    _disable(hass, config_entry, "binary_sensor", "s2_online")
+    assert "online" in async_needed_fields(hass, coordinator)
+
+
+async def test_fields_follow_registry(
+    hass: HomeAssistant, config_entry: MockConfigEntry, coordinator: SunshineDataUpdateCoordinator
+) -> None:
+    """Disabling and enabling entities updates the polled fields."""
+    unsubscribe = async_track_fields(hass, coordinator)
+    assert RPM in coordinator.fields
+    registry = er.async_get(hass)
+    entries = [_disable(hass, config_entry, "sensor", f"{sid}_engine_rpm") for sid in ("s1", "s2")]
+    # Registered disabled, nothing updated yet
+    assert RPM in coordinator.fields
+
+    registry.async_update_entity(entries[0].entity_id, disabled_by=None)
+    registry.async_update_entity(entries[0].entity_id, disabled_by=er.RegistryEntryDisabler.USER)
+    await hass.async_block_till_done()
+    assert RPM not in coordinator.fields
+
+    registry.async_update_entity(entries[1].entity_id, disabled_by=None)
+    await hass.async_block_till_done()
+    assert RPM in coordinator.fields
+    unsubscribe()
+
+
+async def test_projection_kept_after_merge(
+    coordinator: SunshineDataUpdateCoordinator, fleet_api: FleetAPI
+) -> None:
+    """Pushed and converged updates are projected like polls before they are merged."""
+    coordinator.async_set_fields(frozenset({"id", "state", "batteries.battery0.level"}))
+    await coordinator.async_refresh()
+    # The backend ignored the projection, the poll was pruned instead
+    assert coordinator.data["s1"] == {
+        "id": "s1",
+        "state": "parked",
+        "batteries": {"battery0": {"level": 80}},
+    }
+
+    coordinator._async_handle_stream_update({
+        "id": "s1",
+        "speed": 12,
+        "state": "ready-to-drive",
+        "batteries": {"battery0": {"level": 79, "voltage": 52.0}},
+    })
+    assert coordinator.data["s1"] == {
+        "id": "s1",
+        "state": "ready-to-drive",
+        "batteries": {"battery0": {"level": 79}},
+    }
+
+    coordinator._async_merge_scooter("s1", make_scooter("s1", state="locked"), True)
+    assert coordinator.data["s1"] == {
+        "id": "s1",
+        "state": "locked",
+        "batteries": {"battery0": {"level": 80}},
+    }
@@ -0,0 +1,73 @@
+"""Tests of the Sunshine Scooter shared request rate limit."""
+from __future__ import annotations
+
+import asyncio
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.sunshine.ratelimit import (
+    DATA_SCHEDULERS,
+    PRIORITY_BACKGROUND,
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    RequestScheduler,
+    async_acquire_scheduler,
+    async_release_scheduler,
+)
+
+
+async def test_burst_is_immediate() -> None:
+    """Requests up to the burst size are let through without waiting."""
+    scheduler = RequestScheduler(rate=0.001, burst=3)
+    for _ in range(3):
+        await asyncio.wait_for(scheduler.acquire(PRIORITY_POLL), 0.1)
+
+
+async def test_waiters_served_by_priority() -> None:
+    """Once the bucket is empty, higher priority waiters get tokens first."""
+    scheduler = RequestScheduler(rate=20, burst=1)
+    await scheduler.acquire(PRIORITY_POLL)
+    order: list[int] = []
+
+    async def _acquire(priority: int) -> None:
+        await scheduler.acquire(priority)
+        order.append(priority)
+
+    tasks = [
+        asyncio.create_task(_acquire(priority))
+        for priority in (PRIORITY_BACKGROUND, PRIORITY_POLL, PRIORITY_COMMAND, PRIORITY_POLL)
+    ]
+    await asyncio.wait_for(asyncio.gather(*tasks), 1)
+    assert order == [PRIORITY_COMMAND, PRIORITY_POLL, PRIORITY_POLL, PRIORITY_BACKGROUND]
+
+
+async def test_cancelled_waiter_skipped() -> None:
+    """A cancelled waiter does not use up a token."""
+    scheduler = RequestScheduler(rate=5, burst=1)
+    await scheduler.acquire(PRIORITY_POLL)
+    cancelled = asyncio.create_task(scheduler.acquire(PRIORITY_COMMAND))
+    waiting = asyncio.create_task(scheduler.acquire(PRIORITY_BACKGROUND))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    # Served with the next token, not the one after
+    await asyncio.wait_for(waiting, 0.3)
+    assert cancelled.cancelled()
+
+
+async def test_scheduler_shared_per_backend(hass: HomeAssistant) -> None:
+    """Entries of one backend share a scheduler, dropped when the last releases it."""
+    first = async_acquire_scheduler(hass, "https://a.invalid")
+    assert async_acquire_scheduler(hass, "https://a.invalid") is first
+    other = async_acquire_scheduler(hass, "https://b.invalid")
+    assert other is not first
+
+    async_release_scheduler(hass, "https://a.invalid")
+    assert async_acquire_scheduler(hass, "https://a.invalid") is first
+    async_release_scheduler(hass, "https://a.invalid")
+    async_release_scheduler(hass, "https://a.invalid")
+    assert hass.data[DATA_SCHEDULERS] == {"https://b.invalid": other}
+
+    async_release_scheduler(hass, "https://b.invalid")
+    assert DATA_SCHEDULERS not in hass.data
+    assert async_acquire_scheduler(hass, "https://a.invalid") is not first
@@ -0,0 +1,130 @@
+"""Tests of the Sunshine Scooter refresh coalescing."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.sunshine import refresh
+from custom_components.sunshine.refresh import (
+    COALESCE_WINDOW,
+    DEADLINE_TOLERANCE,
+    FOLLOW_UP_DELAY,
+    RefreshCoalescer,
+)
+
+
+class Timers:
+    """Stand-in for async_call_later, fired by hand against a fake clock."""
+
+    def __init__(self) -> None:
+        """Initialize the timers."""
+        self.now = 1000.0
+        self.pending: list[tuple[float, Callable[[Any], None]]] = []
+
+    def call_later(self, hass: HomeAssistant, delay: float, action: Callable[[Any], None]) -> Callable[[], None]:
+        """Schedule an action, return its cancel callback."""
+        timer = (self.now + delay, action)
+        self.pending.append(timer)
+        return lambda: self.pending.remove(timer)
+
+    @property
+    def next_at(self) -> float | None:
+        """Return when the next timer fires."""
+        return min((when for when, _ in self.pending), default=None)
+
+    def fire_next(self) -> None:
+        """Advance the clock to the next timer and fire it."""
+        timer = min(self.pending, key=lambda timer: timer[0])
+        self.pending.remove(timer)
+        self.now = timer[0]
+        timer[1](None)
+
+
+@pytest.fixture
+def timers(monkeypatch: pytest.MonkeyPatch) -> Timers:
+    """Return hand-fired timers for the coalescer."""
+    timers = Timers()
+    monkeypatch.setattr(refresh, "time", SimpleNamespace(monotonic=lambda: timers.now))
+    monkeypatch.setattr(refresh, "async_call_later", timers.call_later)
+    return timers
+
+
+@pytest.fixture
+def refreshes() -> list[float]:
+    """Return the times fetches were made at."""
+    return []
+
+
+@pytest.fixture
+def coalescer(hass: HomeAssistant, timers: Timers, refreshes: list[float]) -> RefreshCoalescer:
+    """Return a coalescer recording its fetches."""
+
+    async def _refresh() -> None:
+        refreshes.append(timers.now)
+
+    return RefreshCoalescer(hass, _refresh)
+
+
+async def test_commands_share_refreshes(
+    hass: HomeAssistant, coalescer: RefreshCoalescer, timers: Timers, refreshes: list[float]
+) -> None:
+    """Commands within the window share one immediate and one follow-up fetch."""
+    coalescer.async_request("s1")
+    timers.now += COALESCE_WINDOW / 2
+    coalescer.async_request("s2")
+    assert len(timers.pending) == 1
+
+    timers.fire_next()
+    await hass.async_block_till_done()
+    assert refreshes == [1000.0 + COALESCE_WINDOW]
+
+    # Both follow-ups are due within the tolerance of each other
+    timers.fire_next()
+    await hass.async_block_till_done()
+    assert refreshes[1:] == [1000.0 + FOLLOW_UP_DELAY]
+    assert not timers.pending
+
+
+async def test_follow_up_only(
+    hass: HomeAssistant, coalescer: RefreshCoalescer, timers: Timers, refreshes: list[float]
+) -> None:
+    """Without an immediate refresh only the follow-up is fetched."""
+    coalescer.async_request("s1", immediate=False)
+    assert timers.next_at == 1000.0 + FOLLOW_UP_DELAY
+    timers.fire_next()
+    await hass.async_block_till_done()
+    assert refreshes == [1000.0 + FOLLOW_UP_DELAY]
+    assert not timers.pending
+
+
+async def test_regular_poll_satisfies_demands(
+    coalescer: RefreshCoalescer, timers: Timers, refreshes: list[float]
+) -> None:
+    """A fetch satisfies demands due soon, but not ones made after it started."""
+    coalescer.async_request("s1", follow_up=False)
+    started = timers.now
+    timers.now += 0.1
+    coalescer.async_request("s2", follow_up=False)
+
+    coalescer.async_refreshed(started)
+    assert timers.next_at == started + 0.1 + COALESCE_WINDOW
+
+    coalescer.async_refreshed(timers.now)
+    assert not timers.pending
+    assert not refreshes
+
+
+async def test_far_deadlines_kept(coalescer: RefreshCoalescer, timers: Timers) -> None:
+    """A fetch leaves demands due beyond its tolerance pending."""
+    coalescer.async_request("s1")
+    coalescer.async_refreshed(timers.now)
+    assert timers.next_at == 1000.0 + FOLLOW_UP_DELAY
+    assert FOLLOW_UP_DELAY > DEADLINE_TOLERANCE
+
+    coalescer.async_cancel()
+    assert not timers.pending
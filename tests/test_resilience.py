@@ -0,0 +1,135 @@
+"""Tests of the Sunshine Scooter retry policies and circuit breaker."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import aiohttp
+import pytest
+
+from custom_components.sunshine import resilience
+from custom_components.sunshine.api import SunshineAPI
+from custom_components.sunshine.resilience import (
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+    PROBE_TIMEOUT,
+    READ_POLICY,
+    CircuitBreaker,
+    parse_retry_after,
+)
+
+from conftest import Backend
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Return a settable monotonic clock for the breaker."""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(resilience, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def test_parse_retry_after() -> None:
+    """Retry-After is read as seconds or as an HTTP date."""
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("garbage") is None
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after("-3") == 0.0
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=120)
+    assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == pytest.approx(120, abs=2)
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_backoff_bounded() -> None:
+    """Backoff delays are jittered below the exponential bound and the cap."""
+    for attempt in range(1, 10):
+        delay = READ_POLICY.backoff(attempt)
+        assert 0 <= delay <= min(READ_POLICY.max_delay, READ_POLICY.base_delay * 2**attempt)
+
+
+def test_breaker_opens_after_threshold(clock: SimpleNamespace) -> None:
+    """Consecutive failures open the breaker, a success in between resets the count."""
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == BREAKER_CLOSED
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == BREAKER_OPEN
+    assert not breaker.allow()
+    assert breaker.retry_in == 30
+
+
+def test_breaker_single_probe(clock: SimpleNamespace) -> None:
+    """Once the timeout passed a single probe is let through."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock.now += 30
+    assert breaker.allow()
+    assert breaker.probing
+    assert not breaker.allow()
+
+    # A probe that never reported back is given up on
+    clock.now += PROBE_TIMEOUT + 1
+    assert breaker.allow()
+    assert breaker.state == BREAKER_HALF_OPEN
+
+    breaker.record_success()
+    assert breaker.state == BREAKER_CLOSED
+    assert not breaker.probing
+
+
+def test_breaker_failed_probe_backs_off(clock: SimpleNamespace) -> None:
+    """A failed probe reopens the breaker with a doubled, capped timeout."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, max_reset_timeout=100)
+    breaker.record_failure()
+    for expected in (60, 100, 100):
+        clock.now += breaker.retry_in
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == BREAKER_OPEN
+        assert breaker.retry_in == expected
+
+    clock.now += breaker.retry_in
+    assert breaker.allow()
+    breaker.record_success()
+    breaker.record_failure()
+    # The timeout is back at its base after recovering
+    assert breaker.retry_in == 30
+
+
+def test_breaker_honors_retry_after(clock: SimpleNamespace) -> None:
+    """A Retry-After opens the breaker for exactly that long, even when closed."""
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30)
+    breaker.record_failure(retry_after=7)
+    assert breaker.state == BREAKER_OPEN
+    assert breaker.retry_in == 7
+    clock.now += 7
+    assert breaker.allow()
+
+
+async def test_probe_not_retried(api: SunshineAPI, backend: Backend) -> None:
+    """The half-open probe is sent once, failure reopens the breaker at once."""
+    api.breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    api.breaker.record_failure()
+    await asyncio.sleep(0.02)
+
+    backend.scooters_status = 503
+    with pytest.raises(aiohttp.ClientResponseError):
+        await api.get_scooters()
+    assert backend.scooters_requests == 1
+    assert api.breaker.state == BREAKER_OPEN
+
+    await asyncio.sleep(api.breaker.retry_in + 0.01)
+    backend.scooters_status = 200
+    assert await api.get_scooters() == []
+    assert api.breaker.state == BREAKER_CLOSED
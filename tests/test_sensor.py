@@ -0,0 +1,42 @@
+"""Tests of the Sunshine Scooter sensors."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.sunshine.coordinator import SunshineDataUpdateCoordinator
+from custom_components.sunshine.sensor import METRIC_SENSOR_TYPES, SunshineMetricSensor
+
+from conftest import FleetAPI
+
+
+async def test_metric_sensor_writes_after_unchanged_poll(
+    hass: HomeAssistant, coordinator: SunshineDataUpdateCoordinator, fleet_api: FleetAPI
+) -> None:
+    """Metric sensors write state after polls that do not reach coordinator listeners."""
+    description = next(d for d in METRIC_SENSOR_TYPES if d.key == "poll_fetch_time")
+    sensor = SunshineMetricSensor(coordinator, description)
+    sensor.hass = hass
+    sensor.entity_id = "sensor.sunshine_poll_fetch_time"
+
+    with (
+        patch.object(sensor, "async_write_ha_state") as write,
+        patch.object(
+            coordinator, "async_update_listeners", wraps=coordinator.async_update_listeners
+        ) as update_listeners,
+    ):
+        await sensor.async_added_to_hass()
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        # Nothing changed, the coordinator skipped its listeners
+        assert update_listeners.call_count == 0
+        assert write.call_count == 1
+
+        fleet_api.scooters["s1"]["speed"] = 20
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert update_listeners.call_count == 1
+        # Written once by the poll listener, not again by the coordinator update
+        assert write.call_count == 2
+    assert fleet_api.polls == 3
@@ -0,0 +1,82 @@
+"""Tests of the Sunshine Scooter services."""
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+
+from custom_components.sunshine.const import DOMAIN
+from custom_components.sunshine.coordinator import SunshineDataUpdateCoordinator
+from custom_components.sunshine.services import async_setup_services
+
+from conftest import FleetAPI
+
+
+@pytest.fixture
+def devices(
+    hass: HomeAssistant, config_entry: MockConfigEntry, coordinator: SunshineDataUpdateCoordinator
+) -> dict[str, str]:
+    """Register the scooter and fleet devices and the services, return device ids."""
+    hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = {"coordinator": coordinator}
+    async_setup_services(hass)
+    device_registry = dr.async_get(hass)
+    identifiers = {"s1": "s1", "s2": "s2", "fleet": f"{config_entry.entry_id}_fleet"}
+    return {
+        name: device_registry.async_get_or_create(
+            config_entry_id=config_entry.entry_id, identifiers={(DOMAIN, identifier)}
+        ).id
+        for name, identifier in identifiers.items()
+    }
+
+
+async def _async_call(hass: HomeAssistant, service: str, data: dict[str, Any]) -> dict[str, Any]:
+    """Call a service and return its response."""
+    return await hass.services.async_call(
+        DOMAIN, service, data, blocking=True, return_response=True
+    )
+
+
+async def test_bulk_command_response(
+    hass: HomeAssistant, devices: dict[str, str], fleet_api: FleetAPI
+) -> None:
+    """A command sent to the fleet device reports a result per scooter."""
+    unlock = fleet_api.unlock
+
+    async def _unlock(scooter_id: str) -> dict[str, Any]:
+        if scooter_id == "s2":
+            raise RuntimeError("refused")
+        return await unlock(scooter_id)
+
+    fleet_api.unlock = _unlock
+    response = await _async_call(hass, "unlock", {"device_id": devices["fleet"]})
+    assert response == {
+        "results": {
+            "s1": {"success": True},
+            "s2": {"success": False, "error": "refused"},
+        }
+    }
+    assert fleet_api.commands == [("s1", "unlock")]
+
+
+async def test_command_targets_selected_scooters(
+    hass: HomeAssistant, devices: dict[str, str], fleet_api: FleetAPI
+) -> None:
+    """Only targeted scooters get the command, each once, with the call's arguments."""
+    response = await _async_call(
+        hass,
+        "trigger_alarm",
+        {"device_id": [devices["s2"], devices["s2"]], "duration": "5s", "max_concurrency": 1},
+    )
+    assert response == {"results": {"s2": {"success": True}}}
+    assert fleet_api.commands == [("s2", "trigger_alarm")]
+
+
+async def test_command_without_scooters(hass: HomeAssistant, devices: dict[str, str]) -> None:
+    """A call targeting no scooter fails instead of doing nothing."""
+    with pytest.raises(HomeAssistantError, match="No Sunshine scooters"):
+        await _async_call(hass, "lock", {"entity_id": "sensor.unrelated"})
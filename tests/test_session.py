@@ -0,0 +1,33 @@
+"""Tests of the Sunshine Scooter dedicated session."""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.sunshine.session import (
+    DATA_SESSIONS,
+    SunshineSession,
+    async_acquire_session,
+    async_release_session,
+)
+
+
+async def test_session_shared_per_backend(hass: HomeAssistant) -> None:
+    """Entries of one backend share a session, closed when the last releases it."""
+    with patch.object(SunshineSession, "async_warm_up", AsyncMock()):
+        first = async_acquire_session(hass, "https://a.invalid")
+        assert async_acquire_session(hass, "https://a.invalid") is first
+        other = async_acquire_session(hass, "https://b.invalid")
+        await hass.async_block_till_done()
+    assert other is not first
+
+    await async_release_session(hass, "https://a.invalid")
+    assert not first.session.closed
+    await async_release_session(hass, "https://a.invalid")
+    assert first.session.closed
+    assert hass.data[DATA_SESSIONS] == {"https://b.invalid": other}
+
+    await async_release_session(hass, "https://b.invalid")
+    assert other.session.closed
+    assert DATA_SESSIONS not in hass.data
@@ -0,0 +1,104 @@
+"""Tests of the Sunshine Scooter telemetry stream against a local server."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import aiohttp
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.sunshine import coordinator as coordinator_module
+from custom_components.sunshine.api import SunshineAPI, SunshineStreamUnavailable
+from custom_components.sunshine.const import DOMAIN
+from custom_components.sunshine.coordinator import SunshineDataUpdateCoordinator
+
+from conftest import Backend
+
+
+async def test_stream_events(api: SunshineAPI, backend: Backend) -> None:
+    """Events are parsed across lines and chunks, everything else is skipped."""
+    backend.streams = [
+        [
+            ": keepalive\n\n",
+            'event: update\ndata: {"id": "s1",\ndata:  "speed": 12}\n\n',
+            ": keepalive\n",
+            "\n",
+            "data: not json\n\n",
+            "data: [1, 2]\n\n",
+            'data: {"speed": 3}\n\n',
+            'id: 7\r\ndata: {"id": "s2", "state": "locked"}\r\n\r\n',
+            'data: {"id": ',
+            '"s3"}\n',
+            "\n",
+        ]
+    ]
+    updates = [update async for update in api.stream_scooters()]
+    assert updates == [
+        {"id": "s1", "speed": 12},
+        {"id": "s2", "state": "locked"},
+        {"id": "s3"},
+    ]
+
+
+@pytest.mark.parametrize("status", [404, 405, 501])
+async def test_stream_unavailable(api: SunshineAPI, backend: Backend, status: int) -> None:
+    """A server without a stream endpoint has no stream."""
+    backend.streams = [status]
+    with pytest.raises(SunshineStreamUnavailable):
+        async for _ in api.stream_scooters():
+            pass
+
+
+async def test_stream_not_event_stream(api: SunshineAPI, backend: Backend) -> None:
+    """A server answering the stream endpoint with something else has no stream."""
+    backend.content_type = "application/json"
+    backend.streams = [["[]"]]
+    with pytest.raises(SunshineStreamUnavailable):
+        async for _ in api.stream_scooters():
+            pass
+
+
+async def test_stream_error(api: SunshineAPI, backend: Backend) -> None:
+    """Server errors are raised as such, the stream may come back."""
+    backend.streams = [503]
+    with pytest.raises(aiohttp.ClientResponseError):
+        async for _ in api.stream_scooters():
+            pass
+
+
+# The merged stream updates leave the throttled snapshot write scheduled
+@pytest.mark.parametrize("expected_lingering_timers", [True])
+async def test_stream_reconnects(
+    hass: HomeAssistant, api: SunshineAPI, backend: Backend, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The stream reconnects after drops and errors until the server has none."""
+    monkeypatch.setattr(coordinator_module, "STREAM_BACKOFF_MIN", 0.0)
+    entry = MockConfigEntry(domain=DOMAIN, data={"token": "token"})
+    entry.add_to_hass(hass)
+    coordinator = SunshineDataUpdateCoordinator(hass, entry, api)
+    coordinator.data = {
+        "s1": {"id": "s1", "speed": 0, "state": "parked"},
+        "s2": {"id": "s2", "speed": 0, "state": "parked"},
+    }
+    refresh = AsyncMock()
+    monkeypatch.setattr(coordinator, "async_request_refresh", refresh)
+
+    backend.streams = [
+        ['data: {"id": "s1", "speed": 5}\n\n'],
+        503,
+        ['data: {"id": "s2", "state": "locked"}\n\n', 'data: {"id": "s1", "speed": 7}\n\n'],
+        404,
+    ]
+    await asyncio.wait_for(coordinator._async_stream_loop(), 5)
+
+    assert backend.connections == 4
+    assert coordinator.data == {
+        "s1": {"id": "s1", "speed": 7, "state": "parked"},
+        "s2": {"id": "s2", "speed": 0, "state": "locked"},
+    }
+    # Once after each stream that delivered events dropped
+    assert refresh.await_count == 2
+    assert not coordinator.streaming
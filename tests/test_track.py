@@ -0,0 +1,113 @@
+"""Tests of the Sunshine Scooter GPS track simplification."""
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from custom_components.sunshine.track import (
+    EARTH_RADIUS,
+    extract_points,
+    process_track,
+    simplify,
+    track_length,
+)
+
+# About 1.1 m of latitude
+STEP = 1e-5
+
+
+def test_extract_points() -> None:
+    """Dict and pair points are read, malformed ones skipped."""
+    trip = {
+        "points": [
+            {"lat": 52.5, "lng": 13.4},
+            {"latitude": "52.6", "longitude": "13.5"},
+            [52.7, 13.6],
+            {"lat": None, "lng": 13.7},
+            [52.8],
+            "garbage",
+        ]
+    }
+    assert extract_points(trip) == [(52.5, 13.4), (52.6, 13.5), (52.7, 13.6)]
+    assert extract_points({}) == []
+
+
+def test_track_length() -> None:
+    """One degree of latitude is a 180th of half the earth's circumference."""
+    assert track_length([(0.0, 0.0), (1.0, 0.0)]) == pytest.approx(EARTH_RADIUS * math.pi / 180)
+    assert track_length([(0.0, 0.0)]) == 0.0
+
+
+def test_simplify_keeps_short_tracks() -> None:
+    """Tracks of fewer than three points are returned unchanged."""
+    points = [(52.5, 13.4), (52.6, 13.5)]
+    assert simplify(points, 5.0) == points
+    assert simplify([], 5.0) == []
+
+
+def test_simplify_straight_line() -> None:
+    """Points on a straight line collapse to its ends."""
+    points = [(52.5 + i * STEP, 13.4) for i in range(100)]
+    assert simplify(points, 1.0) == [points[0], points[-1]]
+
+
+def test_simplify_keeps_deviations() -> None:
+    """A corner beyond the tolerance is kept, jitter within it is dropped."""
+    leg = [(52.5 + i * STEP * 10, 13.4) for i in range(10)]
+    # Jitter of about 0.7 m off the first leg
+    leg[3] = (leg[3][0], 13.4 + STEP)
+    corner = leg[-1]
+    back = [(corner[0], 13.4 + i * STEP * 10) for i in range(1, 10)]
+    points = leg + back
+
+    assert simplify(points, 2.0) == [points[0], corner, points[-1]]
+    assert len(simplify(points, 0.1)) > 3
+
+
+def test_simplify_long_trace() -> None:
+    """Traces too long for a recursive implementation are simplified."""
+    points = [(52.5 + i * STEP, 13.4 + (i % 2) * STEP * 10) for i in range(2000)]
+    assert simplify(points, 0.5) == points
+
+
+def test_process_track() -> None:
+    """The reported distance is preferred over the length of the trace."""
+    trip = {
+        "distance_m": 1234,
+        "duration": 300,
+        "track": [[52.5 + i * STEP, 13.4] for i in range(50)],
+    }
+    track = process_track(trip, 5.0)
+    assert track == {
+        "distance": 1234.0,
+        "duration": 300,
+        "original_points": 50,
+        "points": [[52.5, 13.4], [52.5 + 49 * STEP, 13.4]],
+    }
+
+    del trip["distance_m"]
+    assert process_track(trip, 5.0)["distance"] == pytest.approx(49 * STEP * 111195, abs=0.1)
+
+
+@pytest.mark.parametrize("tolerance", [0.1, 1.0, 5.0])
+def test_simplify_arc_size(tolerance: float) -> None:
+    """An arc keeps about as many points as chords within the tolerance are needed."""
+    radius = 100.0
+    lat0 = 52.5
+    meters_per_degree = EARTH_RADIUS * math.pi / 180
+    points = [
+        (
+            lat0 + radius * math.sin(math.pi * i / 1000) / meters_per_degree,
+            13.4 + radius * math.cos(math.pi * i / 1000)
+            / (meters_per_degree * math.cos(math.radians(lat0))),
+        )
+        for i in range(1001)
+    ]
+    # A chord strays from the arc by its sagitta, length² / (8 * radius)
+    chords = math.ceil(math.pi * radius / math.sqrt(8 * radius * tolerance))
+
+    simplified = simplify(points, tolerance)
+    assert chords <= len(simplified) - 1 <= 2 * chords
+    assert set(simplified) <= set(points)
+    assert simplified[0] == points[0] and simplified[-1] == points[-1]
@@ -0,0 +1,74 @@
+"""Tests of the Sunshine Scooter rolling trip statistics."""
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.sunshine.trip_stats import (
+    PERIOD_DAY,
+    PERIOD_MONTH,
+    PERIOD_WEEK,
+    TripStatistics,
+    period_start,
+)
+from custom_components.sunshine.trips import TripStore
+
+# Midday on Sunday 2026-10-18 in New York, 16:00 UTC
+NOW = "2026-10-18T12:00:00-04:00"
+# A minute either side of local midnight, both on 2026-10-18 in UTC
+BEFORE_MIDNIGHT = {"id": 1, "started_at": "2026-10-18T03:59:00Z", "distance": 1000, "duration": 300}
+AFTER_MIDNIGHT = {"id": 2, "started_at": "2026-10-18T04:01:00Z", "distance": 2000, "duration": 600}
+
+
+@pytest.fixture(autouse=True)
+async def new_york(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    """Run in a time zone behind UTC at a fixed time."""
+    await hass.config.async_set_time_zone("America/New_York")
+    freezer.move_to(NOW)
+
+
+def test_day_boundary_is_local() -> None:
+    """Trips count towards the local day they started on, not the UTC one."""
+    stats = TripStatistics()
+    assert stats.add_trip("s1", BEFORE_MIDNIGHT)
+    assert stats.add_trip("s1", AFTER_MIDNIGHT)
+
+    today = stats.totals("s1", PERIOD_DAY)
+    assert today.start == datetime.fromisoformat("2026-10-18T00:00:00-04:00")
+    assert (today.count, today.distance, today.duration) == (1, 2000, 600)
+    # Both fall into the week starting on Monday the 12th
+    week = stats.totals("s1", PERIOD_WEEK)
+    assert (week.count, week.distance) == (2, 3000)
+
+
+def test_day_rolls_over_at_local_midnight(freezer: FrozenDateTimeFactory) -> None:
+    """Totals start over at local midnight, which is not UTC midnight."""
+    stats = TripStatistics()
+    stats.add_trip("s1", AFTER_MIDNIGHT)
+
+    freezer.move_to("2026-10-18T23:59:00-04:00")
+    assert stats.totals("s1", PERIOD_DAY).count == 1
+    freezer.move_to("2026-10-19T00:00:30-04:00")
+    assert stats.totals("s1", PERIOD_DAY).count == 0
+    assert stats.totals("s1", PERIOD_MONTH).count == 1
+
+
+def test_stored_trips_seed_local_day(tmp_path: Path) -> None:
+    """Seeding from the store with a local day start skips the trip before midnight."""
+    store = TripStore(str(tmp_path / "trips.db"))
+    store.write_trips("s1", [BEFORE_MIDNIGHT, AFTER_MIDNIGHT])
+
+    trips = store.trips_since("s1", period_start(PERIOD_DAY, dt_util.now()))
+    store.close()
+
+    assert [trip["started_at"] for trip in trips] == ["2026-10-18T04:01:00+00:00"]
+    stats = TripStatistics()
+    for trip in trips:
+        stats.add_trip("s1", trip)
+    assert stats.totals("s1", PERIOD_DAY).count == 1
@@ -0,0 +1,70 @@
+"""Tests of the Sunshine Scooter trip store."""
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from custom_components.sunshine.trips import TripStore, adopt_legacy_db
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> TripStore:
+    """Return an empty trip store."""
+    store = TripStore(str(tmp_path / "trips.db"))
+    yield store
+    store.close()
+
+
+def test_write_and_query_trips(store: TripStore) -> None:
+    """Trips are stored per scooter in UTC and queried by start time."""
+    new = store.write_trips(
+        "s1",
+        [
+            {"id": 1, "started_at": "2026-10-18T08:10:00Z", "distance": 1000, "duration": 300},
+            {"id": 2, "start_time": "2026-10-18T11:20:00+02:00", "distance_m": 2000, "duration_s": 600},
+        ],
+    )
+    assert [trip["id"] for trip in new] == [1, 2]
+    store.write_trips("s2", [{"id": 1, "started_at": "2026-10-18T10:00:00Z", "distance": 50}])
+
+    # Rewriting a known trip updates it and does not report it as new
+    new = store.write_trips(
+        "s1",
+        [
+            {"id": 2, "started_at": "2026-10-18T09:20:00Z", "distance": 2500, "duration": 600},
+            {"id": 3, "started_at": "2026-10-18T12:00:00Z", "distance": 300, "duration": 60},
+        ],
+    )
+    assert [trip["id"] for trip in new] == [3]
+
+    assert store.trips_since("s1", datetime.fromisoformat("2026-10-18T09:00:00+00:00")) == [
+        {"started_at": "2026-10-18T09:20:00+00:00", "distance": 2500, "duration": 600},
+        {"started_at": "2026-10-18T12:00:00+00:00", "distance": 300, "duration": 60},
+    ]
+    assert store.first_trip_start("s1") == "2026-10-18T08:10:00+00:00"
+    assert store.hourly_totals(
+        "s1",
+        datetime.fromisoformat("2026-10-18T08:00:00+00:00"),
+        datetime.fromisoformat("2026-10-18T12:00:00+00:00"),
+    ) == [("2026-10-18 08:00:00", 1000, 0, 1), ("2026-10-18 09:00:00", 2500, 0, 1)]
+
+    assert store.last_trip_id("s1") is None
+    store.set_last_trip_id("s1", 3)
+    assert store.last_trip_id("s1") == 3
+
+
+def test_adopt_legacy_db(tmp_path: Path) -> None:
+    """The shared database moves to an entry once, never over an existing one."""
+    legacy = tmp_path / "sunshine_trips.db"
+    path = tmp_path / "sunshine_trips_entry.db"
+    legacy.write_text("legacy")
+
+    adopt_legacy_db(str(legacy), str(path))
+    assert not legacy.exists()
+    assert path.read_text() == "legacy"
+
+    legacy.write_text("other")
+    adopt_legacy_db(str(legacy), str(path))
+    assert path.read_text() == "legacy"